@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.http import HttpRequest
+from django.views.decorators.http import condition
+
+# Threads that serve ``gather_reads``. Each one holds its own database
+# connection, so this also caps the connections concurrent reads can open.
+READ_WORKERS = 16
+
+_read_executor = ThreadPoolExecutor(
+    max_workers=READ_WORKERS, thread_name_prefix="async-read"
+)
+
+
+def _isolated(read: Callable[[], object]) -> Callable[[], object]:
+    def run():
+        # These threads never see request_started/request_finished, so apply
+        # CONN_MAX_AGE and the health checks around each read instead.
+        close_old_connections()
+        try:
+            return read()
+        finally:
+            close_old_connections()
+
+    return run
+
+
+async def gather_reads(*reads: Callable[[], object]) -> list:
+    """Run independent blocking reads concurrently and return their results.
+
+    Django's async ORM sends every query of a request to the same
+    thread-sensitive worker, so gathering ``acount()``/``aaggregate()`` calls
+    still runs them one after another. Each read here runs on a pooled thread
+    with its own connection instead. Reads must not rely on the caller's
+    transaction, and anything they return lazily (querysets, related objects)
+    should be evaluated inside the read.
+    """
+
+    return await asyncio.gather(
+        *(
+            sync_to_async(
+                _isolated(read), thread_sensitive=False, executor=_read_executor
+            )()
+            for read in reads
+        )
+    )
+
+
+async def resolve_user(request: HttpRequest):
+    """Load the request's user without blocking and pin it to ``request.user``.
+
+    ``request.user`` and ``request.auser()`` cache separately, so sync code
+    run later for the same request (``condition`` validators, template context
+    processors) would otherwise query the user a second time.
+    """
+
+    user = await request.auser()
+    request.user = user
+    return user
+
+
+def async_condition(etag_func=None, last_modified_func=None):
+    """``condition`` for async views whose validators query the database.
+
+    Django's decorator calls the validators synchronously even around an
+    async view; here they run in a worker thread and their results are handed
+    to ``condition`` so the 304/412 handling and headers stay Django's.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def inner(request: HttpRequest, *args, **kwargs):
+            await resolve_user(request)
+
+            def validators():
+                return (
+                    etag_func(request, *args, **kwargs) if etag_func else None,
+                    (
+                        last_modified_func(request, *args, **kwargs)
+                        if last_modified_func
+                        else None
+                    ),
+                )
+
+            etag, last_modified = await sync_to_async(validators)()
+            conditional = condition(
+                etag_func=etag_func and (lambda *args, **kwargs: etag),
+                last_modified_func=(
+                    last_modified_func and (lambda *args, **kwargs: last_modified)
+                ),
+            )(view)
+            return await conditional(request, *args, **kwargs)
+
+        return inner
+
+    return decorator
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import calendar
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F
+
+from .cache_versions import bump_data_version, data_version
+from .models import Booking, BookingDate, Venue, VenueSlot
+
+MAX_CALENDAR_DAYS = 366
+CALENDAR_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+class BookingConflict(Exception):
+    """Raised when a requested date range overlaps an existing booking."""
+
+    def __init__(self, slot: VenueSlot) -> None:
+        self.slot = slot
+        super().__init__(
+            "This venue is already booked from "
+            f"{slot.start_date:%b %d, %Y} to {slot.end_date:%b %d, %Y}. "
+            "Please choose different dates."
+        )
+
+
+def lock_venue(venue_id: int) -> None:
+    """Serialize bookings for ``venue_id`` until the current transaction ends.
+
+    Must be called inside ``transaction.atomic()`` before any read. SQLite has
+    no row locks, so there we issue a no-op UPDATE instead: it takes the
+    database write lock up front, making racing requests queue behind each
+    other rather than failing to upgrade a read lock.
+    """
+
+    venues = Venue.objects.filter(pk=venue_id)
+    if connection.features.has_select_for_update:
+        list(venues.select_for_update().values_list("pk", flat=True))
+    else:
+        venues.update(price=F("price"))
+
+
+def find_conflicting_slot(
+    venue_id: int,
+    start_date: date,
+    end_date: date,
+    *,
+    exclude_booking_id: int | None = None,
+) -> VenueSlot | None:
+    """Return a slot overlapping ``start_date``–``end_date`` (inclusive).
+
+    Slots written through this module never overlap, so the only candidates
+    are the last slot starting on or before ``end_date`` and the first slot
+    ending on or after ``start_date``. Each is a single seek on the
+    ``(venue, start_date)`` / ``(venue, end_date)`` indexes rather than a scan
+    of the venue's bookings.
+
+    Both seeks can only miss a conflict hidden behind a shorter slot nested
+    inside it, which takes overlapping slots; venues whose older bookings
+    overlap are flagged with ``has_overlapping_slots`` and scanned instead.
+    """
+
+    slots = VenueSlot.objects.filter(venue_id=venue_id)
+    if exclude_booking_id is not None:
+        slots = slots.exclude(booking_id=exclude_booking_id)
+
+    before = slots.filter(start_date__lte=end_date).order_by("-start_date").first()
+    after = slots.filter(end_date__gte=start_date).order_by("end_date").first()
+    for slot in (before, after):
+        if slot and slot.start_date <= end_date and slot.end_date >= start_date:
+            return slot
+    if before is None:
+        return None
+    if not Venue.objects.filter(pk=venue_id, has_overlapping_slots=True).exists():
+        return None
+    return (
+        slots.filter(start_date__lte=end_date, end_date__gte=start_date)
+        .order_by("start_date")
+        .first()
+    )
+
+
+def ensure_available(
+    venue_id: int,
+    start_date: date,
+    end_date: date,
+    *,
+    exclude_booking_id: int | None = None,
+) -> None:
+    conflict = find_conflicting_slot(
+        venue_id, start_date, end_date, exclude_booking_id=exclude_booking_id
+    )
+    if conflict is not None:
+        raise BookingConflict(conflict)
+
+
+def sync_booking_slot(booking: Booking) -> VenueSlot:
+    """Create or refresh the slot that mirrors ``booking``'s venue and dates."""
+
+    slot = VenueSlot.objects.filter(booking=booking).first()
+    if slot is None:
+        slot = VenueSlot(booking=booking)
+    previous_venue_id = slot.venue_id
+
+    slot.venue_id = booking.venue_id
+    slot.start_date = booking.date.start_date
+    slot.end_date = booking.date.end_date
+    slot.save()
+
+    if previous_venue_id and previous_venue_id != slot.venue_id:
+        invalidate_venue_availability(previous_venue_id)
+    return slot
+
+
+def claim_dates(
+    venue_id: int,
+    start_date: date,
+    end_date: date,
+    *,
+    exclude_booking_id: int | None = None,
+) -> None:
+    """Lock ``venue_id`` and make sure the range is still free.
+
+    Call inside the ``transaction.atomic()`` block that writes the booking and
+    its slot, so the check and the write commit together and two requests
+    racing for the same range cannot both succeed. Raises ``BookingConflict``.
+    """
+
+    lock_venue(venue_id)
+    ensure_available(
+        venue_id, start_date, end_date, exclude_booking_id=exclude_booking_id
+    )
+
+
+def create_booking(
+    *, user, venue: Venue, start_date: date, end_date: date, notes: str = ""
+) -> Booking:
+    """Book ``venue`` for ``user``, raising ``BookingConflict`` if it is taken."""
+
+    with transaction.atomic():
+        claim_dates(venue.id, start_date, end_date)
+        booking_date = BookingDate.objects.create(
+            start_date=start_date,
+            end_date=end_date,
+        )
+        booking = Booking.objects.create(
+            user=user,
+            venue=venue,
+            date=booking_date,
+            notes=notes,
+        )
+        sync_booking_slot(booking)
+    return booking
+
+
+def _availability_scope(venue_id: int) -> str:
+    return f"venue-availability:{venue_id}"
+
+
+def invalidate_venue_availability(venue_id: int) -> None:
+    """Drop the cached calendar months for ``venue_id``."""
+
+    bump_data_version(_availability_scope(venue_id))
+
+
+def _iter_months(start_date: date, end_date: date):
+    month = start_date.replace(day=1)
+    while month <= end_date:
+        yield month
+        month = (month + timedelta(days=32)).replace(day=1)
+
+
+def _month_end(month: date) -> date:
+    return month.replace(day=calendar.monthrange(month.year, month.month)[1])
+
+
+def occupancy_bitmap(venue_id: int, start_date: date, end_date: date) -> str:
+    """Return one ``"0"``/``"1"`` character per day from start to end.
+
+    Bitmaps are cached per venue and calendar month under the venue's
+    availability version, so only months missing from the cache are loaded,
+    with a single range query over the venue's slots.
+    """
+
+    version = data_version(_availability_scope(venue_id))
+    months = list(_iter_months(start_date, end_date))
+    keys = {
+        month: f"venue-availability:{venue_id}:{month:%Y-%m}:{version}"
+        for month in months
+    }
+    bitmaps = cache.get_many(list(keys.values()))
+
+    missing = [month for month in months if keys[month] not in bitmaps]
+    if missing:
+        range_start, range_end = missing[0], _month_end(missing[-1])
+        buffers = {
+            month: bytearray(b"0" * _month_end(month).day) for month in missing
+        }
+        slots = VenueSlot.objects.filter(
+            venue_id=venue_id,
+            start_date__lte=range_end,
+            end_date__gte=range_start,
+        ).values_list("start_date", "end_date")
+        for slot_start, slot_end in slots:
+            for month, buffer in buffers.items():
+                first = max(slot_start, month)
+                last = min(slot_end, _month_end(month))
+                if first <= last:
+                    buffer[first.day - 1 : last.day] = b"1" * (last.day - first.day + 1)
+        computed = {keys[month]: buffer.decode() for month, buffer in buffers.items()}
+        cache.set_many(computed, timeout=CALENDAR_CACHE_TIMEOUT)
+        bitmaps.update(computed)
+
+    bitmap = "".join(bitmaps[keys[month]] for month in months)
+    offset = (start_date - months[0]).days
+    return bitmap[offset : offset + (end_date - start_date).days + 1]
+
+
+def occupied_ranges(start_date: date, bitmap: str) -> list[tuple[date, date]]:
+    """Run-length encode ``bitmap`` into inclusive ``(start, end)`` ranges."""
+
+    ranges: list[tuple[date, date]] = []
+    run_start: int | None = None
+    for index, flag in enumerate(bitmap + "0"):
+        if flag == "1" and run_start is None:
+            run_start = index
+        elif flag != "1" and run_start is not None:
+            ranges.append(
+                (
+                    start_date + timedelta(days=run_start),
+                    start_date + timedelta(days=index - 1),
+                )
+            )
+            run_start = None
+    return ranges
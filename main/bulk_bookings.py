@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from .availability import BookingConflict, invalidate_venue_availability, lock_venue
+from .cache_versions import BOOKING_DATA, USER_BOOKINGS, bump_data_version, user_scope
+from .forms import BatchBookingItemForm
+from .leaderboard import count_new_bookings
+from .models import Booking, BookingDate, Venue, VenueSlot
+from .rollups import record_new_booking_sales
+from .search import booking_search_document, index_bookings
+
+MAX_BATCH_SIZE = 200
+
+
+class BookingBatchError(Exception):
+    """Raised when any entry of a batch is rejected; nothing is written.
+
+    ``item_errors`` maps each rejected entry's position to its messages.
+    """
+
+    def __init__(
+        self, item_errors: dict[int, list[str]], *, conflicts_only: bool
+    ) -> None:
+        self.item_errors = item_errors
+        self.conflicts_only = conflicts_only
+        super().__init__("Some bookings in the batch could not be created.")
+
+
+def _clean_items(items: list, errors: dict[int, list[str]]) -> dict[int, dict]:
+    cleaned: dict[int, dict] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors[index].append("Each booking must be a JSON object.")
+            continue
+        form = BatchBookingItemForm(item)
+        if form.is_valid():
+            cleaned[index] = form.cleaned_data
+        else:
+            errors[index].extend(
+                error for error_list in form.errors.values() for error in error_list
+            )
+    return cleaned
+
+
+def _resolve_users(names: set[str]) -> dict[str, object]:
+    """Map lowercased usernames or emails to users with a single query.
+
+    Mirrors ``BookingForm``: a username match wins over an email match.
+    """
+
+    User = get_user_model()
+    users = User.objects.annotate(
+        username_key=Lower("username"), email_key=Lower("email")
+    ).filter(Q(username_key__in=names) | Q(email_key__in=names))
+    by_username: dict[str, object] = {}
+    by_email: dict[str, object] = {}
+    for user in users:
+        by_username.setdefault(user.username_key, user)
+        by_email.setdefault(user.email_key, user)
+    return {**by_email, **by_username}
+
+
+def _find_conflicts(entries: dict[int, dict]) -> dict[int, str]:
+    """Check every entry against existing slots and earlier entries.
+
+    Existing slots for all venues are loaded in one query bounded by each
+    venue's date span in the batch. Must run after the venues are locked.
+    """
+
+    if not entries:
+        # An empty ``Q()`` below would load every slot in the table.
+        return {}
+
+    by_venue: dict[int, list[int]] = defaultdict(list)
+    for index, entry in entries.items():
+        by_venue[entry["venue"].pk].append(index)
+
+    spans = Q()
+    for venue_id, indexes in by_venue.items():
+        spans |= Q(
+            venue_id=venue_id,
+            start_date__lte=max(entries[index]["end_date"] for index in indexes),
+            end_date__gte=min(entries[index]["start_date"] for index in indexes),
+        )
+    taken: dict[int, list[tuple[date, date, str]]] = defaultdict(list)
+    for slot in VenueSlot.objects.filter(spans):
+        taken[slot.venue_id].append(
+            (slot.start_date, slot.end_date, str(BookingConflict(slot)))
+        )
+
+    conflicts: dict[int, str] = {}
+    for venue_id, indexes in by_venue.items():
+        for index in indexes:
+            start, end = entries[index]["start_date"], entries[index]["end_date"]
+            clash = next(
+                (
+                    message
+                    for taken_start, taken_end, message in taken[venue_id]
+                    if taken_start <= end and taken_end >= start
+                ),
+                None,
+            )
+            if clash is not None:
+                conflicts[index] = clash
+            else:
+                taken[venue_id].append(
+                    (
+                        start,
+                        end,
+                        f"Overlaps the booking at index {index} of this batch.",
+                    )
+                )
+    return conflicts
+
+
+def _insert(entries: list[dict]) -> list[Booking]:
+    today = timezone.localdate()
+    dates = BookingDate.objects.bulk_create(
+        BookingDate(start_date=entry["start_date"], end_date=entry["end_date"])
+        for entry in entries
+    )
+    bookings = []
+    for entry, booking_date in zip(entries, dates):
+        booking = Booking(
+            user=entry["user"],
+            venue=entry["venue"],
+            date=booking_date,
+            start_date=booking_date.start_date,
+            has_been_paid=entry["has_been_paid"],
+            # Same rule as ``Booking.save``, which bulk_create bypasses.
+            date_paid=today if entry["has_been_paid"] else None,
+            notes=entry["notes"],
+        )
+        booking.search_document = booking_search_document(booking)
+        booking._persisted_user_id = booking.user_id
+        bookings.append(booking)
+    Booking.objects.bulk_create(bookings)
+    VenueSlot.objects.bulk_create(
+        VenueSlot(
+            booking=booking,
+            venue_id=booking.venue_id,
+            start_date=booking.date.start_date,
+            end_date=booking.date.end_date,
+        )
+        for booking in bookings
+    )
+    return bookings
+
+
+def create_booking_batch(items: list) -> list[Booking]:
+    """Validate and insert ``items`` as bookings, all or nothing.
+
+    Each item carries ``username``, ``venue``, ``start_date``, ``end_date``
+    and optionally ``has_been_paid`` and ``notes``. Users and venues are
+    resolved with one query each and the rows are written with
+    ``bulk_create``, so the work the model signals do per booking (search
+    index, rollups, leaderboard counts, cache versions) is applied here in
+    bulk. Needs a backend that returns primary keys from bulk inserts.
+    Raises ``BookingBatchError`` listing every rejected entry.
+    """
+
+    errors: dict[int, list[str]] = defaultdict(list)
+    cleaned = _clean_items(items, errors)
+
+    users = _resolve_users(
+        {data["username"].strip().lower() for data in cleaned.values()}
+    )
+    venues = Venue.objects.in_bulk({data["venue"] for data in cleaned.values()})
+    entries: dict[int, dict] = {}
+    for index, data in cleaned.items():
+        user = users.get(data["username"].strip().lower())
+        venue = venues.get(data["venue"])
+        if user is None:
+            errors[index].append(
+                "The specified username does not exist. Please select an existing user."
+            )
+        if venue is None:
+            errors[index].append("Select a valid venue.")
+        if user is not None and venue is not None:
+            entries[index] = {**data, "user": user, "venue": venue}
+
+    if errors:
+        # The batch is rejected either way, so skip the venue locks and the
+        # slot scan; conflicts are reported once the entries are valid.
+        raise BookingBatchError(dict(sorted(errors.items())), conflicts_only=False)
+
+    with transaction.atomic():
+        for venue_id in sorted({entry["venue"].pk for entry in entries.values()}):
+            lock_venue(venue_id)
+        conflicts = _find_conflicts(entries)
+        if conflicts:
+            raise BookingBatchError(
+                {index: [message] for index, message in sorted(conflicts.items())},
+                conflicts_only=True,
+            )
+
+        bookings = _insert([entries[index] for index in sorted(entries)])
+        record_new_booking_sales(bookings)
+        count_new_bookings(bookings)
+        index_bookings(bookings)
+        for venue_id in {booking.venue_id for booking in bookings}:
+            invalidate_venue_availability(venue_id)
+        bump_data_version(BOOKING_DATA)
+        for user_id in {booking.user_id for booking in bookings}:
+            bump_data_version(user_scope(USER_BOOKINGS, user_id))
+    return bookings
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY_PREFIX = "data-version"
+
+# Bumped whenever a booking, or a venue it reports on, is written.
+BOOKING_DATA = "booking-data"
+# Bumped whenever a comment adds, changes or removes a venue rating.
+VENUE_RATINGS = "venue-ratings"
+# Bumped whenever a venue, its images, or a comment shown on it is written.
+VENUE_CATALOGUE = "venue-catalogue"
+# Bumped whenever a user is added, removed, or has searchable details changed.
+USER_DIRECTORY = "user-directory"
+# Per-user scope (see ``user_scope``), bumped when one of the user's bookings is written.
+USER_BOOKINGS = "user-bookings"
+
+
+def _version_key(scope: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{scope}"
+
+
+def user_scope(scope: str, user_id: int) -> str:
+    """Return the per-user variant of ``scope``."""
+
+    return f"{scope}:{user_id}"
+
+
+def data_version(scope: str) -> int:
+    """Return the current version number for ``scope``.
+
+    Cached payloads embed this number in their keys, so bumping it retires
+    them all at once. Missing counters are seeded from the clock rather than
+    ``1`` so an evicted counter never reuses a number old entries were stored
+    under.
+    """
+
+    key = _version_key(scope)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return int(version)
+
+
+async def adata_versions(*scopes: str) -> list[int]:
+    """Return ``data_version`` for each scope, read off the event loop."""
+
+    return await sync_to_async(lambda: [data_version(scope) for scope in scopes])()
+
+
+def _advance(key: str) -> None:
+    # A fresh clock reading rather than ``incr``: file and database caches
+    # increment with a separate get and set, so two processes bumping at once
+    # could both write the same number and one bump would be lost.
+    cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_data_version(scope: str) -> None:
+    """Invalidate everything cached under ``scope`` once the write commits."""
+
+    transaction.on_commit(partial(_advance, _version_key(scope)))
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+# How long a session keeps reading from the primary after it writes. It
+# should comfortably exceed the replica's usual lag.
+READ_YOUR_WRITES_SECONDS = 10
+PRIMARY_PIN_SESSION_KEY = "_primary_pinned_until"
+# Lifetime of cache entries built from the replica. They may hold data older
+# than the version they are keyed under, so they must expire once the replica
+# has caught up.
+REPLICA_CACHE_TIMEOUT = READ_YOUR_WRITES_SECONDS
+
+_SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+_replica_allowed: ContextVar[bool] = ContextVar("replica_allowed", default=False)
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+class PrimaryReplicaRouter:
+    """Send reads to the replica inside ``replica_reads``; everything else to the primary.
+
+    Reads outside a marked block return the primary explicitly, so objects
+    loaded from the replica do not drag later related lookups along with
+    them.
+    """
+
+    def db_for_read(self, model, **hints):
+        if (
+            _replica_allowed.get()
+            and not _primary_pinned.get()
+            and replica_configured()
+        ):
+            return REPLICA_DB_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is a copy of the primary and gets its schema from it.
+        return db != REPLICA_DB_ALIAS
+
+
+def current_read_alias() -> str:
+    """Return the alias reads made at this point would go to."""
+
+    return PrimaryReplicaRouter().db_for_read(None)
+
+
+def cache_placement(key: str, timeout: int) -> tuple[str, int]:
+    """Return the cache key and timeout for a result built from current reads.
+
+    Results built from the replica are stored apart from the primary's and
+    only for ``REPLICA_CACHE_TIMEOUT``. A session pinned to the primary then
+    never picks up an entry a lagging replica filled under the version its
+    own write just bumped.
+    """
+
+    if current_read_alias() == REPLICA_DB_ALIAS:
+        return f"{key}:{REPLICA_DB_ALIAS}", min(timeout, REPLICA_CACHE_TIMEOUT)
+    return key, timeout
+
+
+@contextmanager
+def replica_reads():
+    """Let queries in this block read from the replica.
+
+    Sessions that wrote recently stay on the primary (see
+    ``ReadYourWritesMiddleware``), and without a ``replica`` alias this is a
+    no-op. Only mark reads that tolerate the replica's lag.
+    """
+
+    token = _replica_allowed.set(True)
+    try:
+        yield
+    finally:
+        _replica_allowed.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Read from the primary in this block, even inside ``replica_reads``.
+
+    For code that reads in order to write, such as seeding, where a lagging
+    replica would make it write duplicates.
+    """
+
+    token = _replica_allowed.set(False)
+    try:
+        yield
+    finally:
+        _replica_allowed.reset(token)
+
+
+def reads_from_replica(view):
+    """Decorate a read-only view, sync or async, to run inside ``replica_reads``."""
+
+    if iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_inner(request, *args, **kwargs):
+            with replica_reads():
+                return await view(request, *args, **kwargs)
+
+        return async_inner
+
+    @wraps(view)
+    def inner(request, *args, **kwargs):
+        with replica_reads():
+            return view(request, *args, **kwargs)
+
+    return inner
+
+
+def _pin_active(pinned_until) -> bool:
+    return bool(pinned_until) and pinned_until > time.time()
+
+
+class ReadYourWritesMiddleware:
+    """Keep a session on the primary for a while after each write it makes.
+
+    Any successful request with an unsafe method counts as a write. The pin
+    lives in the session, so it follows the user across processes.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _wrote(self, request, response) -> bool:
+        return request.method not in _SAFE_METHODS and response.status_code < 400
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        pinned = bool(request.session.session_key) and _pin_active(
+            request.session.get(PRIMARY_PIN_SESSION_KEY)
+        )
+        token = _primary_pinned.set(pinned)
+        try:
+            response = self.get_response(request)
+        finally:
+            _primary_pinned.reset(token)
+        if self._wrote(request, response):
+            request.session[PRIMARY_PIN_SESSION_KEY] = (
+                time.time() + READ_YOUR_WRITES_SECONDS
+            )
+        return response
+
+    async def __acall__(self, request):
+        pinned = bool(request.session.session_key) and _pin_active(
+            await request.session.aget(PRIMARY_PIN_SESSION_KEY)
+        )
+        token = _primary_pinned.set(pinned)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _primary_pinned.reset(token)
+        if self._wrote(request, response):
+            await request.session.aset(
+                PRIMARY_PIN_SESSION_KEY, time.time() + READ_YOUR_WRITES_SECONDS
+            )
+        return response
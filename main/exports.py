@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import csv
+import datetime
+import json
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from asgiref.sync import sync_to_async
+
+from .models import Booking
+from .search import filter_bookings
+
+EXPORT_CHUNK_SIZE = 2000
+# Rows are joined into chunks of about this many characters before being
+# yielded, so a streamed response is not split into millions of tiny writes.
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# (column name, lookup) pairs, in output order.
+EXPORT_COLUMNS = (
+    ("id", "id"),
+    ("username", "user__username"),
+    ("email", "user__email"),
+    ("first_name", "user__first_name"),
+    ("last_name", "user__last_name"),
+    ("venue_id", "venue_id"),
+    ("venue_title", "venue__title"),
+    ("venue_location", "venue__location"),
+    ("venue_price", "venue__price"),
+    ("start_date", "date__start_date"),
+    ("end_date", "date__end_date"),
+    ("has_been_paid", "has_been_paid"),
+    ("date_paid", "date_paid"),
+    ("notes", "notes"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+
+# Spreadsheet apps evaluate cells starting with these characters as formulas.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Echo:
+    """File-like object whose ``write`` hands back what ``csv`` wrote."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def booking_export_queryset(query: str = ""):
+    """Bookings to export, filtered by ``q`` exactly like the admin list."""
+
+    queryset = Booking.objects.all()
+    query = (query or "").strip()
+    if query:
+        queryset = filter_bookings(queryset, query)
+    return queryset.order_by("id")
+
+
+def _plain(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def _csv_cell(value):
+    value = _plain(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def _csv_lines(rows) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+def _ndjson_lines(rows) -> Iterator[str]:
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for row in rows:
+        record = dict(zip(names, (_plain(value) for value in row)))
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def iter_booking_export(
+    export_format: str, query: str = "", *, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield the export as text chunks, reading ``chunk_size`` rows at a time.
+
+    Rows come from a single ``values_list`` query consumed with
+    ``.iterator()``, so memory stays flat however many bookings match.
+    """
+
+    rows = (
+        booking_export_queryset(query)
+        .values_list(*(lookup for _, lookup in EXPORT_COLUMNS))
+        .iterator(chunk_size=chunk_size)
+    )
+    lines = _csv_lines(rows) if export_format == "csv" else _ndjson_lines(rows)
+
+    buffer: list[str] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def aiter_booking_export(
+    export_format: str, query: str = "", *, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[str]:
+    """``iter_booking_export`` for responses served under ASGI.
+
+    Given a sync iterator, Django's ASGI handler collects it whole with
+    ``sync_to_async(list)`` before sending anything. This pulls one chunk at a
+    time instead, on the request's thread-sensitive worker, so the database
+    cursor stays on a single thread and memory stays flat.
+    """
+
+    chunks = iter_booking_export(export_format, query, chunk_size=chunk_size)
+    pull = sync_to_async(partial(next, chunks, None))
+    try:
+        while (chunk := await pull()) is not None:
+            yield chunk
+    finally:
+        # Closes the cursor on the thread that opened it.
+        await sync_to_async(chunks.close)()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from django.db.models import Func, IntegerField, Value
+from django.db.models.functions import Greatest
+
+
+class DaysBetween(Func):
+    """Whole days from the ``start`` date expression to the ``end`` one."""
+
+    template = "(%(expressions)s)"
+    arg_joiner = " - "
+    output_field = IntegerField()
+
+    def __init__(self, start, end, **extra):
+        super().__init__(end, start, **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="CAST(julianday(%(expressions)s) AS INTEGER)",
+            arg_joiner=") - julianday(",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, function="DATEDIFF", arg_joiner=", ", **extra_context
+        )
+
+
+def booking_duration_days():
+    """Days a booking spans, counting both its first and last day."""
+
+    return Greatest(
+        DaysBetween("date__start_date", "date__end_date") + Value(1), Value(1)
+    )
@@ -4,7 +4,14 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-
+from django.db import transaction
+
+from .availability import (
+    BookingConflict,
+    claim_dates,
+    find_conflicting_slot,
+    sync_booking_slot,
+)
 from .models import Booking, BookingDate, Comment, Venue
 
 User = get_user_model()
@@ -125,6 +132,25 @@ class VenueForm(forms.ModelForm):
         return _split_facilities(self.cleaned_data.get("facilities", ""))
 
 
+class VenueImportForm(VenueForm):
+    """``VenueForm`` without the upload, re-bindable to successive rows.
+
+    Building a ModelForm deep-copies all of its fields, which costs more than
+    validating a short row; bulk imports re-bind one instance per row instead.
+    """
+
+    class Meta(VenueForm.Meta):
+        fields = [field for field in VenueForm.Meta.fields if field != "image"]
+
+    def rebind(self, data) -> VenueImportForm:
+        self.data = data
+        self.is_bound = True
+        self.instance = Venue()
+        self._errors = None
+        self._bound_fields_cache.clear()
+        return self
+
+
 class BookingForm(forms.ModelForm):
     username = forms.CharField(
         max_length=150,
@@ -159,6 +185,14 @@ class BookingForm(forms.ModelForm):
         if start and end and end < start:
             raise ValidationError("End date cannot be before the start date.")
 
+        venue = cleaned.get("venue")
+        if venue and start and end:
+            conflict = find_conflicting_slot(
+                venue.pk, start, end, exclude_booking_id=self.instance.pk
+            )
+            if conflict is not None:
+                raise ValidationError(str(BookingConflict(conflict)))
+
         if not User.objects.exists():
             raise ValidationError("Create a user account before adding bookings.")
 
@@ -200,15 +234,43 @@ class BookingForm(forms.ModelForm):
             booking_date = BookingDate(start_date=start, end_date=end)
 
         if commit:
-            booking_date.save()
-            booking.date = booking_date
-            booking.save()
+            with transaction.atomic():
+                claim_dates(
+                    booking.venue_id, start, end, exclude_booking_id=booking.pk
+                )
+                booking_date.save()
+                booking.date = booking_date
+                booking.save()
+                sync_booking_slot(booking)
         else:
             booking.date = booking_date
 
         return booking
 
 
+class BatchBookingItemForm(forms.Form):
+    """Field checks for one entry of a batch booking request.
+
+    Users, venues and date conflicts are resolved for the whole batch at once
+    by ``main.bulk_bookings`` rather than per entry.
+    """
+
+    username = forms.CharField(max_length=150)
+    venue = forms.IntegerField(min_value=1)
+    start_date = forms.DateField(input_formats=["%Y-%m-%d"])
+    end_date = forms.DateField(input_formats=["%Y-%m-%d"])
+    has_been_paid = forms.BooleanField(required=False)
+    notes = forms.CharField(required=False)
+
+    def clean(self) -> dict[str, object]:
+        cleaned = super().clean()
+        start = cleaned.get("start_date")
+        end = cleaned.get("end_date")
+        if start and end and end < start:
+            raise ValidationError("End date cannot be before the start date.")
+        return cleaned
+
+
 class CommentForm(forms.ModelForm):
     rating = forms.ChoiceField(
         choices=[(str(value), str(value)) for value in range(1, 6)],
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Awaitable, Callable, Iterable
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+from django.utils.safestring import SafeString, mark_safe
+
+from .db_routing import cache_placement
+
+FRAGMENT_CACHE_TIMEOUT = 60 * 60
+FRAGMENT_KEY_PREFIX = "fragment"
+CSRF_PLACEHOLDER = "__fragment_csrf_token__"
+
+
+def fragment_key(name: str, *parts: object) -> str:
+    """Build a cache key for fragment ``name`` from its data versions and inputs.
+
+    The parts include raw query strings, so they are hashed to keep the key
+    short and safe for any cache backend.
+    """
+
+    digest = hashlib.sha1(
+        "\x1f".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f"{FRAGMENT_KEY_PREFIX}:{name}:{digest}"
+
+
+def fragment_slot(name: str) -> SafeString:
+    """Return a marker rendered into a cached fragment and filled per request."""
+
+    return mark_safe(f"<!--fragment-slot:{name}-->")
+
+
+async def acached_fragment(
+    request: HttpRequest,
+    key: str,
+    template_name: str,
+    build_context: Callable[[], Awaitable[dict[str, object]]],
+    *,
+    keep: Iterable[str] = (),
+) -> dict[str, object]:
+    """Return the shared render of ``template_name`` stored under ``key``.
+
+    ``build_context`` only runs on a miss, so a hit costs neither queries nor
+    template rendering. The CSRF token is rendered as a placeholder, and the
+    context entries named in ``keep`` are stored beside the HTML for
+    :func:`personalize_fragment` and the page shell to use. Rendering happens
+    in a worker thread, since templates may still touch the database.
+    Renders built from the read replica are kept apart and briefly (see
+    :func:`~main.db_routing.cache_placement`).
+    """
+
+    key, timeout = cache_placement(key, FRAGMENT_CACHE_TIMEOUT)
+    entry = await cache.aget(key)
+    if entry is None:
+        context = await build_context()
+        html = await sync_to_async(render_to_string)(
+            template_name,
+            {**context, "csrf_token": CSRF_PLACEHOLDER},
+            request=request,
+        )
+        entry = {"html": html, **{name: context[name] for name in keep}}
+        await cache.aset(key, entry, timeout)
+    return entry
+
+
+def personalize_fragment(
+    request: HttpRequest, html: str, slots: dict[str, str] | None = None
+) -> SafeString:
+    """Fill the per-request parts of a cached fragment."""
+
+    html = html.replace(CSRF_PLACEHOLDER, get_token(request))
+    for name, value in (slots or {}).items():
+        html = html.replace(fragment_slot(name), value)
+    return mark_safe(html)
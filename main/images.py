@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, connection, transaction
+from PIL import Image, ImageOps
+
+from .cache_versions import VENUE_CATALOGUE, bump_data_version
+from .models import Venue
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_WIDTHS = (320, 640, 960)
+THUMBNAIL_DIRECTORY = "venues/thumbs"
+JPEG_QUALITY = 82
+WEBP_QUALITY = 78
+
+# A single worker keeps resizing off the request path without letting a burst
+# of uploads saturate the CPU the web workers need.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="venue-images")
+
+
+def variants_are_current(venue: Venue) -> bool:
+    variants = venue.image_variants or {}
+    return bool(venue.image) and variants.get("source") == venue.image.name
+
+
+def _save_variant(
+    storage, source_name: str, image: Image.Image, image_format: str, **options
+) -> str:
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, **options)
+    extension = "jpg" if image_format == "JPEG" else image_format.lower()
+    # Content-addressed storage names the file and reuses an identical copy.
+    stem = posixpath.splitext(posixpath.basename(source_name))[0]
+    return storage.save(
+        f"{THUMBNAIL_DIRECTORY}/{stem}.{extension}", ContentFile(buffer.getvalue())
+    )
+
+
+def generate_image_variants(venue_id: int) -> bool:
+    """Write resized fallback and WebP copies of a venue's image.
+
+    Records them on ``Venue.image_variants`` only if the venue still points at
+    the image that was resized. Returns whether variants were stored.
+    """
+
+    venue = (
+        Venue.objects.filter(pk=venue_id).only("id", "image", "image_variants").first()
+    )
+    if venue is None or not venue.image or variants_are_current(venue):
+        return False
+
+    source_name = venue.image.name
+    storage = venue.image.storage
+    with storage.open(source_name, "rb") as handle:
+        with Image.open(handle) as opened:
+            original = ImageOps.exif_transpose(opened)
+            original.load()
+
+    has_alpha = original.mode in ("RGBA", "LA") or "transparency" in original.info
+    fallback_format, fallback_extension = (
+        ("PNG", "png") if has_alpha else ("JPEG", "jpg")
+    )
+    base = original.convert("RGBA" if has_alpha else "RGB")
+
+    widths = [width for width in THUMBNAIL_WIDTHS if width < base.width] or [base.width]
+    variants = []
+    for width in widths:
+        height = max(1, round(base.height * width / base.width))
+        resized = base.resize((width, height), Image.Resampling.LANCZOS)
+        fallback_options = (
+            {"optimize": True}
+            if has_alpha
+            else {"quality": JPEG_QUALITY, "optimize": True, "progressive": True}
+        )
+        variants.append(
+            {
+                "width": width,
+                "format": fallback_extension,
+                "name": _save_variant(
+                    storage,
+                    source_name,
+                    resized,
+                    fallback_format,
+                    **fallback_options,
+                ),
+            }
+        )
+        variants.append(
+            {
+                "width": width,
+                "format": "webp",
+                "name": _save_variant(
+                    storage,
+                    source_name,
+                    resized,
+                    "WEBP",
+                    quality=WEBP_QUALITY,
+                    method=4,
+                ),
+            }
+        )
+
+    updated = Venue.objects.filter(pk=venue_id, image=source_name).update(
+        image_variants={
+            "source": source_name,
+            "width": base.width,
+            "height": base.height,
+            "variants": variants,
+        }
+    )
+    if updated:
+        bump_data_version(VENUE_CATALOGUE)
+    return bool(updated)
+
+
+def _generate_in_background(venue_id: int) -> None:
+    close_old_connections()
+    try:
+        generate_image_variants(venue_id)
+    except Exception:  # pragma: no cover - logged for the operator
+        logger.exception("Could not generate image variants for venue %s", venue_id)
+    finally:
+        connection.close()
+
+
+def schedule_image_variants(venue: Venue) -> None:
+    """Queue variant generation for ``venue`` once the current transaction commits."""
+
+    if not venue.image or variants_are_current(venue):
+        return
+    venue_id = venue.pk
+    transaction.on_commit(lambda: _executor.submit(_generate_in_background, venue_id))
+
+
+def image_sources(venue: Venue) -> dict[str, str]:
+    """``src``/``srcset`` values for ``venue``'s image, smallest files first.
+
+    Falls back to the original upload until variants have been generated.
+    """
+
+    if not venue.image:
+        return {"src": "", "srcset": "", "webp_srcset": "", "thumbnail": ""}
+    if not variants_are_current(venue):
+        url = venue.image.url
+        return {"src": url, "srcset": "", "webp_srcset": "", "thumbnail": url}
+
+    storage = venue.image.storage
+    fallback = []
+    webp = []
+    for variant in venue.image_variants["variants"]:
+        entry = (variant["width"], storage.url(variant["name"]))
+        (webp if variant["format"] == "webp" else fallback).append(entry)
+    fallback.sort()
+    webp.sort()
+    return {
+        "src": fallback[-1][1],
+        "srcset": ", ".join(f"{url} {width}w" for width, url in fallback),
+        "webp_srcset": ", ".join(f"{url} {width}w" for width, url in webp),
+        "thumbnail": fallback[0][1],
+    }
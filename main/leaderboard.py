@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count, F, FloatField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Booking, Venue, VenueRatingSummary
+
+LEADERBOARD_ORDERING = ("-booking_count", "-rating_average", "title")
+
+
+def _adjust_booking_count(venue_id: int, delta: int) -> None:
+    Venue.objects.filter(pk=venue_id).update(booking_count=F("booking_count") + delta)
+
+
+def sync_booking_venue(booking: Booking, *, created: bool) -> None:
+    """Count ``booking`` towards its venue after it has been saved."""
+
+    previous = None if created else booking._persisted_venue_id
+    current = booking.venue_id
+    if previous == current:
+        return
+
+    with transaction.atomic():
+        if previous is not None:
+            _adjust_booking_count(previous, -1)
+        _adjust_booking_count(current, 1)
+    booking._persisted_venue_id = current
+
+
+def count_new_bookings(bookings: Iterable[Booking]) -> None:
+    """Count freshly bulk-inserted bookings towards their venues."""
+
+    counts: Counter[int] = Counter()
+    for booking in bookings:
+        counts[booking.venue_id] += 1
+        booking._persisted_venue_id = booking.venue_id
+
+    with transaction.atomic():
+        for venue_id, count in counts.items():
+            _adjust_booking_count(venue_id, count)
+
+
+def discard_booking_venue(booking: Booking) -> None:
+    """Remove a deleted booking from its venue's count."""
+
+    venue_id = booking._persisted_venue_id or booking.venue_id
+    Venue.objects.filter(pk=venue_id, booking_count__gt=0).update(
+        booking_count=F("booking_count") - 1
+    )
+
+
+def _rating_average_subquery():
+    return Coalesce(
+        Subquery(
+            VenueRatingSummary.objects.filter(
+                venue_id=OuterRef("pk"), rating_count__gt=0
+            )
+            .annotate(
+                average=F("rating_sum") * 1.0 / F("rating_count"),
+            )
+            .values("average")[:1],
+            output_field=FloatField(),
+        ),
+        Value(0.0),
+    )
+
+
+def refresh_rating_averages(venue_ids: Iterable[int] | None = None) -> None:
+    """Copy current average ratings onto the venues' leaderboard columns.
+
+    Refreshes every venue when ``venue_ids`` is ``None``.
+    """
+
+    venues = Venue.objects.all()
+    if venue_ids is not None:
+        venues = venues.filter(pk__in=list(venue_ids))
+    venues.update(rating_average=_rating_average_subquery())
+
+
+def leaderboard_venues(queryset, limit: int):
+    """First ``limit`` venues of ``queryset`` by bookings, then rating, then title.
+
+    Reads ``main_venue_leaderboard_idx`` in order, so the cost tracks
+    ``limit`` rather than the number of venues or bookings.
+    """
+
+    return queryset.order_by(*LEADERBOARD_ORDERING)[:limit]
+
+
+def rebuild_leaderboard() -> int:
+    """Recount bookings and re-copy ratings for every venue. Returns venues updated."""
+
+    booking_counts = (
+        Booking.objects.filter(venue_id=OuterRef("pk"))
+        .order_by()
+        .values("venue_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Venue.objects.update(
+        booking_count=Coalesce(Subquery(booking_counts), 0),
+        rating_average=_rating_average_subquery(),
+    )
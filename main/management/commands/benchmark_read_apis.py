@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+
+from ...models import Venue
+
+MODES = ("wsgi", "asgi")
+
+
+def _default_paths() -> list[str]:
+    paths = [
+        reverse("main:venues_list_api"),
+        reverse("main:bookings_list_api"),
+        f"{reverse('main:users_search_api')}?q=a",
+        reverse("main:venues_page"),
+    ]
+    venue_id = Venue.objects.order_by("id").values_list("id", flat=True).first()
+    if venue_id is not None:
+        paths.append(reverse("main:venue_detail", args=[venue_id]))
+    return paths
+
+
+def _add_latency(seconds: float):
+    """Delay every query on new connections, like a database across a network."""
+
+    def delayed(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        # Fired on every reconnect of the same per-thread connection object.
+        if delayed not in connection.execute_wrappers:
+            connection.execute_wrappers.append(delayed)
+
+    connections.close_all()
+    connection_created.connect(install, weak=False)
+    return install
+
+
+def _summary(mode: str, elapsed: float, results: list[tuple[int, float]]) -> dict:
+    latencies = sorted(latency for _, latency in results)
+    return {
+        "mode": mode,
+        "requests": len(results),
+        "seconds": elapsed,
+        "throughput": len(results) / elapsed if elapsed else 0.0,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": sum(1 for status, _ in results if status >= 400),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure read endpoint throughput under concurrent load through the "
+        "WSGI and ASGI handlers, in process and against the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests sent per mode, spread across the paths.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="WSGI worker threads, and ASGI requests in flight.",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="Path to request (repeatable). Defaults to the read APIs and pages.",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=MODES,
+            action="append",
+            dest="modes",
+            help="Only run this handler (repeatable).",
+        )
+        parser.add_argument(
+            "--query-latency",
+            type=float,
+            default=0.0,
+            help=(
+                "Milliseconds added to every query, to mimic a database server "
+                "instead of a local SQLite file."
+            ),
+        )
+        parser.add_argument(
+            "--username",
+            help="User to request as. Defaults to the first superuser.",
+        )
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host header sent with each request.",
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be at least 1.")
+
+        user = self._user(options["username"])
+        paths = options["paths"] or _default_paths()
+        session = self._session(user)
+        cookie = f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+        requests = [paths[index % len(paths)] for index in range(options["requests"])]
+        runners = {"wsgi": self._run_wsgi, "asgi": self._run_asgi}
+
+        latency = options["query_latency"]
+        installed = _add_latency(latency / 1000) if latency > 0 else None
+        summaries = []
+        try:
+            for mode in options["modes"] or MODES:
+                run = runners[mode]
+                # One untimed pass fills caches and connections for both modes alike.
+                run(paths, options["concurrency"], cookie, options["host"])
+                started = time.perf_counter()
+                results = run(requests, options["concurrency"], cookie, options["host"])
+                summaries.append(_summary(mode, time.perf_counter() - started, results))
+        finally:
+            if installed is not None:
+                connection_created.disconnect(installed)
+            session.delete()
+
+        self.stdout.write(
+            f"{len(requests)} requests over {len(paths)} paths, "
+            f"concurrency {options['concurrency']}, query latency {latency:g} ms, "
+            f"as {user.get_username()}."
+        )
+        self.stdout.write(
+            f"{'mode':<6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}"
+        )
+        for summary in summaries:
+            self.stdout.write(
+                f"{summary['mode']:<6}{summary['throughput']:>10.1f}"
+                f"{summary['p50']:>10.1f}{summary['p95']:>10.1f}"
+                f"{summary['errors']:>8}"
+            )
+        if len(summaries) == 2 and summaries[0]["throughput"]:
+            ratio = summaries[1]["throughput"] / summaries[0]["throughput"]
+            self.stdout.write(self.style.SUCCESS(f"ASGI/WSGI throughput: {ratio:.2f}x"))
+
+    def _user(self, username: str | None):
+        User = get_user_model()
+        if username:
+            user = User.objects.filter(**{User.USERNAME_FIELD: username}).first()
+        else:
+            user = User.objects.filter(is_superuser=True).order_by("pk").first()
+        if user is None:
+            raise CommandError(
+                "No such user."
+                if username
+                else "Create a superuser or pass --username."
+            )
+        return user
+
+    def _session(self, user):
+        store = import_module(settings.SESSION_ENGINE).SessionStore()
+        store[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        store[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        store.create()
+        return store
+
+    def _run_wsgi(self, paths, concurrency, cookie, host):
+        application = get_wsgi_application()
+
+        def fetch(path):
+            url = urlsplit(path)
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "SCRIPT_NAME": "",
+                "PATH_INFO": url.path,
+                "QUERY_STRING": url.query,
+                "SERVER_NAME": host,
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": host,
+                "HTTP_COOKIE": cookie,
+                "wsgi.version": (1, 0),
+                "wsgi.url_scheme": "http",
+                "wsgi.input": io.BytesIO(),
+                "wsgi.errors": sys.stderr,
+                "wsgi.multithread": True,
+                "wsgi.multiprocess": False,
+                "wsgi.run_once": False,
+            }
+            status = []
+            started = time.perf_counter()
+            body = application(environ, lambda line, headers: status.append(line))
+            try:
+                for _ in body:
+                    pass
+            finally:
+                body.close()
+            return int(status[0].split()[0]), time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(fetch, paths))
+
+    def _run_asgi(self, paths, concurrency, cookie, host):
+        application = get_asgi_application()
+
+        async def fetch(path, limit):
+            url = urlsplit(path)
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": url.path,
+                "raw_path": url.path.encode(),
+                "query_string": url.query.encode(),
+                "root_path": "",
+                "headers": [(b"host", host.encode()), (b"cookie", cookie.encode())],
+                "client": ("127.0.0.1", 0),
+                "server": (host, 80),
+            }
+            sent_request = False
+            status = []
+
+            async def receive():
+                nonlocal sent_request
+                if not sent_request:
+                    sent_request = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                # Never disconnect; the handler cancels this wait once it responds.
+                await asyncio.Future()
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    status.append(message["status"])
+
+            async with limit:
+                started = time.perf_counter()
+                await application(scope, receive, send)
+                return status[0], time.perf_counter() - started
+
+        async def run_all():
+            limit = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(fetch(path, limit) for path in paths))
+
+        return asyncio.run(run_all())
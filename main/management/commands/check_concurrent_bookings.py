@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections
+from django.db.models import Sum
+from django.utils import timezone
+
+from ...availability import create_booking
+from ...models import Booking, BookingDate, Venue, VenueSlot
+
+VENUE_COUNT = 3
+
+
+def _book(worker: int, venue_ids: list[int], user_id: int, count: int, workers: int):
+    """Create ``count`` bookings from one process; return (created, errors)."""
+
+    user = get_user_model().objects.get(pk=user_id)
+    venues = list(Venue.objects.filter(pk__in=venue_ids).order_by("pk"))
+    base_date = timezone.localdate() + timedelta(days=1)
+    created = 0
+    errors: list[str] = []
+    for index in range(count):
+        # Workers interleave over the same venues with ranges that never overlap.
+        sequence = index * workers + worker
+        start_date = base_date + timedelta(days=2 * (sequence // len(venues)))
+        try:
+            create_booking(
+                user=user,
+                venue=venues[sequence % len(venues)],
+                start_date=start_date,
+                end_date=start_date + timedelta(days=1),
+                notes=f"worker {worker} #{index}",
+            )
+        except DatabaseError as exc:
+            errors.append(str(exc))
+        else:
+            created += 1
+    connections.close_all()
+    return created, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Create bookings from parallel processes against the configured "
+        "database and check that every write landed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of processes booking at the same time.",
+        )
+        parser.add_argument(
+            "--bookings",
+            type=int,
+            default=50,
+            help="Bookings created by each process.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Leave the check's venues, bookings and user in the database.",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        count = options["bookings"]
+        if workers < 1 or count < 1:
+            raise CommandError("--workers and --bookings must be at least 1.")
+
+        tag = uuid.uuid4().hex[:8]
+        user = get_user_model().objects.create_user(
+            username=f"concurrency.{tag}", email=f"concurrency.{tag}@example.com"
+        )
+        venues = [
+            Venue.objects.create(
+                title=f"Concurrency check {tag} #{number}",
+                type=Venue.VenueType.FUTSAL,
+                description="Created by check_concurrent_bookings.",
+                facilities=[],
+                location="Nowhere",
+                price=1,
+            )
+            for number in range(1, VENUE_COUNT + 1)
+        ]
+        venue_ids = [venue.pk for venue in venues]
+        # Forked workers must open their own connections, not share this one.
+        connections.close_all()
+
+        try:
+            started = time.perf_counter()
+            context = multiprocessing.get_context("fork")
+            with context.Pool(workers) as pool:
+                results = pool.starmap(
+                    _book,
+                    [
+                        (worker, venue_ids, user.pk, count, workers)
+                        for worker in range(workers)
+                    ],
+                )
+            elapsed = time.perf_counter() - started
+            self._report(results, venue_ids, workers * count, elapsed)
+        finally:
+            if not options["keep"]:
+                BookingDate.objects.filter(booking__venue_id__in=venue_ids).delete()
+                Venue.objects.filter(pk__in=venue_ids).delete()
+                user.delete()
+
+    def _report(self, results, venue_ids: list[int], expected: int, elapsed: float):
+        created = sum(created for created, _ in results)
+        errors = [error for _, worker_errors in results for error in worker_errors]
+        for error in sorted(set(errors)):
+            self.stderr.write(f"{errors.count(error)} x {error}")
+
+        stored = Booking.objects.filter(venue_id__in=venue_ids).count()
+        slots = VenueSlot.objects.filter(venue_id__in=venue_ids).count()
+        counted = (
+            Venue.objects.filter(pk__in=venue_ids).aggregate(
+                total=Sum("booking_count")
+            )["total"]
+            or 0
+        )
+        self.stdout.write(
+            f"{expected} bookings attempted in {elapsed:.1f}s: {created} reported "
+            f"created, {len(errors)} failed; {stored} stored, {slots} slots, "
+            f"venue counters at {counted}."
+        )
+        if not (created == stored == slots == counted == expected):
+            raise CommandError("Bookings were lost or miscounted under concurrency.")
+        self.stdout.write(self.style.SUCCESS("No writes were lost."))
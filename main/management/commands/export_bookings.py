@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...exports import EXPORT_FORMATS, iter_booking_export
+
+
+class Command(BaseCommand):
+    help = "Stream bookings with their user, venue and dates as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=tuple(EXPORT_FORMATS),
+            default="csv",
+            help="Output format.",
+        )
+        parser.add_argument(
+            "--query",
+            default="",
+            help="Only export bookings matching this search, like the admin list.",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="File to write, or - for standard output.",
+        )
+
+    def handle(self, *args, **options):
+        chunks = iter_booking_export(options["format"], options["query"])
+        if options["output"] == "-":
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        try:
+            with open(options["output"], "w", newline="", encoding="utf-8") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        except OSError as exc:
+            raise CommandError(
+                f"Cannot write {options['output']}: {exc.strerror}."
+            ) from exc
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}."))
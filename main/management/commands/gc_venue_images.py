@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import posixpath
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...images import generate_image_variants
+from ...models import Venue
+from ...storage import is_content_addressed, venue_image_storage
+
+IMAGE_ROOT = "venues"
+
+
+def _walk(storage, directory: str):
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield posixpath.join(directory, name)
+    for child in directories:
+        yield from _walk(storage, posixpath.join(directory, child))
+
+
+def _batched(iterable, size: int):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete venue image files that no venue references, walking the media "
+        "directory in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of files examined per batch.",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=3600,
+            help=(
+                "Only delete files older than this many seconds, so uploads "
+                "whose venue row is not committed yet survive."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted without deleting anything.",
+        )
+        parser.add_argument(
+            "--adopt-legacy",
+            action="store_true",
+            help=(
+                "First move images saved under their upload names to "
+                "content-addressed names, so duplicate copies become orphans."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        storage = venue_image_storage()
+        if options["adopt_legacy"]:
+            adopted = self._adopt_legacy(storage, dry_run=options["dry_run"])
+            self.stdout.write(f"Adopted {adopted} legacy images.")
+
+        referenced: set[str] = set()
+        venues = Venue.objects.exclude(image="").values_list("image", "image_variants")
+        for image, variants in venues.iterator():
+            referenced.add(image)
+            for variant in (variants or {}).get("variants", []):
+                referenced.add(variant["name"])
+
+        if not storage.exists(IMAGE_ROOT):
+            self.stdout.write(self.style.SUCCESS("No venue images stored."))
+            return
+
+        cutoff = timezone.now() - timedelta(seconds=options["min_age"])
+        examined = deleted = reclaimed = 0
+        for batch in _batched(_walk(storage, IMAGE_ROOT), options["batch_size"]):
+            examined += len(batch)
+            for name in batch:
+                if name in referenced or storage.get_modified_time(name) > cutoff:
+                    continue
+                size = storage.size(name)
+                if not options["dry_run"]:
+                    storage.delete(name)
+                deleted += 1
+                reclaimed += size
+
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {deleted} of {examined} files ({reclaimed} bytes)."
+            )
+        )
+
+    def _adopt_legacy(self, storage, *, dry_run: bool) -> int:
+        adopted = 0
+        venues = Venue.objects.exclude(image="").only("id", "image", "image_variants")
+        for venue in venues.iterator():
+            name = venue.image.name
+            if is_content_addressed(name) or not storage.exists(name):
+                continue
+            adopted += 1
+            if dry_run:
+                continue
+            with storage.open(name, "rb") as handle:
+                hashed_name = storage.save(
+                    posixpath.join(IMAGE_ROOT, posixpath.basename(name)), handle
+                )
+            Venue.objects.filter(pk=venue.pk, image=name).update(
+                image=hashed_name, image_variants={}
+            )
+            generate_image_variants(venue.pk)
+        return adopted
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...images import generate_image_variants, variants_are_current
+from ...models import Venue
+
+
+class Command(BaseCommand):
+    help = "Generate thumbnails and WebP copies for venue images that lack them."
+
+    def handle(self, *args, **options):
+        generated = 0
+        venues = Venue.objects.exclude(image="").only("id", "image", "image_variants")
+        for venue in venues.iterator():
+            if variants_are_current(venue):
+                continue
+            try:
+                if generate_image_variants(venue.pk):
+                    generated += 1
+            except OSError as exc:
+                self.stderr.write(
+                    f"Skipped venue {venue.pk} ({venue.image.name}): {exc}"
+                )
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated variants for {generated} venues.")
+        )
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import csv
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ...cache_versions import VENUE_CATALOGUE, bump_data_version
+from ...forms import VenueImportForm
+from ...models import Venue
+from ...search import index_venues
+
+FORMATS = ("csv", "jsonl")
+
+
+def _read_csv(stream):
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row, None
+
+
+def _read_jsonl(stream):
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_number, None, f"Invalid JSON: {exc.msg}."
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "Expected a JSON object."
+            continue
+        facilities = row.get("facilities")
+        if isinstance(facilities, list):
+            # The form takes facilities as the comma-separated text it shows.
+            row["facilities"] = ", ".join(str(item) for item in facilities)
+        yield line_number, row, None
+
+
+def _describe_errors(form: VenueImportForm) -> str:
+    return "; ".join(
+        message if field == "__all__" else f"{field}: {message}"
+        for field, messages in form.errors.items()
+        for message in messages
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Import venues from a CSV or JSON Lines file, validating every row "
+        "like the venue form and inserting them in chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="File to import, or - to read from standard input.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of venues inserted per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and report every row without inserting anything.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        path = options["path"]
+        file_format = options["format"] or path.rsplit(".", 1)[-1].lower()
+        if file_format == "json":
+            file_format = "jsonl"
+        if file_format not in FORMATS:
+            raise CommandError("Pass --format csv or --format jsonl.")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        if path == "-":
+            imported, rejected = self._import(sys.stdin, file_format, options)
+        else:
+            try:
+                stream = open(path, newline="", encoding="utf-8")
+            except OSError as exc:
+                raise CommandError(f"Cannot read {path}: {exc.strerror}.") from exc
+            with stream:
+                imported, rejected = self._import(stream, file_format, options)
+
+        if imported and not options["dry_run"]:
+            bump_data_version(VENUE_CATALOGUE)
+        verb = "Validated" if options["dry_run"] else "Imported"
+        message = f"{verb} {imported} venues; rejected {rejected} rows."
+        style = self.style.SUCCESS if not rejected else self.style.WARNING
+        self.stdout.write(style(message))
+
+    def _import(self, stream, file_format: str, options) -> tuple[int, int]:
+        rows = _read_csv(stream) if file_format == "csv" else _read_jsonl(stream)
+        chunk_size = options["chunk_size"]
+        dry_run = options["dry_run"]
+        form = VenueImportForm()
+        chunk: list[Venue] = []
+        imported = rejected = 0
+
+        for line_number, row, error in rows:
+            if error is None:
+                if form.rebind(row).is_valid():
+                    venue = form.instance
+                    venue.refresh_derived_fields()
+                    chunk.append(venue)
+                    if len(chunk) >= chunk_size:
+                        imported += self._flush(chunk, dry_run)
+                        chunk = []
+                    continue
+                error = _describe_errors(form)
+            rejected += 1
+            self.stderr.write(f"Line {line_number}: {error}")
+
+        imported += self._flush(chunk, dry_run)
+        return imported, rejected
+
+    def _flush(self, venues: list[Venue], dry_run: bool) -> int:
+        """Insert one chunk.
+
+        ``bulk_create`` skips ``Venue.save`` and the model signals, so the
+        derived columns are filled before this is called and the search index
+        is updated here.
+        """
+
+        if venues and not dry_run:
+            with transaction.atomic():
+                Venue.objects.bulk_create(venues)
+                index_venues(venues)
+            if self.verbosity > 1:
+                self.stdout.write(f"Inserted {len(venues)} venues.")
+        return len(venues)
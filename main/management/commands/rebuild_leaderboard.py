@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...leaderboard import rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Recount venue bookings and ratings for the top-venues leaderboard."
+
+    def handle(self, *args, **options):
+        updated = rebuild_leaderboard()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {updated} venues."))
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...ratings import rebuild_rating_summaries
+
+
+class Command(BaseCommand):
+    help = "Recompute every venue's rating count, sum and histogram from comments."
+
+    def handle(self, *args, **options):
+        written = rebuild_rating_summaries()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt rating summaries for {written} venues.")
+        )
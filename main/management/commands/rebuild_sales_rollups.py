@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...rollups import rebuild_sales_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the daily sales and popularity rollups from paid bookings."
+
+    def handle(self, *args, **options):
+        written = rebuild_sales_rollups()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {written} daily venue sales rows.")
+        )
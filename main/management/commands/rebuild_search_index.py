@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ...search import rebuild_booking_index, rebuild_venue_index, venue_fts_available
+
+
+class Command(BaseCommand):
+    help = "Rebuild the venue and booking search indexes."
+
+    def handle(self, *args, **options):
+        if not venue_fts_available():
+            self.stdout.write(
+                self.style.WARNING(
+                    "Full-text search is not available on this database; "
+                    "only booking search documents will be refreshed."
+                )
+            )
+        venues = rebuild_venue_index()
+        bookings = rebuild_booking_index()
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {venues} venues and {bookings} bookings.")
+        )
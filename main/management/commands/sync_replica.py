@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from ...db_routing import REPLICA_DB_ALIAS, replica_configured
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the primary SQLite database into the replica file, so replica "
+        "routing can be exercised locally. Rerun it to refresh the copy."
+    )
+
+    def handle(self, *args, **options):
+        if not replica_configured():
+            raise CommandError(
+                "No replica database; set TK_REPLICA_DATABASE to the replica's path."
+            )
+        primary = connections[DEFAULT_DB_ALIAS]
+        replica = connections[REPLICA_DB_ALIAS]
+        if primary.vendor != "sqlite" or replica.vendor != "sqlite":
+            raise CommandError(
+                "sync_replica only copies SQLite files; use the database "
+                "server's own replication otherwise."
+            )
+
+        # Open connections to the replica would keep reading the old pages.
+        replica.close()
+        primary.ensure_connection()
+        started = time.perf_counter()
+        # The backup API takes a consistent snapshot even while others write.
+        target = sqlite3.connect(replica.settings_dict["NAME"])
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Copied {primary.settings_dict['NAME']} to "
+                f"{replica.settings_dict['NAME']} in "
+                f"{time.perf_counter() - started:.2f}s."
+            )
+        )
@@ -4,12 +4,11 @@ from django.db import migrations
 
 
 def seed_sample_data(apps, schema_editor) -> None:
-    if schema_editor.connection.alias != "default":
-        return
-
-    from ..sample_data import ensure_sample_data
-
-    ensure_sample_data()
+    # Seeding used to run here through the live models, which fails on a fresh
+    # database because later migrations add tables the seeder depends on. The
+    # fixtures are now loaded lazily by ``ensure_sample_data_seeded`` on the
+    # first page view, or explicitly via ``manage.py seed_sample_data``.
+    return
 
 
 class Migration(migrations.Migration):
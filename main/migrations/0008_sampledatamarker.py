@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0007_comment_commentvenue_comment_venue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SampleDataMarker",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("seeded_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_rating_summaries(apps, schema_editor) -> None:
+    CommentVenue = apps.get_model("main", "CommentVenue")
+    VenueRatingSummary = apps.get_model("main", "VenueRatingSummary")
+
+    histogram_counts = {
+        f"stars_{rating}": models.Count("id", filter=models.Q(comment__rating=rating))
+        for rating in range(1, 6)
+    }
+    rows = (
+        CommentVenue.objects.values("venue_id")
+        .annotate(
+            rating_count=models.Count("id"),
+            rating_sum=models.Sum("comment__rating"),
+            **histogram_counts,
+        )
+        .order_by("venue_id")
+    )
+    VenueRatingSummary.objects.bulk_create(
+        [
+            VenueRatingSummary(
+                venue_id=row["venue_id"],
+                rating_count=row["rating_count"],
+                rating_sum=row["rating_sum"] or 0,
+                **{field: row[field] for field in histogram_counts},
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0008_sampledatamarker"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VenueRatingSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rating_count", models.PositiveIntegerField(default=0)),
+                ("rating_sum", models.PositiveIntegerField(default=0)),
+                ("stars_1", models.PositiveIntegerField(default=0)),
+                ("stars_2", models.PositiveIntegerField(default=0)),
+                ("stars_3", models.PositiveIntegerField(default=0)),
+                ("stars_4", models.PositiveIntegerField(default=0)),
+                ("stars_5", models.PositiveIntegerField(default=0)),
+                (
+                    "venue",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rating_summary",
+                        to="main.venue",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(backfill_rating_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_venue_slots(apps, schema_editor) -> None:
+    Booking = apps.get_model("main", "Booking")
+    VenueSlot = apps.get_model("main", "VenueSlot")
+
+    bookings = Booking.objects.values_list(
+        "id", "venue_id", "date__start_date", "date__end_date"
+    ).order_by("id")
+    VenueSlot.objects.bulk_create(
+        [
+            VenueSlot(
+                booking_id=booking_id,
+                venue_id=venue_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            for booking_id, venue_id, start_date, end_date in bookings.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0009_venueratingsummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VenueSlot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("start_date", models.DateField()),
+                ("end_date", models.DateField()),
+                (
+                    "booking",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="slot",
+                        to="main.booking",
+                    ),
+                ),
+                (
+                    "venue",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="slots",
+                        to="main.venue",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["start_date", "end_date"],
+                "indexes": [
+                    models.Index(
+                        fields=["venue", "start_date"], name="main_slot_venue_start_idx"
+                    ),
+                    models.Index(
+                        fields=["venue", "end_date"], name="main_slot_venue_end_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_venue_slots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_daily_sales(apps, schema_editor) -> None:
+    Booking = apps.get_model("main", "Booking")
+    DailyVenueSales = apps.get_model("main", "DailyVenueSales")
+
+    rows = (
+        Booking.objects.filter(has_been_paid=True, date_paid__isnull=False)
+        .values("date_paid", "venue_id")
+        .annotate(bookings=models.Count("id"), revenue=models.Sum("venue__price"))
+        .order_by("date_paid", "venue_id")
+    )
+    DailyVenueSales.objects.bulk_create(
+        [
+            DailyVenueSales(
+                date=row["date_paid"],
+                venue_id=row["venue_id"],
+                bookings=row["bookings"],
+                revenue=row["revenue"] or 0,
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0010_venueslot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyVenueSales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("bookings", models.PositiveIntegerField(default=0)),
+                ("revenue", models.PositiveBigIntegerField(default=0)),
+                (
+                    "venue",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_sales",
+                        to="main.venue",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date", "venue"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "venue"),
+                        name="main_daily_sales_unique_day_venue",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_daily_sales, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0011_dailyvenuesales"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="main_booking_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(fields=["title", "id"], name="main_venue_title_id_idx"),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+
+def create_venue_fts(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    # Not an external-content table: Django rebuilds SQLite tables on most
+    # ALTERs, so the index keeps its own copy and is synced from signals.
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE main_venue_fts USING fts5("
+            "title, type, location, description, facilities, price, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    except OperationalError:
+        # SQLite built without FTS5: searches fall back to icontains.
+        return
+
+    schema_editor.execute(
+        "INSERT INTO main_venue_fts "
+        "(rowid, title, type, location, description, facilities, price) "
+        "SELECT v.id, v.title, v.type, v.location, v.description, "
+        "(SELECT group_concat(f.value, ' ') FROM json_each(v.facilities) AS f), "
+        "CAST(v.price AS TEXT) FROM main_venue AS v"
+    )
+
+
+def drop_venue_fts(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS main_venue_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0012_list_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_venue_fts, drop_venue_fts),
+    ]
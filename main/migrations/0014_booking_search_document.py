@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:43
+
+from django.db import migrations, models
+from django.db.utils import OperationalError
+
+
+def backfill_search_documents(apps, schema_editor) -> None:
+    Booking = apps.get_model("main", "Booking")
+
+    bookings = []
+    for booking in Booking.objects.select_related("user", "venue", "date").iterator():
+        user = booking.user
+        pieces = []
+        if user is not None:
+            pieces.extend([user.username, user.first_name, user.last_name])
+        pieces.extend(
+            [
+                booking.venue.title,
+                booking.notes,
+                booking.date.start_date.isoformat(),
+                booking.date.end_date.isoformat(),
+                "paid" if booking.has_been_paid else "pending",
+            ]
+        )
+        booking.search_document = " ".join(
+            str(piece).strip() for piece in pieces if piece
+        ).lower()
+        bookings.append(booking)
+    Booking.objects.bulk_update(bookings, ["search_document"], batch_size=500)
+
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE main_booking_fts USING fts5("
+            "document, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    except OperationalError:
+        return
+    schema_editor.execute(
+        "INSERT INTO main_booking_fts (rowid, document) "
+        "SELECT id, search_document FROM main_booking"
+    )
+
+
+def drop_booking_fts(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS main_booking_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0013_venue_fts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(backfill_search_documents, drop_booking_fts),
+    ]
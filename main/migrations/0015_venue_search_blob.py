@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:46
+
+import re
+
+from django.db import migrations, models
+
+
+def backfill_search_blobs(apps, schema_editor) -> None:
+    Venue = apps.get_model("main", "Venue")
+
+    venues = []
+    for venue in Venue.objects.iterator():
+        raw = venue.facilities
+        if isinstance(raw, (list, tuple, set)):
+            items = [str(item) for item in raw]
+        elif raw:
+            items = re.split(r"[,\n]+", str(raw).replace("\r", "\n"))
+        else:
+            items = []
+        venue.facility_list = [text for text in (item.strip() for item in items) if text]
+        pieces = [
+            venue.title,
+            venue.type,
+            venue.location,
+            venue.description,
+            " ".join(venue.facility_list),
+            str(venue.price),
+        ]
+        venue.search_blob = " ".join(
+            str(piece).strip() for piece in pieces if piece
+        ).lower()
+        venues.append(venue)
+    Venue.objects.bulk_update(venues, ["facility_list", "search_blob"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0014_booking_search_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="facility_list",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name="venue",
+            name="search_blob",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(backfill_search_blobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0015_venue_search_blob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bookingdate",
+            index=models.Index(
+                fields=["start_date", "end_date"], name="main_bookingdate_range_idx"
+            ),
+        ),
+    ]
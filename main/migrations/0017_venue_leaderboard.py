@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:50
+
+from django.db import migrations, models
+from django.db.models import Count, F, FloatField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_leaderboard(apps, schema_editor) -> None:
+    Booking = apps.get_model("main", "Booking")
+    Venue = apps.get_model("main", "Venue")
+    VenueRatingSummary = apps.get_model("main", "VenueRatingSummary")
+
+    booking_counts = (
+        Booking.objects.filter(venue_id=OuterRef("pk"))
+        .order_by()
+        .values("venue_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    averages = (
+        VenueRatingSummary.objects.filter(venue_id=OuterRef("pk"), rating_count__gt=0)
+        .annotate(average=F("rating_sum") * 1.0 / F("rating_count"))
+        .values("average")[:1]
+    )
+    Venue.objects.update(
+        booking_count=Coalesce(Subquery(booking_counts), 0),
+        rating_average=Coalesce(
+            Subquery(averages, output_field=FloatField()), Value(0.0)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0016_bookingdate_range_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="booking_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="venue",
+            name="rating_average",
+            field=models.FloatField(default=0.0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(
+                fields=["-booking_count", "-rating_average", "title"],
+                name="main_venue_leaderboard_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_leaderboard, migrations.RunPython.noop),
+    ]
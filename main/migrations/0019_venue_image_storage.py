@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:53
+
+import main.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0018_venue_image_variants"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="venue",
+            name="image",
+            field=models.ImageField(
+                blank=True,
+                storage=main.storage.venue_image_storage,
+                upload_to="venues/",
+            ),
+        ),
+    ]
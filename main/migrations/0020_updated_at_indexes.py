@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0019_venue_image_storage"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["updated_at"], name="main_booking_updated_at_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(fields=["updated_at"], name="main_venue_updated_at_idx"),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:20
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_start_dates(apps, schema_editor) -> None:
+    Booking = apps.get_model("main", "Booking")
+    BookingDate = apps.get_model("main", "BookingDate")
+
+    Booking.objects.update(
+        start_date=Subquery(
+            BookingDate.objects.filter(pk=OuterRef("date_id")).values("start_date")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0020_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="start_date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_start_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="booking",
+            name="start_date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["user", "start_date"], name="main_booking_user_start_idx"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="bookingdate",
+            name="main_bookingdate_range_idx",
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:09
+
+from django.db import migrations, models
+
+
+def flag_overlapping_venues(apps, schema_editor) -> None:
+    Venue = apps.get_model("main", "Venue")
+    VenueSlot = apps.get_model("main", "VenueSlot")
+
+    # Slots backfilled in 0010 copy bookings made before overlap checks
+    # existed, so a venue may hold ranges that overlap or nest.
+    flagged = set()
+    current_venue_id, reach = None, None
+    slots = VenueSlot.objects.order_by("venue_id", "start_date").values_list(
+        "venue_id", "start_date", "end_date"
+    )
+    for venue_id, start_date, end_date in slots.iterator():
+        if venue_id != current_venue_id:
+            current_venue_id, reach = venue_id, end_date
+            continue
+        if start_date <= reach:
+            flagged.add(venue_id)
+        reach = max(reach, end_date)
+    if not flagged:
+        return
+    Venue.objects.filter(pk__in=flagged).update(has_overlapping_slots=True)
+    print(
+        f"\n  {len(flagged)} venue(s) have overlapping bookings; availability "
+        f"checks scan their slots: {', '.join(map(str, sorted(flagged)))}"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0021_booking_start_date"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="has_overlapping_slots",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(flag_overlapping_venues, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import datetime
+import re
+
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from .storage import venue_image_storage
+
+
+def normalize_facilities(raw_facilities) -> list[str]:
+    """Facility names from a list or a comma/newline separated string."""
+
+    if isinstance(raw_facilities, (list, tuple, set)):
+        items = [str(item) for item in raw_facilities]
+    elif raw_facilities:
+        items = re.split(r"[,\n]+", str(raw_facilities).replace("\r", "\n"))
+    else:
+        items = []
+    return [text for text in (item.strip() for item in items) if text]
+
 
 class BookingDate(models.Model):
     start_date = models.DateField()
@@ -34,21 +51,90 @@ class Venue(models.Model):
     facilities = models.JSONField(default=list, blank=True)
     price = models.PositiveIntegerField(validators=[MinValueValidator(0)])
     location = models.CharField(max_length=255)
-    image = models.ImageField(upload_to="venues/", blank=True)
+    image = models.ImageField(
+        upload_to="venues/", storage=venue_image_storage, blank=True
+    )
+    # Resized copies of ``image``, written by ``main.images``.
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     type = models.CharField(
         max_length=20,
         choices=VenueType.choices,
         default=VenueType.TENNIS,
     )
+    # Derived from the fields above on every save; see ``Venue.save``.
+    facility_list = models.JSONField(default=list, blank=True, editable=False)
+    search_blob = models.TextField(blank=True, default="", editable=False)
+    # Leaderboard counters maintained by ``main.leaderboard``.
+    booking_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_average = models.FloatField(default=0.0, editable=False)
+    # Set by migration 0022 when bookings made before slots existed overlap;
+    # ``main.availability.find_conflicting_slot`` then falls back to a scan.
+    has_overlapping_slots = models.BooleanField(default=False, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Written only through queryset updates, never by ``save()``.
+    UPDATE_ONLY_FIELDS = frozenset(
+        {"booking_count", "rating_average", "image_variants", "has_overlapping_slots"}
+    )
+
+    # Title as last persisted; booking search documents quote it.
+    _persisted_title: str | None = None
+
     class Meta:
         ordering = ["title"]
+        indexes = [
+            models.Index(fields=["title", "id"], name="main_venue_title_id_idx"),
+            models.Index(
+                fields=["-booking_count", "-rating_average", "title"],
+                name="main_venue_leaderboard_idx",
+            ),
+            models.Index(fields=["updated_at"], name="main_venue_updated_at_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - human readable only
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._persisted_title = instance.title
+        return instance
+
+    def build_search_blob(self) -> str:
+        pieces = [
+            self.title,
+            self.type,
+            self.location,
+            self.description,
+            " ".join(self.facility_list),
+        ]
+        if self.price is not None:
+            pieces.append(str(self.price))
+        return " ".join(str(piece).strip() for piece in pieces if piece).lower()
+
+    def refresh_derived_fields(self) -> None:
+        """Recompute the columns derived from the editable fields."""
+
+        self.facility_list = normalize_facilities(self.facilities)
+        self.search_blob = self.build_search_blob()
+
+    def save(self, *args, **kwargs) -> None:
+        self.refresh_derived_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "facility_list", "search_blob"}
+        elif not self._state.adding:
+            # These columns only move through queryset UPDATEs; writing back
+            # the values loaded with this instance would undo concurrent ones.
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.UPDATE_ONLY_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
 class Booking(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -60,26 +146,94 @@ class Booking(models.Model):
     has_been_paid = models.BooleanField(default=False)
     date_paid = models.DateField(null=True, blank=True)
     date = models.OneToOneField(BookingDate, related_name="booking", on_delete=models.CASCADE)
+    # Copy of ``date.start_date`` so a user's bookings can be read in date
+    # order straight off the ``(user, start_date)`` index.
+    start_date = models.DateField(editable=False)
     notes = models.TextField(blank=True)
+    search_document = models.TextField(blank=True, default="", editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Rollup bucket and venue as last persisted; see ``main.rollups`` and
+    # ``main.leaderboard``.
+    _sales_rollup_key: tuple[int, datetime.date] | None = None
+    _persisted_venue_id: int | None = None
+    _persisted_user_id: int | None = None
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"], name="main_booking_created_id_idx"
+            ),
+            models.Index(fields=["updated_at"], name="main_booking_updated_at_idx"),
+            models.Index(
+                fields=["user", "start_date"], name="main_booking_user_start_idx"
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - human readable only
         username = self.user.get_username() if self.user else "Unknown user"
         return f"Booking for {username}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._sales_rollup_key = instance.sales_rollup_key
+        instance._persisted_venue_id = instance.venue_id
+        instance._persisted_user_id = instance.user_id
+        return instance
+
+    @property
+    def sales_rollup_key(self) -> tuple[int, datetime.date] | None:
+        """``(venue_id, date_paid)`` bucket this booking counts towards, if paid."""
+
+        if self.has_been_paid and self.date_paid is not None:
+            return (self.venue_id, self.date_paid)
+        return None
+
     def save(self, *args, **kwargs) -> None:
         if self.has_been_paid:
             if self.date_paid is None:
                 self.date_paid = timezone.localdate()
         else:
             self.date_paid = None
+        # Later edits to the date row are copied over by a post_save signal.
+        if Booking.date.is_cached(self):
+            self.start_date = self.date.start_date
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "start_date"}
         super().save(*args, **kwargs)
 
 
+class VenueSlot(models.Model):
+    """Date range a booking occupies at its venue.
+
+    Mirrors ``Booking.venue`` and ``Booking.date`` into one table so overlap
+    checks in ``main.availability`` are single index seeks on venue and date.
+    """
+
+    venue = models.ForeignKey(Venue, related_name="slots", on_delete=models.CASCADE)
+    booking = models.OneToOneField(
+        Booking, related_name="slot", on_delete=models.CASCADE
+    )
+    start_date = models.DateField()
+    end_date = models.DateField()
+
+    class Meta:
+        ordering = ["start_date", "end_date"]
+        indexes = [
+            models.Index(
+                fields=["venue", "start_date"], name="main_slot_venue_start_idx"
+            ),
+            models.Index(fields=["venue", "end_date"], name="main_slot_venue_end_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - human readable only
+        return f"{self.venue} {self.start_date:%Y-%m-%d} → {self.end_date:%Y-%m-%d}"
+
+
 class Comment(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -97,12 +251,21 @@ class Comment(models.Model):
         through="CommentVenue",
     )
 
+    # Rating as last persisted; see ``main.ratings``.
+    _persisted_rating: int | None = None
+
     class Meta:
         ordering = ["-date", "-id"]
 
     def __str__(self) -> str:  # pragma: no cover - human readable only
         return f"Comment by {self.user}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._persisted_rating = instance.rating
+        return instance
+
 
 class CommentVenue(models.Model):
     comment = models.ForeignKey(
@@ -114,3 +277,70 @@ class CommentVenue(models.Model):
 
     class Meta:
         unique_together = ("comment", "venue")
+
+
+class SampleDataMarker(models.Model):
+    """Records that the demo fixtures have been loaded into this database."""
+
+    seeded_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:  # pragma: no cover - human readable only
+        return f"Sample data seeded at {self.seeded_at:%Y-%m-%d %H:%M}"
+
+
+class VenueRatingSummary(models.Model):
+    """Denormalized rating statistics for a venue.
+
+    Kept in step with comment writes by ``main.ratings`` so that listings can
+    read the count, average and 1–5 histogram without aggregating comments.
+    """
+
+    venue = models.OneToOneField(
+        Venue, related_name="rating_summary", on_delete=models.CASCADE
+    )
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover - human readable only
+        return f"Ratings for {self.venue}"
+
+    @property
+    def average_rating(self) -> float | None:
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+
+    @property
+    def histogram(self) -> dict[str, int]:
+        return {str(stars): getattr(self, f"stars_{stars}") for stars in range(1, 6)}
+
+
+class DailyVenueSales(models.Model):
+    """Paid bookings and revenue per venue per payment date.
+
+    Maintained by ``main.rollups`` as bookings are paid, unpaid or deleted so
+    admin analytics can group a few rows per day instead of every booking.
+    """
+
+    date = models.DateField()
+    venue = models.ForeignKey(
+        Venue, related_name="daily_sales", on_delete=models.CASCADE
+    )
+    bookings = models.PositiveIntegerField(default=0)
+    revenue = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        ordering = ["date", "venue"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "venue"], name="main_daily_sales_unique_day_venue"
+            )
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - human readable only
+        return f"{self.venue} sales on {self.date:%Y-%m-%d}"
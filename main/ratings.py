@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+from .cache_versions import VENUE_RATINGS, bump_data_version
+from .leaderboard import refresh_rating_averages
+from .models import CommentVenue, VenueRatingSummary
+
+RATING_VALUES = range(1, 6)
+
+
+def _histogram_field(rating: int) -> str:
+    rating = max(1, min(5, int(rating)))
+    return f"stars_{rating}"
+
+
+def _apply_delta(venue_ids: Iterable[int], rating: int, delta: int) -> None:
+    venue_ids = list(venue_ids)
+    field = _histogram_field(rating)
+    for venue_id in venue_ids:
+        # Removals never create a summary: when a venue is deleted, its
+        # summary may be gone before its comment links are.
+        if delta > 0:
+            VenueRatingSummary.objects.get_or_create(venue_id=venue_id)
+        VenueRatingSummary.objects.filter(venue_id=venue_id).update(
+            rating_count=F("rating_count") + delta,
+            rating_sum=F("rating_sum") + delta * int(rating),
+            **{field: F(field) + delta},
+        )
+    refresh_rating_averages(venue_ids)
+    bump_data_version(VENUE_RATINGS)
+
+
+def record_rating_added(venue_ids: Iterable[int], rating: int) -> None:
+    """Count a new ``rating`` towards each venue in ``venue_ids``."""
+
+    _apply_delta(venue_ids, rating, 1)
+
+
+def record_rating_removed(venue_ids: Iterable[int], rating: int) -> None:
+    """Drop a previously counted ``rating`` from each venue in ``venue_ids``."""
+
+    _apply_delta(venue_ids, rating, -1)
+
+
+def record_rating_changed(
+    venue_ids: Iterable[int], old_rating: int, new_rating: int
+) -> None:
+    """Move a comment's rating from ``old_rating`` to ``new_rating``."""
+
+    if int(old_rating) == int(new_rating):
+        return
+    venue_ids = list(venue_ids)
+    _apply_delta(venue_ids, old_rating, -1)
+    _apply_delta(venue_ids, new_rating, 1)
+
+
+def rating_stats_for_venue(venue_id: int) -> dict[str, object]:
+    summary = VenueRatingSummary.objects.filter(venue_id=venue_id).first()
+    if summary is None:
+        summary = VenueRatingSummary(venue_id=venue_id)
+    return {
+        "average_rating": summary.average_rating,
+        "count": summary.rating_count,
+        "histogram": summary.histogram,
+    }
+
+
+def rebuild_rating_summaries() -> int:
+    """Recompute every venue's rating summary from the comment tables.
+
+    Returns the number of summaries written. Venues without comments are left
+    without a row, which readers treat as zero ratings.
+    """
+
+    histogram_counts = {
+        _histogram_field(rating): Count("id", filter=Q(comment__rating=rating))
+        for rating in RATING_VALUES
+    }
+    rows = (
+        CommentVenue.objects.values("venue_id")
+        .annotate(
+            rating_count=Count("id"),
+            rating_sum=Sum("comment__rating"),
+            **histogram_counts,
+        )
+        .order_by("venue_id")
+    )
+    summaries = [
+        VenueRatingSummary(
+            venue_id=row["venue_id"],
+            rating_count=row["rating_count"],
+            rating_sum=row["rating_sum"] or 0,
+            **{field: row[field] for field in histogram_counts},
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        VenueRatingSummary.objects.all().delete()
+        VenueRatingSummary.objects.bulk_create(summaries, batch_size=500)
+        refresh_rating_averages()
+    bump_data_version(VENUE_RATINGS)
+    return len(summaries)
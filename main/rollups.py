@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from .models import Booking, DailyVenueSales, Venue
+
+
+def _venue_price(booking: Booking, venue_id: int) -> int:
+    if booking.venue_id == venue_id and Booking.venue.is_cached(booking):
+        return booking.venue.price or 0
+    price = Venue.objects.filter(pk=venue_id).values_list("price", flat=True).first()
+    return price or 0
+
+
+def _apply_delta(venue_id: int, day: datetime.date, price: int, delta: int) -> None:
+    # Revenue is recomputed from the count at the venue's current price, the
+    # same valuation the analytics have always used, so rows never drift.
+    rollup, _ = DailyVenueSales.objects.get_or_create(date=day, venue_id=venue_id)
+    DailyVenueSales.objects.filter(pk=rollup.pk).update(
+        bookings=F("bookings") + delta,
+        revenue=(F("bookings") + delta) * price,
+    )
+    if delta < 0:
+        DailyVenueSales.objects.filter(pk=rollup.pk, bookings__lte=0).delete()
+
+
+def sync_booking_sales(booking: Booking) -> None:
+    """Move ``booking`` between rollup buckets after it has been saved.
+
+    Compares the bucket recorded when the booking was loaded with the one it
+    belongs to now, so flipping ``has_been_paid``, changing ``date_paid`` or
+    moving a paid booking to another venue touches at most two rows.
+    """
+
+    previous = booking._sales_rollup_key
+    current = booking.sales_rollup_key
+    if previous == current:
+        return
+
+    with transaction.atomic():
+        if previous is not None:
+            venue_id, day = previous
+            _apply_delta(venue_id, day, _venue_price(booking, venue_id), -1)
+        if current is not None:
+            venue_id, day = current
+            _apply_delta(venue_id, day, _venue_price(booking, venue_id), 1)
+    booking._sales_rollup_key = current
+
+
+def record_new_booking_sales(bookings: Iterable[Booking]) -> None:
+    """Count freshly bulk-inserted bookings, touching each bucket once."""
+
+    buckets: Counter[tuple[int, datetime.date]] = Counter()
+    prices: dict[int, int] = {}
+    for booking in bookings:
+        key = booking.sales_rollup_key
+        if key is not None:
+            buckets[key] += 1
+            prices.setdefault(key[0], _venue_price(booking, key[0]))
+        booking._sales_rollup_key = key
+
+    with transaction.atomic():
+        for (venue_id, day), count in buckets.items():
+            _apply_delta(venue_id, day, prices[venue_id], count)
+
+
+def discard_booking_sales(booking: Booking) -> None:
+    """Remove a deleted booking's contribution to the rollups."""
+
+    previous = booking._sales_rollup_key
+    if previous is None:
+        return
+    venue_id, day = previous
+    _apply_delta(venue_id, day, _venue_price(booking, venue_id), -1)
+    booking._sales_rollup_key = None
+
+
+def reprice_venue_sales(venue_id: int, price: int) -> None:
+    """Rescale every rollup row for a venue after its price changes."""
+
+    DailyVenueSales.objects.filter(venue_id=venue_id).update(
+        revenue=F("bookings") * price
+    )
+
+
+def rebuild_sales_rollups() -> int:
+    """Recompute every rollup row from paid bookings. Returns rows written."""
+
+    rows = (
+        Booking.objects.filter(has_been_paid=True, date_paid__isnull=False)
+        .values("date_paid", "venue_id")
+        .annotate(bookings=Count("id"), revenue=Sum("venue__price"))
+        .order_by("date_paid", "venue_id")
+    )
+    rollups = [
+        DailyVenueSales(
+            date=row["date_paid"],
+            venue_id=row["venue_id"],
+            bookings=row["bookings"],
+            revenue=row["revenue"] or 0,
+        )
+        for row in rows.iterator()
+    ]
+
+    with transaction.atomic():
+        DailyVenueSales.objects.all().delete()
+        DailyVenueSales.objects.bulk_create(rollups, batch_size=500)
+    return len(rollups)
+
@@ -2,14 +2,22 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils import timezone
 
-from .models import Booking, BookingDate, Comment, Venue
+from .availability import find_conflicting_slot, sync_booking_slot
+from .db_routing import primary_reads
+from .models import Booking, BookingDate, Comment, SampleDataMarker, Venue
+from .ratings import rebuild_rating_summaries
 
 UserModel = get_user_model()
 
+# Process-level short circuit for ``ensure_sample_data_seeded``. Once this
+# process has seen the persisted marker, page views skip the database entirely.
+_sample_data_ready = False
+
 
 SAMPLE_USERS: list[dict[str, str]] = [
     {
@@ -261,9 +269,12 @@ def _create_bookings(users: dict[str, UserModel], venues: dict[str, Venue], *, b
         if Booking.objects.filter(
             user=user,
             venue=venue,
-            date__start_date=start_date,
+            start_date=start_date,
         ).exists():
             continue
+        # Seeding again from another base date must not double-book a venue.
+        if find_conflicting_slot(venue.pk, start_date, end_date) is not None:
+            continue
 
         booking_date = BookingDate.objects.create(
             start_date=start_date,
@@ -286,6 +297,7 @@ def _create_bookings(users: dict[str, UserModel], venues: dict[str, Venue], *, b
             booking.date_paid = date_paid
 
         booking.save()
+        sync_booking_slot(booking)
 
 
 def _resolve_comment_date(*, base_reference, today, payload) -> date:
@@ -387,3 +399,41 @@ def ensure_sample_data(*, base_date=None) -> None:
         if not Venue.objects.exists():
             for payload in SAMPLE_VENUES:
                 Venue.objects.create(**payload)
+
+        # Signals keep the summaries in step with each fixture comment; one
+        # full recompute also repairs summaries of an older database.
+        rebuild_rating_summaries()
+
+        marker = SampleDataMarker.objects.order_by("pk").first()
+        if marker is None:
+            SampleDataMarker.objects.create()
+        else:
+            marker.save(update_fields=["seeded_at"])
+
+
+def ensure_sample_data_seeded() -> None:
+    """Seed the demo fixtures at most once per database.
+
+    Page views call this instead of ``ensure_sample_data`` so that only the
+    very first request against an empty database pays for seeding. After the
+    persisted ``SampleDataMarker`` has been observed, the process-level flag
+    turns every later call into a no-op without touching the database. Use the
+    ``seed_sample_data`` management command to re-seed explicitly.
+    """
+
+    global _sample_data_ready
+
+    if _sample_data_ready:
+        return
+
+    with primary_reads():
+        if not SampleDataMarker.objects.exists():
+            ensure_sample_data()
+    _sample_data_ready = True
+
+
+async def aensure_sample_data_seeded() -> None:
+    """Async ``ensure_sample_data_seeded`` that skips the thread hop once seeded."""
+
+    if not _sample_data_ready:
+        await sync_to_async(ensure_sample_data_seeded)()
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from django.db import DatabaseError, connection, connections, router
+from django.db.models.expressions import RawSQL
+
+from .models import Booking, Venue
+
+VENUE_FTS_TABLE = "main_venue_fts"
+VENUE_FTS_COLUMNS = ("title", "type", "location", "description", "facilities", "price")
+VENUE_FTS_REBUILD_SQL = (
+    f"INSERT INTO {VENUE_FTS_TABLE} (rowid, {', '.join(VENUE_FTS_COLUMNS)}) "
+    "SELECT v.id, v.title, v.type, v.location, v.description, "
+    "(SELECT group_concat(f.value, ' ') FROM json_each(v.facilities) AS f), "
+    "CAST(v.price AS TEXT) FROM main_venue AS v"
+)
+
+BOOKING_FTS_TABLE = "main_booking_fts"
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_fts_tables: dict[str, bool] = {}
+
+
+def _fts_table_available(table: str) -> bool:
+    if table not in _fts_tables:
+        if connection.vendor != "sqlite":
+            _fts_tables[table] = False
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                    [table],
+                )
+                _fts_tables[table] = cursor.fetchone() is not None
+    return _fts_tables[table]
+
+
+def venue_fts_available() -> bool:
+    """Whether the SQLite FTS5 venue index exists on the default database.
+
+    The index is created by migration 0013 only on SQLite builds with FTS5;
+    every other setup keeps using the ``icontains`` search.
+    """
+
+    return _fts_table_available(VENUE_FTS_TABLE)
+
+
+def booking_fts_available() -> bool:
+    return _fts_table_available(BOOKING_FTS_TABLE)
+
+
+def _venue_document(venue: Venue) -> list[object]:
+    facilities = venue.facilities
+    if isinstance(facilities, (list, tuple)):
+        facilities = " ".join(str(item) for item in facilities)
+    return [
+        venue.title,
+        venue.type,
+        venue.location,
+        venue.description,
+        facilities or "",
+        str(venue.price),
+    ]
+
+
+def index_venue(venue: Venue) -> None:
+    """Insert or replace ``venue``'s row in the search index."""
+
+    if not venue_fts_available():
+        return
+    placeholders = ", ".join(["%s"] * (len(VENUE_FTS_COLUMNS) + 1))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {VENUE_FTS_TABLE} WHERE rowid = %s", [venue.pk])
+        cursor.execute(
+            f"INSERT INTO {VENUE_FTS_TABLE} (rowid, {', '.join(VENUE_FTS_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            [venue.pk, *_venue_document(venue)],
+        )
+
+
+def index_venues(venues: Iterable[Venue]) -> None:
+    """Add freshly inserted venues to the index in one batched statement."""
+
+    if not venue_fts_available():
+        return
+    placeholders = ", ".join(["%s"] * (len(VENUE_FTS_COLUMNS) + 1))
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {VENUE_FTS_TABLE} (rowid, {', '.join(VENUE_FTS_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            [[venue.pk, *_venue_document(venue)] for venue in venues],
+        )
+
+
+def unindex_venue(venue_id: int) -> None:
+    if not venue_fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {VENUE_FTS_TABLE} WHERE rowid = %s", [venue_id])
+
+
+def rebuild_venue_index() -> int:
+    """Re-index every venue, e.g. after bulk inserts that skip signals."""
+
+    if not venue_fts_available():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {VENUE_FTS_TABLE}")
+        cursor.execute(VENUE_FTS_REBUILD_SQL)
+        return cursor.rowcount
+
+
+def search_match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 query: every word is a required prefix.
+
+    Punctuation splits a word into several index tokens, so a word such as
+    ``2026-10-1`` becomes the phrase ``"2026" + "10" + "1"*``: its tokens must
+    be adjacent, with only the last one matched as a prefix.
+    """
+
+    terms = []
+    for word in (query or "").lower().split():
+        tokens = _TOKEN_PATTERN.findall(word)
+        if tokens:
+            terms.append(" + ".join(f'"{token}"' for token in tokens) + "*")
+    return " ".join(terms) or None
+
+
+def filter_venues(queryset, query: str):
+    """Restrict ``queryset`` to venues matching ``query`` in the FTS index.
+
+    A blank query leaves ``queryset`` as is; one without any word characters
+    (say ``"!!"``) matches nothing.
+    """
+
+    match = search_match_expression(query)
+    if match is None:
+        return queryset.none() if (query or "").strip() else queryset
+    return queryset.filter(
+        pk__in=RawSQL(
+            f"SELECT rowid FROM {VENUE_FTS_TABLE} WHERE {VENUE_FTS_TABLE} MATCH %s",
+            (match,),
+        )
+    )
+
+
+def _ranked_venue_rows(
+    select: str, query: str, venue_type: str, suffix: str = "", extra=()
+) -> list[tuple]:
+    match = search_match_expression(query)
+    if match is None:
+        return []
+    sql = (
+        f"SELECT {select} FROM {VENUE_FTS_TABLE} "
+        f"JOIN {Venue._meta.db_table} AS v ON v.id = {VENUE_FTS_TABLE}.rowid "
+        f"WHERE {VENUE_FTS_TABLE} MATCH %s"
+    )
+    params: list[object] = [match]
+    if venue_type:
+        sql += " AND v.type = %s"
+        params.append(venue_type)
+    try:
+        # Raw cursors skip the router, so pick the alias a venue read would use.
+        with connections[router.db_for_read(Venue)].cursor() as cursor:
+            cursor.execute(sql + suffix, [*params, *extra])
+            return cursor.fetchall()
+    except DatabaseError:
+        return []
+
+
+def ranked_venue_ids(
+    query: str, *, venue_type: str = "", limit: int | None = None, offset: int = 0
+) -> list[int]:
+    """Venue ids matching ``query``, best BM25 match first.
+
+    The type filter, ordering and ``LIMIT``/``OFFSET`` all run in one FTS
+    query joined to the venue table, so a page costs its size rather than
+    the number of matches.
+    """
+
+    suffix = f" ORDER BY {VENUE_FTS_TABLE}.rank"
+    extra: list[object] = []
+    if limit is not None or offset:
+        suffix += " LIMIT %s OFFSET %s"
+        extra = [-1 if limit is None else limit, offset]
+    rows = _ranked_venue_rows("v.id", query, venue_type, suffix, extra)
+    return [row[0] for row in rows]
+
+
+def count_ranked_venues(query: str, *, venue_type: str = "") -> int:
+    rows = _ranked_venue_rows("COUNT(*)", query, venue_type)
+    return rows[0][0] if rows else 0
+
+
+class RankedVenueIds:
+    """``ranked_venue_ids`` as a ``Paginator`` object list.
+
+    ``count()`` and each sliced page are one query apiece; nothing loads the
+    full list of matches.
+    """
+
+    def __init__(self, query: str, *, venue_type: str = "") -> None:
+        self.query = query
+        self.venue_type = venue_type
+
+    def count(self) -> int:
+        return count_ranked_venues(self.query, venue_type=self.venue_type)
+
+    def __getitem__(self, page: slice) -> list[int]:
+        start = page.start or 0
+        return ranked_venue_ids(
+            self.query,
+            venue_type=self.venue_type,
+            limit=None if page.stop is None else max(page.stop - start, 0),
+            offset=start,
+        )
+
+
+def booking_search_document(booking: Booking) -> str:
+    """Lowercased text admin booking search matches against."""
+
+    user = booking.user
+    pieces = []
+    if user is not None:
+        pieces.extend([user.get_username(), user.first_name, user.last_name])
+    pieces.extend(
+        [
+            booking.venue.title,
+            booking.notes,
+            booking.date.start_date.isoformat(),
+            booking.date.end_date.isoformat(),
+            "paid" if booking.has_been_paid else "pending",
+        ]
+    )
+    return " ".join(str(piece).strip() for piece in pieces if piece).lower()
+
+
+def index_booking(booking_id: int, document: str) -> None:
+    if not booking_fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {BOOKING_FTS_TABLE} WHERE rowid = %s", [booking_id])
+        cursor.execute(
+            f"INSERT INTO {BOOKING_FTS_TABLE} (rowid, document) VALUES (%s, %s)",
+            [booking_id, document],
+        )
+
+
+def index_bookings(bookings: Iterable[Booking]) -> None:
+    """Add freshly inserted bookings to the index in one batched statement."""
+
+    if not booking_fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {BOOKING_FTS_TABLE} (rowid, document) VALUES (%s, %s)",
+            [(booking.pk, booking.search_document) for booking in bookings],
+        )
+
+
+def unindex_booking(booking_id: int) -> None:
+    if not booking_fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {BOOKING_FTS_TABLE} WHERE rowid = %s", [booking_id])
+
+
+def refresh_booking_documents(queryset, *, reindex: bool = True) -> int:
+    """Recompute stored search documents for ``queryset``. Returns rows changed.
+
+    Used when something a booking's document quotes (its date, venue title or
+    user's name) changes without the booking itself being saved.
+    """
+
+    changed = []
+    for booking in queryset.select_related("user", "venue", "date").iterator():
+        document = booking_search_document(booking)
+        if document != booking.search_document:
+            booking.search_document = document
+            changed.append(booking)
+    if changed:
+        Booking.objects.bulk_update(changed, ["search_document"], batch_size=500)
+        if reindex:
+            for booking in changed:
+                index_booking(booking.pk, booking.search_document)
+    return len(changed)
+
+
+def rebuild_booking_index() -> int:
+    """Recompute every booking document and re-index them all."""
+
+    refresh_booking_documents(Booking.objects.all(), reindex=False)
+    if not booking_fts_available():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {BOOKING_FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {BOOKING_FTS_TABLE} (rowid, document) "
+            "SELECT id, search_document FROM main_booking"
+        )
+        return cursor.rowcount
+
+
+def filter_bookings(queryset, query: str):
+    """Restrict ``queryset`` to bookings whose search document matches ``query``."""
+
+    if booking_fts_available():
+        match = search_match_expression(query)
+        if match is None:
+            return queryset.none() if (query or "").strip() else queryset
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {BOOKING_FTS_TABLE} "
+                f"WHERE {BOOKING_FTS_TABLE} MATCH %s",
+                (match,),
+            )
+        )
+    return queryset.filter(search_document__contains=query.strip().lower())
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import user_index
+from .availability import invalidate_venue_availability
+from .cache_versions import (
+    BOOKING_DATA,
+    USER_BOOKINGS,
+    USER_DIRECTORY,
+    VENUE_CATALOGUE,
+    bump_data_version,
+    user_scope,
+)
+from .images import schedule_image_variants
+from .leaderboard import discard_booking_venue, sync_booking_venue
+from .models import Booking, BookingDate, Comment, CommentVenue, Venue, VenueSlot
+from .ratings import record_rating_added, record_rating_changed, record_rating_removed
+from .rollups import discard_booking_sales, sync_booking_sales
+from .search import (
+    booking_search_document,
+    index_booking,
+    index_venue,
+    refresh_booking_documents,
+    unindex_booking,
+    unindex_venue,
+)
+
+User = get_user_model()
+
+# Fields of the user model quoted in booking search documents.
+USER_SEARCH_FIELDS = frozenset({"username", "first_name", "last_name"})
+# Fields of the user model returned by the admin user search.
+USER_DIRECTORY_FIELDS = USER_SEARCH_FIELDS | {"email"}
+
+
+@receiver(post_save, sender=VenueSlot)
+@receiver(post_delete, sender=VenueSlot)
+def _venue_slot_changed(sender, instance: VenueSlot, **kwargs) -> None:
+    invalidate_venue_availability(instance.venue_id)
+
+
+def _bump_user_bookings(*user_ids: int | None) -> None:
+    for user_id in set(user_ids):
+        if user_id is not None:
+            bump_data_version(user_scope(USER_BOOKINGS, user_id))
+
+
+@receiver(post_save, sender=Booking)
+def _booking_saved(sender, instance: Booking, created: bool, **kwargs) -> None:
+    sync_booking_sales(instance)
+    sync_booking_venue(instance, created=created)
+    bump_data_version(BOOKING_DATA)
+    _bump_user_bookings(instance.user_id, instance._persisted_user_id)
+    instance._persisted_user_id = instance.user_id
+
+
+@receiver(post_delete, sender=Booking)
+def _booking_deleted(sender, instance: Booking, **kwargs) -> None:
+    discard_booking_sales(instance)
+    discard_booking_venue(instance)
+    bump_data_version(BOOKING_DATA)
+    _bump_user_bookings(instance.user_id)
+
+
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+def _venue_changed(sender, instance: Venue, **kwargs) -> None:
+    # Analytics label bookings by venue title and value them at its price.
+    bump_data_version(BOOKING_DATA)
+    bump_data_version(VENUE_CATALOGUE)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=CommentVenue)
+@receiver(post_delete, sender=CommentVenue)
+def _comment_changed(sender, instance, **kwargs) -> None:
+    # Venue detail fragments list the comments attached to each venue.
+    bump_data_version(VENUE_CATALOGUE)
+
+
+@receiver(post_save, sender=Comment)
+def _comment_saved_rating(sender, instance: Comment, created: bool, **kwargs) -> None:
+    # A new comment has no venue links yet; they are counted as they are made.
+    if not created and instance._persisted_rating is not None:
+        record_rating_changed(
+            instance.venue_links.values_list("venue_id", flat=True),
+            instance._persisted_rating,
+            instance.rating,
+        )
+    instance._persisted_rating = instance.rating
+
+
+@receiver(post_save, sender=CommentVenue)
+def _comment_link_saved(
+    sender, instance: CommentVenue, created: bool, **kwargs
+) -> None:
+    if created:
+        record_rating_added([instance.venue_id], instance.comment.rating)
+
+
+@receiver(post_delete, sender=CommentVenue)
+def _comment_link_deleted(sender, instance: CommentVenue, **kwargs) -> None:
+    # Also reached through cascades (comment, user or venue deletes) and
+    # ``comment.venue.remove()``/``clear()``. Links are deleted before their
+    # comment, so the rating can still be read.
+    record_rating_removed([instance.venue_id], instance.comment.rating)
+
+
+@receiver(m2m_changed, sender=CommentVenue)
+def _comment_links_added(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    # ``comment.venue.add()`` bulk-creates links without ``post_save``.
+    if action != "post_add" or not pk_set:
+        return
+    if not reverse:
+        record_rating_added(pk_set, instance.rating)
+        return
+    for rating in Comment.objects.filter(pk__in=pk_set).values_list(
+        "rating", flat=True
+    ):
+        record_rating_added([instance.pk], rating)
+
+
+@receiver(post_save, sender=Venue)
+def _venue_saved_search(sender, instance: Venue, created: bool, **kwargs) -> None:
+    index_venue(instance)
+    if not created and instance._persisted_title != instance.title:
+        refresh_booking_documents(Booking.objects.filter(venue_id=instance.pk))
+    instance._persisted_title = instance.title
+
+
+@receiver(post_delete, sender=Venue)
+def _venue_deleted_search(sender, instance: Venue, **kwargs) -> None:
+    unindex_venue(instance.pk)
+
+
+@receiver(pre_save, sender=Booking)
+def _booking_search_document(sender, instance: Booking, **kwargs) -> None:
+    instance.search_document = booking_search_document(instance)
+
+
+@receiver(post_save, sender=Booking)
+def _booking_saved_search(sender, instance: Booking, **kwargs) -> None:
+    index_booking(instance.pk, instance.search_document)
+
+
+@receiver(post_delete, sender=Booking)
+def _booking_deleted_search(sender, instance: Booking, **kwargs) -> None:
+    unindex_booking(instance.pk)
+
+
+@receiver(post_save, sender=BookingDate)
+def _booking_date_saved(sender, instance: BookingDate, created: bool, **kwargs) -> None:
+    if not created:
+        bookings = Booking.objects.filter(date_id=instance.pk)
+        bookings.update(start_date=instance.start_date)
+        refresh_booking_documents(bookings)
+        _bump_user_bookings(*bookings.values_list("user_id", flat=True))
+
+
+@receiver(post_save, sender=User)
+def _user_saved(sender, instance, created: bool, update_fields=None, **kwargs) -> None:
+    user_index.index_user(instance)
+    if update_fields is None or USER_DIRECTORY_FIELDS.intersection(update_fields):
+        bump_data_version(USER_DIRECTORY)
+    if created:
+        return
+    if update_fields is not None and not USER_SEARCH_FIELDS.intersection(update_fields):
+        return
+    refresh_booking_documents(Booking.objects.filter(user_id=instance.pk))
+    # Comment cards on venue detail pages show the author's name.
+    bump_data_version(VENUE_CATALOGUE)
+
+
+@receiver(post_delete, sender=User)
+def _user_deleted(sender, instance, **kwargs) -> None:
+    user_index.unindex_user(instance.pk)
+    bump_data_version(USER_DIRECTORY)
+
+
+@receiver(post_save, sender=Venue)
+def _venue_saved_image(sender, instance: Venue, **kwargs) -> None:
+    schedule_image_variants(instance)
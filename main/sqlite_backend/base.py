@@ -0,0 +1,65 @@
+"""SQLite backend that retries lock contention instead of failing the request.
+
+Use with ``OPTIONS["transaction_mode"] = "IMMEDIATE"``: every write
+transaction then claims the database write lock at ``BEGIN``, so contention
+surfaces either there or on a statement run in autocommit mode. In both
+places nothing has been done yet, which makes it safe to wait and run the
+same statement again. Statements inside an open transaction are never
+retried; the transaction already holds whatever lock it needs. Neither is
+``executemany`` in autocommit mode, where rows written before the failure
+would already be committed.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import sqlite3
+import time
+
+from django.db.backends.sqlite3 import base
+
+logger = logging.getLogger(__name__)
+
+LOCK_RETRY_ATTEMPTS = 5
+LOCK_RETRY_BASE_DELAY = 0.05
+LOCK_RETRY_MAX_DELAY = 1.0
+
+_LOCK_MESSAGES = ("database is locked", "database table is locked")
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    return isinstance(exc, sqlite3.OperationalError) and str(exc).startswith(
+        _LOCK_MESSAGES
+    )
+
+
+def _retry_delay(attempt: int) -> float:
+    # Full jitter keeps retrying processes from waking up in lockstep.
+    ceiling = min(LOCK_RETRY_MAX_DELAY, LOCK_RETRY_BASE_DELAY * 2**attempt)
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class SQLiteCursorWrapper(base.SQLiteCursorWrapper):
+    def execute(self, query, params=None):
+        if self.connection.in_transaction:
+            return super().execute(query, params)
+        for attempt in range(LOCK_RETRY_ATTEMPTS):
+            try:
+                return super().execute(query, params)
+            except sqlite3.OperationalError as exc:
+                if not is_lock_error(exc) or attempt == LOCK_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.info(
+                    "SQLite is locked; retrying in %.0f ms (attempt %d of %d).",
+                    delay * 1000,
+                    attempt + 2,
+                    LOCK_RETRY_ATTEMPTS,
+                )
+                time.sleep(delay)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def create_cursor(self, name=None):
+        return self.connection.cursor(factory=SQLiteCursorWrapper)
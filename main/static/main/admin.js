@@ -98,6 +98,7 @@
     users: {
       search: '/api/users/search/',
     },
+    analytics: '/api/bookings/analytics/',
   };
 
   const DEFAULT_PAGE_SIZE = 6;
@@ -136,6 +137,9 @@
         totalItems: 0,
         hasPrevious: false,
         hasNext: false,
+        cursor: null,
+        nextCursor: null,
+        previousCursor: null,
         query: '',
       },
       bookings: {
@@ -145,6 +149,9 @@
         totalItems: 0,
         hasPrevious: false,
         hasNext: false,
+        cursor: null,
+        nextCursor: null,
+        previousCursor: null,
         query: '',
       },
     },
@@ -506,6 +513,9 @@
       hasPrevious:
         typeof rawHasPrevious === 'boolean' ? rawHasPrevious : page > 1 && totalPages > 1,
       hasNext: typeof rawHasNext === 'boolean' ? rawHasNext : page < totalPages,
+      cursor: resolved.cursor ?? fallbackMeta.cursor ?? null,
+      nextCursor: resolved.next_cursor ?? null,
+      previousCursor: resolved.previous_cursor ?? null,
       query:
         typeof resolved.query === 'string'
           ? resolved.query.trim()
@@ -526,6 +536,11 @@
       'hasPrevious',
       'has_next',
       'hasNext',
+      'cursor',
+      'next_cursor',
+      'nextCursor',
+      'previous_cursor',
+      'previousCursor',
       'query',
     ]);
 
@@ -1241,33 +1256,25 @@
     wrapper.setAttribute('aria-busy', active ? 'true' : 'false');
   }
 
-  function computePageList(current, total, maxLength = 5) {
-    const safeTotal = Math.max(1, total || 1);
-    const safeCurrent = Math.min(Math.max(1, current || 1), safeTotal);
-    const visible = Math.max(1, maxLength || 1);
-    let start = Math.max(1, safeCurrent - Math.floor(visible / 2));
-    let end = start + visible - 1;
-    if (end > safeTotal) {
-      end = safeTotal;
-      start = Math.max(1, end - visible + 1);
-    }
-    const pages = [];
-    for (let page = start; page <= end; page += 1) {
-      pages.push(page);
-    }
-    return pages;
-  }
-
-  function handlePageChange(section, page) {
+  function handlePageChange(section, direction) {
     const meta = state.pagination[section] || {};
-    const parsed = Number(page);
-    const pageNumber = Number.isFinite(parsed) && parsed > 0 ? parsed : 1;
+    const forward = direction === 'next';
+    const cursor = forward ? meta.nextCursor : meta.previousCursor;
+    if (!cursor) {
+      return;
+    }
+    const currentPage = meta.page || 1;
     const pageSize = meta.pageSize || DEFAULT_PAGE_SIZE;
     const query = state.search[section] || '';
-    loadSection(section, { page: pageNumber, pageSize, query });
+    loadSection(section, {
+      cursor,
+      page: forward ? currentPage + 1 : Math.max(1, currentPage - 1),
+      pageSize,
+      query,
+    });
   }
 
-  function createPaginationButton(label, pageNumber, section, options = {}) {
+  function createPaginationButton(label, direction, section, options = {}) {
     const button = document.createElement('button');
     button.type = 'button';
     button.textContent = label;
@@ -1278,9 +1285,9 @@
       button.disabled = true;
       return button;
     }
-    button.dataset.page = String(pageNumber);
+    button.dataset.direction = direction;
     button.addEventListener('click', () => {
-      handlePageChange(section, pageNumber);
+      handlePageChange(section, direction);
     });
     return button;
   }
@@ -1292,30 +1299,30 @@
     }
     const meta = state.pagination[section];
     container.innerHTML = '';
-    if (!meta || meta.totalPages <= 1) {
+    if (!meta || (!meta.hasNext && !meta.hasPrevious)) {
       container.classList.add('is-hidden');
       return;
     }
     container.classList.remove('is-hidden');
     const fragment = document.createDocumentFragment();
     fragment.appendChild(
-      createPaginationButton('Prev', meta.page - 1, section, {
+      createPaginationButton('Prev', 'previous', section, {
         disabled: !meta.hasPrevious,
         ariaLabel: 'Previous page',
       }),
     );
-    const pages = computePageList(meta.page, meta.totalPages);
-    pages.forEach((pageNumber) => {
-      const button = createPaginationButton(String(pageNumber), pageNumber, section);
-      if (pageNumber === meta.page) {
-        button.classList.add('is-active');
-        button.disabled = true;
-        button.setAttribute('aria-current', 'page');
-      }
-      fragment.appendChild(button);
-    });
+    // Pages are fetched by cursor, so only the current position is shown.
+    const indicator = createPaginationButton(
+      `${meta.page} / ${Math.max(meta.totalPages, meta.page)}`,
+      'current',
+      section,
+      { disabled: true },
+    );
+    indicator.classList.add('is-active');
+    indicator.setAttribute('aria-current', 'page');
+    fragment.appendChild(indicator);
     fragment.appendChild(
-      createPaginationButton('Next', meta.page + 1, section, {
+      createPaginationButton('Next', 'next', section, {
         disabled: !meta.hasNext,
         ariaLabel: 'Next page',
       }),
@@ -1360,7 +1367,12 @@
     const pageSize = meta.pageSize || DEFAULT_PAGE_SIZE;
     window.clearTimeout(searchTimeouts[section]);
     searchTimeouts[section] = window.setTimeout(() => {
-      loadSection(section, { page: 1, pageSize, query });
+      loadSection(section, {
+        cursor: null,
+        page: 1,
+        pageSize,
+        query,
+      });
     }, 220);
   }
 
@@ -1709,8 +1721,10 @@
       const imageCell = document.createElement('td');
       if (venue.image_url) {
         const img = document.createElement('img');
-        img.src = venue.image_url;
+        img.src = venue.image_thumbnail_url || venue.image_url;
         img.alt = `${venue.title} preview`;
+        img.loading = 'lazy';
+        img.decoding = 'async';
         imageCell.appendChild(img);
       } else {
         const placeholder = document.createElement('span');
@@ -2131,13 +2145,25 @@
     const pageSize = Number.isFinite(requestedPageSize) && requestedPageSize > 0
       ? requestedPageSize
       : DEFAULT_PAGE_SIZE;
+    const cursor =
+      options.cursor !== undefined ? options.cursor : currentMeta.cursor || null;
     const requestedPage =
       options.page !== undefined ? Number(options.page) : currentMeta.page;
-    const page = Number.isFinite(requestedPage) && requestedPage > 0 ? requestedPage : 1;
+    const page = cursor && Number.isFinite(requestedPage) && requestedPage > 0
+      ? requestedPage
+      : 1;
+    // Totals cost a COUNT(*), so only ask for them when starting over or
+    // after a mutation; cursor pages reuse the known total.
+    const includeTotal = options.includeTotal !== undefined ? options.includeTotal : !cursor;
 
     const params = new URLSearchParams();
-    params.set('page', String(page));
     params.set('page_size', String(pageSize));
+    if (cursor) {
+      params.set('cursor', cursor);
+    }
+    if (includeTotal) {
+      params.set('include_total', '1');
+    }
     if (query) {
       params.set('q', query);
     }
@@ -2150,6 +2176,8 @@
 
     try {
       setLoading(section, true);
+      // List endpoints send an ETag with ``no-cache``; unchanged pages come
+      // back as a 304 the browser answers from its cache.
       const response = await fetch(`${endpoint.list}?${params.toString()}`, {
         headers: { 'X-Requested-With': 'XMLHttpRequest' },
         signal: controller.signal,
@@ -2165,6 +2193,7 @@
       const meta = normalizePaginationMeta(payload.meta, {
         page,
         pageSize,
+        cursor,
         query,
         totalItems: currentMeta.totalItems,
         totalPages: currentMeta.totalPages,
@@ -2199,7 +2228,6 @@
         }
       } else if (section === 'bookings') {
         renderBookings();
-        updateAnalytics(meta.analytics || (payload.meta ? payload.meta.analytics : undefined));
       }
 
       updateActionButton();
@@ -2220,7 +2248,26 @@
   }
 
   async function refreshFromServer(section, options = {}) {
-    return loadSection(section, options);
+    return loadSection(section, { includeTotal: true, ...options });
+  }
+
+  async function refreshAnalytics() {
+    try {
+      // The endpoint answers with an ETag and ``no-cache``, so the browser
+      // revalidates and an unchanged payload costs a 304.
+      const response = await fetch(endpoints.analytics, {
+        headers: { 'X-Requested-With': 'XMLHttpRequest' },
+      });
+      if (!response.ok) {
+        return;
+      }
+      const payload = await response.json();
+      if (payload.success) {
+        updateAnalytics(payload.data);
+      }
+    } catch (error) {
+      console.error(error);
+    }
   }
 
   async function handleFormSubmit(event) {
@@ -2293,30 +2340,28 @@
           autocompleteControllers.venue.setSelection(payload.data.title || '', payload.data.id);
         }
 
-        const targetPage = mode === 'edit'
-          ? state.pagination.venues.page || 1
-          : 1;
+        // Edits stay on the current cursor page; new records show up first.
+        const target = mode === 'edit' ? {} : { cursor: null, page: 1 };
         await refreshFromServer('venues', {
-          page: targetPage,
+          ...target,
           query: state.search.venues || '',
         });
 
         if (mode === 'edit') {
           await refreshFromServer('bookings', {
-            page: state.pagination.bookings.page || 1,
             query: state.search.bookings || '',
           });
         }
       } else if (section === 'bookings') {
         state.hasUsers = true;
-        const targetPage = mode === 'edit'
-          ? state.pagination.bookings.page || 1
-          : 1;
+        // Edits stay on the current cursor page; new records show up first.
+        const target = mode === 'edit' ? {} : { cursor: null, page: 1 };
         await refreshFromServer('bookings', {
-          page: targetPage,
+          ...target,
           query: state.search.bookings || '',
         });
       }
+      refreshAnalytics();
 
       closeModal();
       showToast(mode === 'edit' ? 'Updated successfully!' : 'Created successfully!');
@@ -2360,19 +2405,17 @@
           autocompleteControllers.venue.clear();
         }
         await refreshFromServer('venues', {
-          page: state.pagination.venues.page || 1,
           query: state.search.venues || '',
         });
         await refreshFromServer('bookings', {
-          page: state.pagination.bookings.page || 1,
           query: state.search.bookings || '',
         });
       } else if (section === 'bookings') {
         await refreshFromServer('bookings', {
-          page: state.pagination.bookings.page || 1,
           query: state.search.bookings || '',
         });
       }
+      refreshAnalytics();
       showToast('Deleted successfully.');
     } catch (error) {
       console.error(error);
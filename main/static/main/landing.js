@@ -392,24 +392,20 @@ document.addEventListener("DOMContentLoaded", () => {
 
     const form = page.querySelector("[data-venues-search]");
     const input = page.querySelector("[data-venues-input]");
-    const cards = Array.from(page.querySelectorAll(".venue-card"));
-    const countEl = page.querySelector("[data-venues-count]");
-    const emptyState = page.querySelector("[data-venues-empty]");
-    const grid = page.querySelector("[data-venues-grid]");
-    const meta = page.querySelector("[data-venues-meta]");
+    const typeSelect = page.querySelector("[data-venues-type]");
     const tokensList = page.querySelector("[data-venues-tokens]");
-    const filterLabel = page.querySelector("[data-venues-filter-label]");
-    const matchedEl = page.querySelector("[data-venues-matched]");
-    const totalEl = page.querySelector("[data-venues-total]");
-    const queryEl = page.querySelector("[data-venues-query]");
-    const totalAvailable = Number(meta?.dataset.total || totalEl?.textContent || cards.length);
-    let lastQuery = "";
-
-    if (totalEl) {
-      totalEl.textContent = String(totalAvailable);
-    }
+    let results = page.querySelector("[data-venues-results]");
+    let lastQuery = (input?.value || "").trim();
+    let searchTimer = null;
+    let activeRequest = 0;
+
+    const keywordsFor = (value) => {
+      const rawQuery = value.trim();
+      return rawQuery ? rawQuery.split(/\s+/).filter(Boolean) : [];
+    };
 
     const playGridAnimation = (className, { removeAfter = false } = {}) => {
+      const grid = results?.querySelector("[data-venues-grid]");
       if (!grid) {
         return;
       }
@@ -452,87 +448,113 @@ document.addEventListener("DOMContentLoaded", () => {
       tokensList.setAttribute("aria-hidden", "false");
     };
 
-    const updateMetaState = (rawKeywords, matches) => {
-      if (countEl) {
-        countEl.textContent = String(matches);
-      }
-      if (matchedEl) {
-        matchedEl.textContent = String(matches);
+    const renderQueryLabel = (keywords) => {
+      const queryEl = results?.querySelector("[data-venues-query]");
+      if (!queryEl) {
+        return;
       }
-      if (totalEl) {
-        totalEl.textContent = String(totalAvailable);
+      const labels = keywords.map((keyword) => `#${keyword}`);
+      if (typeSelect?.value) {
+        labels.push(typeSelect.selectedOptions[0]?.textContent || typeSelect.value);
       }
-      if (queryEl) {
-        if (rawKeywords.length) {
-          queryEl.textContent = rawKeywords
-            .map((keyword) => `#${keyword}`)
-            .join("  ·  ");
-        } else {
-          queryEl.textContent = "";
-        }
-      }
-      if (filterLabel) {
-        filterLabel.setAttribute("aria-hidden", rawKeywords.length > 0 ? "false" : "true");
+      queryEl.textContent = labels.join("  ·  ");
+    };
+
+    const buildResultsUrl = () => {
+      const params = new URLSearchParams();
+      const rawQuery = (input?.value || "").trim();
+      if (rawQuery) {
+        params.set("q", rawQuery);
       }
-      if (meta) {
-        meta.classList.toggle("is-filtering", rawKeywords.length > 0);
-        meta.dataset.matches = String(matches);
-        meta.dataset.keywords = rawKeywords.join(" ");
+      if (typeSelect?.value) {
+        params.set("type", typeSelect.value);
       }
+      const base = form?.getAttribute("action") || window.location.pathname;
+      const queryString = params.toString();
+      return queryString ? `${base}?${queryString}` : base;
     };
 
-    const filterCards = () => {
-      const rawValue = input?.value || "";
-      const rawQuery = rawValue.trim();
-      const rawKeywords = rawQuery ? rawQuery.split(/\s+/).filter(Boolean) : [];
-      const keywords = rawKeywords.map((keyword) => keyword.toLowerCase());
-      let matches = 0;
-      const hasQueryChanged = rawQuery !== lastQuery;
-      lastQuery = rawQuery;
-
-      cards.forEach((card) => {
-        const haystack = card.dataset.searchText || "";
-        const isMatch = keywords.every((keyword) => haystack.includes(keyword));
-        card.classList.toggle("is-hidden", !isMatch);
-        if (isMatch) {
-          card.style.setProperty("--stagger-index", String(matches));
-          card.classList.add("is-revealed");
-          matches += 1;
-        } else {
-          card.classList.remove("is-revealed");
-          card.style.removeProperty("--stagger-index");
-        }
+    const bindPageLinks = (container) => {
+      container?.querySelectorAll("[data-venues-page-link]").forEach((link) => {
+        link.addEventListener("click", (event) => {
+          event.preventDefault();
+          loadResults(link.href, { animation: "is-entering" });
+          page.querySelector(".venues-toolbar")?.scrollIntoView({
+            behavior: "smooth",
+            block: "start",
+          });
+        });
       });
+    };
 
-      renderTokens(rawKeywords);
-      updateMetaState(rawKeywords, matches);
-
-      if (emptyState) {
-        const shouldShowEmptyState = rawKeywords.length > 0 && matches === 0;
-        emptyState.hidden = !shouldShowEmptyState;
+    // The server filters and paginates; swap in just the results region so the
+    // search field keeps focus while the user is typing.
+    const loadResults = async (url, { animation = "is-searching" } = {}) => {
+      if (!results) {
+        window.location.href = url;
+        return;
       }
-      if (grid) {
-        grid.classList.toggle("is-filtering", rawKeywords.length > 0);
-        grid.dataset.matches = String(matches);
-        if (hasQueryChanged && rawKeywords.length > 0) {
-          playGridAnimation("is-searching", { removeAfter: true });
-        } else if (hasQueryChanged && rawKeywords.length === 0) {
-          playGridAnimation("is-entering", { removeAfter: true });
+
+      const requestId = ++activeRequest;
+      results.classList.add("is-loading");
+
+      try {
+        const fragment = await fetchFragment(url);
+        if (requestId !== activeRequest) {
+          return;
+        }
+        const nextResults = fragment.querySelector("[data-venues-results]");
+        if (!nextResults) {
+          throw new Error("Results missing");
+        }
+        results.replaceWith(nextResults);
+        results = nextResults;
+        history.replaceState({ url }, "", url);
+        registerAnimatedElements(results);
+        attachAjaxLinks(results);
+        bindPageLinks(results);
+        renderQueryLabel(keywordsFor(input?.value || ""));
+        playGridAnimation(animation, { removeAfter: true });
+      } catch (error) {
+        if (requestId === activeRequest) {
+          window.location.href = url;
         }
       }
     };
 
+    const runSearch = () => {
+      window.clearTimeout(searchTimer);
+      lastQuery = (input?.value || "").trim();
+      loadResults(buildResultsUrl());
+    };
+
     if (form) {
-      form.addEventListener("submit", (event) => event.preventDefault());
+      form.addEventListener("submit", (event) => {
+        event.preventDefault();
+        runSearch();
+      });
     }
 
     if (input) {
       input.addEventListener("input", () => {
-        window.requestAnimationFrame(filterCards);
+        renderTokens(keywordsFor(input.value));
+        window.clearTimeout(searchTimer);
+        searchTimer = window.setTimeout(() => {
+          if (input.value.trim() !== lastQuery) {
+            runSearch();
+          }
+        }, 250);
       });
     }
 
-    filterCards();
+    if (typeSelect) {
+      typeSelect.addEventListener("change", runSearch);
+    }
+
+    renderTokens(keywordsFor(input?.value || ""));
+    renderQueryLabel(keywordsFor(input?.value || ""));
+    bindPageLinks(results);
+
     const triggerInitialEntrance = () => {
       playGridAnimation("is-entering", { removeAfter: true });
     };
@@ -562,22 +584,14 @@ document.addEventListener("DOMContentLoaded", () => {
       return;
     }
 
+    const searchForm = page.querySelector("[data-bookings-search]");
     const searchInput = page.querySelector("[data-bookings-input]");
-    let rows = Array.from(page.querySelectorAll("[data-booking-row]"));
     const csrfInput = page.querySelector("[data-csrf-token]");
-    const emptyState = page.querySelector("[data-bookings-empty]");
-    const meta = page.querySelector("[data-bookings-meta]");
-    const defaultLabel = meta?.querySelector("[data-bookings-meta-default]");
-    const filterLabel = meta?.querySelector("[data-bookings-meta-filter]");
-    const countEl = meta?.querySelector("[data-bookings-count]");
-    const matchedEl = meta?.querySelector("[data-bookings-matched]");
-    const totalEl = meta?.querySelector("[data-bookings-total]");
-    const queryEl = meta?.querySelector("[data-bookings-query]");
-    const total = Number(meta?.dataset.total || rows.length);
-
-    if (totalEl) {
-      totalEl.textContent = String(total);
-    }
+    let meta = page.querySelector("[data-bookings-meta]");
+    let results = page.querySelector("[data-bookings-results]");
+    let lastQuery = (searchInput?.value || "").trim();
+    let searchTimer = null;
+    let activeRequest = 0;
 
     const animateRows = (visibleRows) => {
       if (!visibleRows.length) {
@@ -614,44 +628,70 @@ document.addEventListener("DOMContentLoaded", () => {
       });
     };
 
-    const applyFilter = ({ animate = false } = {}) => {
+    const buildSearchUrl = () => {
+      const base = searchForm?.getAttribute("action") || window.location.pathname;
       const rawQuery = (searchInput?.value || "").trim();
-      const query = rawQuery.toLowerCase();
-      let visible = 0;
-      const visibleRows = [];
-
-      rows.forEach((row) => {
-        const haystack = row.dataset.searchText || "";
-        const matches = !query || haystack.includes(query);
-        row.hidden = !matches;
-        if (matches) {
-          visible += 1;
-          visibleRows.push(row);
-        }
-      });
+      return rawQuery ? `${base}?${new URLSearchParams({ q: rawQuery })}` : base;
+    };
 
-      if (countEl) {
-        countEl.textContent = String(visible);
-      }
-      if (matchedEl) {
-        matchedEl.textContent = String(visible);
-      }
-      if (defaultLabel) {
-        defaultLabel.hidden = Boolean(rawQuery);
-      }
-      if (filterLabel) {
-        filterLabel.hidden = !rawQuery;
-        filterLabel.setAttribute("aria-hidden", rawQuery ? "false" : "true");
+    // Search and "load more" both come from the server, which filters and
+    // pages the bookings; the rows below are only ever one page at a time.
+    const loadResults = async (url) => {
+      if (!results) {
+        window.location.href = url;
+        return;
       }
-      if (queryEl) {
-        queryEl.textContent = rawQuery;
+
+      const requestId = ++activeRequest;
+      results.classList.add("is-loading");
+
+      try {
+        const fragment = await fetchFragment(url);
+        if (requestId !== activeRequest) {
+          return;
+        }
+        const nextResults = fragment.querySelector("[data-bookings-results]");
+        const nextMeta = fragment.querySelector("[data-bookings-meta]");
+        if (!nextResults) {
+          throw new Error("Results missing");
+        }
+        results.replaceWith(nextResults);
+        results = nextResults;
+        if (meta && nextMeta) {
+          meta.replaceWith(nextMeta);
+          meta = nextMeta;
+        }
+        history.replaceState({ url }, "", url);
+        animateRows(Array.from(results.querySelectorAll("[data-booking-row]")));
+      } catch (error) {
+        if (requestId === activeRequest) {
+          window.location.href = url;
+        }
       }
-      if (emptyState) {
-        emptyState.hidden = visible > 0;
+    };
+
+    const loadMore = async (link) => {
+      const url = link.getAttribute("href");
+      const rowsBody = results?.querySelector("[data-bookings-rows]");
+      const moreEl = link.closest("[data-bookings-more]");
+      if (!url || !rowsBody) {
+        return;
       }
 
-      if (animate) {
-        animateRows(visibleRows);
+      link.setAttribute("aria-busy", "true");
+      try {
+        const fragment = await fetchFragment(url);
+        const newRows = Array.from(fragment.querySelectorAll("[data-booking-row]"));
+        newRows.forEach((row) => rowsBody.appendChild(row));
+        const nextMore = fragment.querySelector("[data-bookings-more]");
+        if (nextMore) {
+          moreEl?.replaceWith(nextMore);
+        } else {
+          moreEl?.remove();
+        }
+        animateRows(newRows);
+      } catch (error) {
+        window.location.href = url;
       }
     };
 
@@ -670,9 +710,25 @@ document.addEventListener("DOMContentLoaded", () => {
       return "Something went wrong.";
     };
 
+    if (searchForm) {
+      searchForm.addEventListener("submit", (event) => {
+        event.preventDefault();
+        window.clearTimeout(searchTimer);
+        lastQuery = (searchInput?.value || "").trim();
+        loadResults(buildSearchUrl());
+      });
+    }
+
     if (searchInput) {
       searchInput.addEventListener("input", () => {
-        applyFilter();
+        window.clearTimeout(searchTimer);
+        searchTimer = window.setTimeout(() => {
+          const rawQuery = searchInput.value.trim();
+          if (rawQuery !== lastQuery) {
+            lastQuery = rawQuery;
+            loadResults(buildSearchUrl());
+          }
+        }, 250);
       });
     }
 
@@ -713,6 +769,15 @@ document.addEventListener("DOMContentLoaded", () => {
 
     page.addEventListener("click", async (event) => {
       const target = event.target instanceof Element ? event.target : null;
+      const moreLink = target?.closest?.("[data-bookings-more-link]");
+      if (moreLink && page.contains(moreLink)) {
+        event.preventDefault();
+        if (moreLink.getAttribute("aria-busy") !== "true") {
+          await loadMore(moreLink);
+        }
+        return;
+      }
+
       const button = target?.closest?.("[data-booking-cancel]");
       if (!button || !page.contains(button)) {
         return;
@@ -724,7 +789,7 @@ document.addEventListener("DOMContentLoaded", () => {
       await handleCancel(button);
     });
 
-    applyFilter({ animate: true });
+    animateRows(Array.from(page.querySelectorAll("[data-booking-row]")));
     page.dataset.initialised = "true";
   };
 
@@ -741,6 +806,9 @@ document.addEventListener("DOMContentLoaded", () => {
     const commentDeleteTemplate = page.dataset.commentDeleteTemplate || "";
     const bookingForm = page.querySelector("[data-booking-form]");
     const bookingError = page.querySelector("[data-booking-error]");
+    const bookingAvailability = page.querySelector("[data-booking-availability]");
+    const availabilityUrl = page.dataset.availabilityUrl || "";
+    let bookedRanges = [];
     const bookingModal = document.querySelector('[data-booking-modal]');
     const bookingModalError = bookingModal?.querySelector('[data-booking-modal-error]');
     const bookingConfirmButton = bookingModal?.querySelector('[data-booking-confirm]');
@@ -1367,6 +1435,45 @@ document.addEventListener("DOMContentLoaded", () => {
       "+62 821-6654-902",
     ];
 
+    const renderAvailability = () => {
+      if (!bookingAvailability) {
+        return;
+      }
+      if (!bookedRanges.length) {
+        bookingAvailability.textContent = "";
+        bookingAvailability.hidden = true;
+        return;
+      }
+      const labels = bookedRanges.map(({ start, end }) => formatDateRange(start, end));
+      bookingAvailability.textContent = `Already booked: ${labels.join(", ")}.`;
+      bookingAvailability.hidden = false;
+    };
+
+    const loadAvailability = async () => {
+      if (!availabilityUrl) {
+        return;
+      }
+      try {
+        const response = await fetch(availabilityUrl, {
+          credentials: "same-origin",
+          headers: { "X-Requested-With": "XMLHttpRequest" },
+        });
+        const payload = await response.json();
+        const ranges = Array.isArray(payload?.data?.ranges) ? payload.data.ranges : [];
+        bookedRanges = ranges
+          .map(([start, end]) => ({ start: parseISODate(start), end: parseISODate(end) }))
+          .filter(({ start, end }) => start && end);
+      } catch (error) {
+        bookedRanges = [];
+      }
+      renderAvailability();
+    };
+
+    const findBookedOverlap = (startDate, endDate) =>
+      bookedRanges.find(({ start, end }) => start <= endDate && end >= startDate) || null;
+
+    loadAvailability();
+
     if (bookingForm && bookingModal && bookingConfirmButton) {
       bookingForm.addEventListener("submit", (event) => {
         event.preventDefault();
@@ -1390,6 +1497,15 @@ document.addEventListener("DOMContentLoaded", () => {
           return;
         }
 
+        const overlap = findBookedOverlap(startDate, endDate);
+        if (overlap) {
+          showMessage(
+            bookingError,
+            `This venue is already booked for ${formatDateRange(overlap.start, overlap.end)}.`
+          );
+          return;
+        }
+
         pendingBookingData = {
           formData,
           nights: duration,
@@ -1426,6 +1542,7 @@ document.addEventListener("DOMContentLoaded", () => {
           await submitForm(bookingForm.action, pendingBookingData.formData);
           bookingForm.reset();
           closeModal(bookingModal);
+          loadAvailability();
           const phone =
             randomPhoneNumbers[
               Math.floor(Math.random() * randomPhoneNumbers.length)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import re
+
+from django.core.files.storage import FileSystemStorage
+
+HASHED_NAME_PATTERN = re.compile(r"(?:^|/)[0-9a-f]{2}/[0-9a-f]{64}(?:\.[\w]+)?$")
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """File storage that names every file after the SHA-256 of its bytes.
+
+    ``venues/photo.jpg`` is stored as ``venues/ab/abcd….jpg``. Saving bytes
+    that are already stored returns the existing name, only refreshing its
+    mtime, so repeated uploads of one image share a single file. Files are
+    never removed when a referencing row goes away; ``gc_venue_images``
+    collects the ones nothing points at.
+    """
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        hexdigest = digest.hexdigest()
+        extension = posixpath.splitext(name)[1].lower()
+        hashed_name = posixpath.join(
+            posixpath.dirname(name), hexdigest[:2], f"{hexdigest}{extension}"
+        )
+        while not self._refresh(hashed_name):
+            try:
+                return super()._save(hashed_name, content)
+            except FileExistsError:
+                # An identical upload was written since the check above.
+                continue
+        return hashed_name
+
+    def _refresh(self, name: str) -> bool:
+        """Mark a stored copy as just used; return False if there is none.
+
+        Bumping the mtime keeps ``gc_venue_images --min-age`` from deleting an
+        orphan that a new row is about to reference again.
+        """
+
+        try:
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is chosen from the content in ``_save``. A hashed name
+        # that exists already holds the same bytes, so raise rather than let
+        # FileSystemStorage._save retry that name forever.
+        if is_content_addressed(name) and self.exists(name):
+            raise FileExistsError(name)
+        return name
+
+
+def is_content_addressed(name: str) -> bool:
+    return bool(HASHED_NAME_PATTERN.search(name))
+
+
+def venue_image_storage() -> ContentAddressedStorage:
+    return ContentAddressedStorage()
@@ -1,3 +1,367 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connections
+from django.db.models import Sum
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from .availability import (
+    BookingConflict,
+    create_booking,
+    find_conflicting_slot,
+    sync_booking_slot,
+)
+from .bulk_bookings import create_booking_batch
+from .forms import BookingForm
+from .leaderboard import rebuild_leaderboard
+from .models import (
+    Booking,
+    BookingDate,
+    Comment,
+    CommentVenue,
+    DailyVenueSales,
+    Venue,
+    VenueRatingSummary,
+    VenueSlot,
+)
+from .ratings import rebuild_rating_summaries
+from .rollups import rebuild_sales_rollups
+
+
+def _venue(title: str) -> Venue:
+    return Venue.objects.create(
+        title=title,
+        type=Venue.VenueType.FUTSAL,
+        description="Test venue.",
+        facilities=[],
+        location="Testville",
+        price=100,
+    )
+
+
+def _rating_state() -> tuple[dict, dict]:
+    """Return the stored summaries (venues with ratings) and rating averages."""
+
+    summaries = {
+        summary.venue_id: (
+            summary.rating_count,
+            summary.rating_sum,
+            *summary.histogram.values(),
+        )
+        for summary in VenueRatingSummary.objects.filter(rating_count__gt=0)
+    }
+    averages = dict(Venue.objects.values_list("id", "rating_average"))
+    return summaries, averages
+
+
+class RatingSummaryTests(TestCase):
+    """Incremental rating summaries must match a rebuild after every write path."""
+
+    def setUp(self):
+        User = get_user_model()
+        self.author = User.objects.create_user("author", "author@example.com")
+        self.other = User.objects.create_user("other", "other@example.com")
+        self.first = _venue("First venue")
+        self.second = _venue("Second venue")
+
+    def _comment(self, user, rating: int, *venues) -> Comment:
+        comment = Comment.objects.create(user=user, rating=rating, comment="Nice.")
+        for venue in venues:
+            CommentVenue.objects.create(comment=comment, venue=venue)
+        return comment
+
+    def assertMatchesRebuild(self):
+        incremental = _rating_state()
+        rebuild_rating_summaries()
+        self.assertEqual(incremental, _rating_state())
+
+    def test_links_created_and_added(self):
+        self._comment(self.author, 5, self.first)
+        comment = self._comment(self.other, 2)
+        comment.venue.add(self.first, self.second)
+        self.second.comments.add(self._comment(self.author, 4))
+        self.assertEqual(self.first.rating_summary.rating_count, 2)
+        self.assertMatchesRebuild()
+
+    def test_rating_changed(self):
+        comment = self._comment(self.author, 5, self.first, self.second)
+        comment.rating = 1
+        comment.save()
+        summary = VenueRatingSummary.objects.get(venue=self.second)
+        self.assertEqual((summary.rating_sum, summary.stars_1), (1, 1))
+        self.assertMatchesRebuild()
+
+    def test_comment_deleted(self):
+        self._comment(self.other, 3, self.first)
+        self._comment(self.author, 5, self.first, self.second).delete()
+        self.assertMatchesRebuild()
+
+    def test_links_removed_and_cleared(self):
+        comment = self._comment(self.author, 4, self.first, self.second)
+        comment.venue.remove(self.first)
+        self.assertMatchesRebuild()
+        comment.venue.clear()
+        self.assertMatchesRebuild()
+
+    def test_user_deleted(self):
+        self._comment(self.author, 5, self.first, self.second)
+        self._comment(self.author, 1, self.second)
+        self._comment(self.other, 3, self.second)
+        self.author.delete()
+        self.assertEqual(
+            VenueRatingSummary.objects.get(venue=self.second).rating_count, 1
+        )
+        self.assertMatchesRebuild()
+
+    def test_venue_deleted(self):
+        self._comment(self.author, 5, self.first, self.second)
+        self.first.delete()
+        self.assertFalse(VenueRatingSummary.objects.filter(venue_id=self.first.pk))
+        self.assertMatchesRebuild()
+
+
+def _booking_counters() -> tuple[list, dict]:
+    """Return the stored sales rollups and venue booking counts."""
+
+    rollups = list(
+        DailyVenueSales.objects.filter(bookings__gt=0)
+        .order_by("date", "venue_id")
+        .values_list("date", "venue_id", "bookings", "revenue")
+    )
+    counts = dict(Venue.objects.values_list("id", "booking_count"))
+    return rollups, counts
+
+
+class BookingCounterTests(TestCase):
+    """Sales rollups and venue booking counts must match a rebuild."""
+
+    def setUp(self):
+        User = get_user_model()
+        self.guest = User.objects.create_user("guest", "guest@example.com")
+        self.other = User.objects.create_user("other", "other@example.com")
+        self.first = _venue("First venue")
+        self.second = _venue("Second venue")
+        self.start = timezone.localdate() + timedelta(days=1)
+
+    def _book(self, user, venue, offset: int) -> Booking:
+        start_date = self.start + timedelta(days=offset)
+        return create_booking(
+            user=user, venue=venue, start_date=start_date, end_date=start_date
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = _booking_counters()
+        rebuild_sales_rollups()
+        rebuild_leaderboard()
+        self.assertEqual(incremental, _booking_counters())
+
+    def test_paid_moved_and_deleted(self):
+        paid = self._book(self.guest, self.first, 0)
+        paid.has_been_paid = True
+        paid.save()
+        moved = self._book(self.guest, self.first, 1)
+        moved.has_been_paid = True
+        moved.save()
+        moved.venue = self.second
+        moved.save()
+        self._book(self.other, self.second, 2).delete()
+        self.assertEqual(
+            DailyVenueSales.objects.aggregate(total=Sum("bookings"))["total"], 2
+        )
+        self.assertMatchesRebuild()
+
+    def test_user_deleted(self):
+        for offset in range(3):
+            booking = self._book(self.guest, self.first, offset)
+            booking.has_been_paid = True
+            booking.save()
+        self._book(self.other, self.first, 5)
+        self.guest.delete()
+        self.assertEqual(Venue.objects.get(pk=self.first.pk).booking_count, 1)
+        self.assertMatchesRebuild()
+
+
+class BookingStartDateTests(TestCase):
+    """``Booking.start_date`` must follow the booking's date row."""
+
+    def setUp(self):
+        self.guest = get_user_model().objects.create_user("guest", "guest@example.com")
+        self.venue = _venue("First venue")
+        self.start = timezone.localdate() + timedelta(days=1)
+
+    def assertStartDatesMatch(self):
+        self.assertEqual(
+            list(Booking.objects.order_by("id").values_list("start_date", flat=True)),
+            list(
+                Booking.objects.order_by("id").values_list(
+                    "date__start_date", flat=True
+                )
+            ),
+        )
+
+    def test_write_paths(self):
+        booking = create_booking(
+            user=self.guest,
+            venue=self.venue,
+            start_date=self.start,
+            end_date=self.start,
+        )
+        self.assertEqual(booking.start_date, self.start)
+        create_booking_batch(
+            [
+                {
+                    "username": "guest",
+                    "venue": self.venue.pk,
+                    "start_date": (self.start + timedelta(days=5)).isoformat(),
+                    "end_date": (self.start + timedelta(days=6)).isoformat(),
+                }
+            ]
+        )
+        self.assertStartDatesMatch()
+
+        moved = self.start + timedelta(days=10)
+        form = BookingForm(
+            {
+                "username": "guest",
+                "venue": self.venue.pk,
+                "notes": "",
+                "start_date": moved.isoformat(),
+                "end_date": moved.isoformat(),
+            },
+            instance=Booking.objects.get(pk=booking.pk),
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(Booking.objects.get(pk=booking.pk).start_date, moved)
+
+        booking.date.start_date = moved - timedelta(days=1)
+        booking.date.save()
+        self.assertStartDatesMatch()
+
+
+class OverlappingSlotTests(TestCase):
+    """Venues flagged for overlapping slots are checked with a range scan."""
+
+    def setUp(self):
+        self.guest = get_user_model().objects.create_user("guest", "guest@example.com")
+        self.venue = _venue("First venue")
+        self.start = timezone.localdate() + timedelta(days=1)
+
+    def _legacy_booking(self, first_day: int, last_day: int) -> Booking:
+        # Written the way bookings were before overlap checks existed.
+        booking = Booking.objects.create(
+            user=self.guest,
+            venue=self.venue,
+            date=BookingDate.objects.create(
+                start_date=self.start + timedelta(days=first_day),
+                end_date=self.start + timedelta(days=last_day),
+            ),
+        )
+        sync_booking_slot(booking)
+        return booking
+
+    def test_nested_slot_is_found(self):
+        outer = self._legacy_booking(0, 10)
+        # Both index seeks land on the nested slots either side of the range.
+        self._legacy_booking(2, 3)
+        self._legacy_booking(8, 9)
+        Venue.objects.filter(pk=self.venue.pk).update(has_overlapping_slots=True)
+
+        conflict = find_conflicting_slot(
+            self.venue.pk,
+            self.start + timedelta(days=5),
+            self.start + timedelta(days=6),
+        )
+        self.assertEqual(conflict, outer.slot)
+        self.assertIsNone(
+            find_conflicting_slot(
+                self.venue.pk,
+                self.start + timedelta(days=11),
+                self.start + timedelta(days=12),
+            )
+        )
+
+
+class ConcurrentBookingTests(TransactionTestCase):
+    """Parallel ``create_booking`` calls against the file-backed test database.
+
+    Each thread opens its own connection, so the writers really contend for
+    SQLite's write lock.
+    """
+
+    workers = 8
+    bookings_per_worker = 10
+
+    def setUp(self):
+        self.assertFalse(
+            connections["default"].is_in_memory_db(),
+            "Concurrency tests need a file-backed test database.",
+        )
+        self.user = get_user_model().objects.create_user(
+            "concurrent", "concurrent@example.com"
+        )
+        self.venues = [_venue(f"Concurrent venue {number}") for number in range(3)]
+        self.start = timezone.localdate() + timedelta(days=1)
+
+    def _run(self, book) -> list:
+        def worker(number):
+            try:
+                return book(number)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(worker, range(self.workers)))
+
+    def test_no_write_is_lost(self):
+        def book(worker):
+            created, errors = 0, []
+            for index in range(self.bookings_per_worker):
+                # Workers interleave over the venues with ranges that never overlap.
+                sequence = index * self.workers + worker
+                start_date = self.start + timedelta(
+                    days=2 * (sequence // len(self.venues))
+                )
+                try:
+                    create_booking(
+                        user=self.user,
+                        venue=self.venues[sequence % len(self.venues)],
+                        start_date=start_date,
+                        end_date=start_date + timedelta(days=1),
+                    )
+                except DatabaseError as exc:
+                    errors.append(str(exc))
+                else:
+                    created += 1
+            return created, errors
+
+        results = self._run(book)
+        expected = self.workers * self.bookings_per_worker
+        self.assertEqual([error for _, errors in results for error in errors], [])
+        self.assertEqual(sum(created for created, _ in results), expected)
+        self.assertEqual(Booking.objects.count(), expected)
+        self.assertEqual(VenueSlot.objects.count(), expected)
+        self.assertEqual(
+            Venue.objects.aggregate(total=Sum("booking_count"))["total"], expected
+        )
+
+    def test_same_dates_are_booked_once(self):
+        venue = self.venues[0]
+
+        def book(worker):
+            try:
+                create_booking(
+                    user=self.user,
+                    venue=venue,
+                    start_date=self.start,
+                    end_date=self.start + timedelta(days=2),
+                )
+            except BookingConflict:
+                return False
+            return True
+
+        self.assertEqual(sum(self._run(book)), 1)
+        self.assertEqual(VenueSlot.objects.filter(venue=venue).count(), 1)
+        self.assertEqual(Venue.objects.get(pk=venue.pk).booking_count, 1)
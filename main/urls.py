@@ -39,13 +39,33 @@ urlpatterns = [
         views.venue_booking_create_api,
         name="venue_booking_create_api",
     ),
+    path(
+        "api/venues/<int:pk>/availability/",
+        views.venue_availability_api,
+        name="venue_availability_api",
+    ),
     path(
         "api/bookings/<int:pk>/cancel/",
         views.booking_cancel_api,
         name="booking_cancel_api",
     ),
     path("api/bookings/", views.bookings_list_api, name="bookings_list_api"),
+    path(
+        "api/bookings/analytics/",
+        views.bookings_analytics_api,
+        name="bookings_analytics_api",
+    ),
+    path(
+        "api/bookings/export/",
+        views.bookings_export_api,
+        name="bookings_export_api",
+    ),
     path("api/bookings/create/", views.bookings_create_api, name="bookings_create_api"),
+    path(
+        "api/bookings/batch/",
+        views.bookings_batch_create_api,
+        name="bookings_batch_create_api",
+    ),
     path("api/bookings/<int:pk>/update/", views.bookings_update_api, name="bookings_update_api"),
     path("api/bookings/<int:pk>/delete/", views.bookings_delete_api, name="bookings_delete_api"),
     path("api/users/search/", views.users_search_api, name="users_search_api"),
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from .cache_versions import USER_DIRECTORY, data_version
+
+# The index is rebuilt once the user directory version moves on, which also
+# catches users saved by other processes when the cache is shared. With a
+# per-process cache each process still rebuilds its copy this often.
+USER_INDEX_MAX_AGE = 300
+
+_lock = threading.RLock()
+_entries: list[tuple[str, int]] = []
+_by_username: list[tuple[str, int]] = []
+_users: dict = {}
+_user_terms: dict[int, list[str]] = {}
+_built_at: float | None = None
+_built_version: int | None = None
+_warming = False
+
+
+def _terms_for(user) -> list[str]:
+    terms = set()
+    for value in (user.get_username(), user.email, user.first_name, user.last_name):
+        value = (value or "").strip().lower()
+        if not value:
+            continue
+        terms.add(value)
+        terms.update(value.split())
+    full_name = user.get_full_name().strip().lower()
+    if full_name:
+        terms.add(full_name)
+    email = (user.email or "").strip().lower()
+    if "@" in email:
+        terms.add(email.split("@", 1)[1])
+    return sorted(terms)
+
+
+def _remove_locked(user_id: int) -> None:
+    for term in _user_terms.pop(user_id, []):
+        position = bisect_left(_entries, (term, user_id))
+        if position < len(_entries) and _entries[position] == (term, user_id):
+            del _entries[position]
+    user = _users.pop(user_id, None)
+    if user is not None:
+        key = (user.get_username(), user_id)
+        position = bisect_left(_by_username, key)
+        if position < len(_by_username) and _by_username[position] == key:
+            del _by_username[position]
+
+
+def _add_locked(user) -> None:
+    terms = _terms_for(user)
+    for term in terms:
+        insort(_entries, (term, user.pk))
+    _user_terms[user.pk] = terms
+    _users[user.pk] = user
+    insort(_by_username, (user.get_username(), user.pk))
+
+
+def is_warm() -> bool:
+    return (
+        _built_at is not None
+        and time.monotonic() - _built_at < USER_INDEX_MAX_AGE
+        and _built_version == data_version(USER_DIRECTORY)
+    )
+
+
+def warm_user_index() -> None:
+    """Load every user into the prefix index, replacing what was there."""
+
+    global _built_at, _built_version
+
+    # Read before loading, so a change made meanwhile leaves the index stale.
+    version = data_version(USER_DIRECTORY)
+    User = get_user_model()
+    users = list(
+        User.objects.only("id", User.USERNAME_FIELD, "email", "first_name", "last_name")
+    )
+    entries: list[tuple[str, int]] = []
+    user_terms: dict[int, list[str]] = {}
+    for user in users:
+        terms = _terms_for(user)
+        user_terms[user.pk] = terms
+        entries.extend((term, user.pk) for term in terms)
+    entries.sort()
+
+    with _lock:
+        _entries[:] = entries
+        _user_terms.clear()
+        _user_terms.update(user_terms)
+        _users.clear()
+        _users.update((user.pk, user) for user in users)
+        _by_username[:] = sorted((user.get_username(), user.pk) for user in users)
+        _built_at = time.monotonic()
+        _built_version = version
+
+
+def _warm_in_background() -> None:
+    global _warming
+
+    try:
+        warm_user_index()
+    finally:
+        connection.close()
+        with _lock:
+            _warming = False
+
+
+def request_warm() -> None:
+    """Rebuild the index off the request path unless a rebuild is running."""
+
+    global _warming
+
+    with _lock:
+        if _warming:
+            return
+        _warming = True
+    threading.Thread(target=_warm_in_background, daemon=True).start()
+
+
+def index_user(user) -> None:
+    if _built_at is None:
+        return
+    with _lock:
+        _remove_locked(user.pk)
+        _add_locked(user)
+
+
+def unindex_user(user_id: int) -> None:
+    if _built_at is None:
+        return
+    with _lock:
+        _remove_locked(user_id)
+
+
+def search_users(query: str, *, limit: int = 10) -> list | None:
+    """Users with any indexed term starting with ``query``, by username.
+
+    Returns ``None`` while the index is cold so callers can fall back to the
+    database; a rebuild is started in the background in that case.
+    """
+
+    if not is_warm():
+        request_warm()
+        return None
+
+    prefix = query.strip().lower()
+    with _lock:
+        start = bisect_left(_entries, (prefix, 0))
+        end = bisect_left(_entries, (prefix + "\U0010ffff", 0))
+        # Short prefixes match most users; walking users in username order
+        # and stopping at ``limit`` hits is then cheaper than sorting them all.
+        if (end - start) ** 2 > limit * len(_users):
+            users = []
+            for _, user_id in _by_username:
+                if any(term.startswith(prefix) for term in _user_terms[user_id]):
+                    users.append(_users[user_id])
+                    if len(users) == limit:
+                        break
+            return users
+        matched = {user_id for _, user_id in _entries[start:end]}
+        users = [_users[user_id] for user_id in matched]
+    return heapq.nsmallest(limit, users, key=lambda user: (user.get_username(), user.pk))
+
+
+def has_users() -> bool | None:
+    if not is_warm():
+        return None
+    return bool(_users)
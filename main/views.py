@@ -1,26 +1,73 @@
 from __future__ import annotations
 
-import re
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, timedelta
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate, get_user_model, login, logout
 from django.contrib.auth.decorators import login_required
 
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
 from django.core.paginator import Paginator
-from django.db.models import Avg, Case, CharField, Count, Q, Sum, Value, When
-from django.db.models.functions import Cast, Coalesce, Concat
+from django.db import transaction
+from django.db.models import (
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Q,
+    Sum,
+)
+from django.db.models.functions import Coalesce, NullIf
 from django.http import (
     HttpRequest,
     HttpResponse,
     HttpResponseForbidden,
     JsonResponse,
+    StreamingHttpResponse,
 )
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import urlencode
 from django.utils.html import json_script
 from django.views.decorators.csrf import ensure_csrf_cookie
-from django.views.decorators.http import require_GET, require_POST
-
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET, require_POST
+
+from . import user_index
+from .async_reads import async_condition, gather_reads, resolve_user
+from .availability import (
+    MAX_CALENDAR_DAYS,
+    BookingConflict,
+    create_booking,
+    occupancy_bitmap,
+    occupied_ranges,
+)
+from .bulk_bookings import MAX_BATCH_SIZE, BookingBatchError, create_booking_batch
+from .cache_versions import (
+    BOOKING_DATA,
+    USER_BOOKINGS,
+    USER_DIRECTORY,
+    VENUE_CATALOGUE,
+    VENUE_RATINGS,
+    adata_versions,
+    data_version,
+    user_scope,
+)
+from .db_routing import (
+    REPLICA_DB_ALIAS,
+    cache_placement,
+    current_read_alias,
+    reads_from_replica,
+    replica_reads,
+)
+from .exports import EXPORT_FORMATS, aiter_booking_export, iter_booking_export
+from .expressions import booking_duration_days
 from .forms import (
     BookingForm,
     CommentForm,
@@ -28,12 +75,41 @@ from .forms import (
     SignupForm,
     VenueForm,
 )
-from .models import Booking, BookingDate, Comment, CommentVenue, Venue
-from .sample_data import ensure_sample_data
+from .fragment_cache import (
+    acached_fragment,
+    fragment_key,
+    fragment_slot,
+    personalize_fragment,
+)
+from .images import image_sources
+from .leaderboard import leaderboard_venues
+from .models import (
+    Booking,
+    Comment,
+    CommentVenue,
+    DailyVenueSales,
+    Venue,
+)
+from .ratings import rating_stats_for_venue
+from .rollups import reprice_venue_sales
+from .sample_data import aensure_sample_data_seeded, ensure_sample_data_seeded
+from .search import (
+    RankedVenueIds,
+    filter_bookings,
+    filter_venues,
+    venue_fts_available,
+)
 
 
 DEFAULT_PAGE_SIZE = 6
 MAX_PAGE_SIZE = 50
+VENUES_PAGE_SIZE = 12
+BOOKINGS_PAGE_SIZE = 20
+TOP_VENUES_LIMIT = 3
+DEFAULT_CALENDAR_DAYS = 90
+ANALYTICS_CACHE_TIMEOUT = 60 * 60
+VENUE_LIST_ORDERING = ("title", "id")
+BOOKING_LIST_ORDERING = ("-created_at", "-id")
 
 
 def login_page(request: HttpRequest) -> HttpResponse:
@@ -52,54 +128,79 @@ def _is_ajax(request: HttpRequest) -> bool:
     return request.headers.get("x-requested-with") == "XMLHttpRequest"
 
 
-@login_required
-def dashboard(request: HttpRequest) -> HttpResponse:
-    if _user_is_staff(request.user):
-        return redirect("main:admin_panel")
-
-    ensure_sample_data()
-
-    today = timezone.localdate()
-    venues_queryset = _base_venue_queryset().annotate(
-        total_bookings=Count("bookings", distinct=True)
-    )
+def _top_venues() -> list[Venue]:
     top_venues = list(
-        venues_queryset.order_by("-total_bookings", "-average_rating", "title")[:3]
-    )
-
-    total_venues = venues_queryset.count()
-    total_bookings = Booking.objects.count()
-    paid_bookings = Booking.objects.filter(has_been_paid=True).count()
-    upcoming_bookings = (
-        Booking.objects.filter(date__start_date__gte=today).count()
+        leaderboard_venues(
+            _base_venue_queryset().annotate(total_bookings=F("booking_count")),
+            TOP_VENUES_LIMIT,
+        )
     )
-    unique_players = (
-        Booking.objects.exclude(user=None).values("user_id").distinct().count()
+    for venue in top_venues:
+        venue.image_sources = image_sources(venue)
+    return top_venues
+
+
+async def _build_dashboard_snapshot(today: date) -> dict[str, object]:
+    booking_totals, venue_totals, top_venues = await gather_reads(
+        lambda: Booking.objects.aggregate(
+            total_bookings=Count("id"),
+            paid_bookings=Count("id", filter=Q(has_been_paid=True)),
+            upcoming_bookings=Count("id", filter=Q(date__start_date__gte=today)),
+            unique_players=Count("user", distinct=True),
+        ),
+        lambda: Venue.objects.aggregate(
+            total_venues=Count("id"),
+            rating_sum=Sum("rating_summary__rating_sum"),
+            rating_count=Sum("rating_summary__rating_count"),
+        ),
+        _top_venues,
     )
-    overall_rating = Venue.objects.aggregate(
-        average=Avg("comments__rating")
-    )["average"]
-
+    rating_count = venue_totals["rating_count"] or 0
     metrics = {
-        "total_venues": total_venues,
-        "total_bookings": total_bookings,
-        "paid_bookings": paid_bookings,
-        "upcoming_bookings": upcoming_bookings,
-        "unique_players": unique_players,
-        "overall_rating": overall_rating,
+        **booking_totals,
+        "total_venues": venue_totals["total_venues"],
+        "overall_rating": (
+            venue_totals["rating_sum"] / rating_count if rating_count else None
+        ),
     }
+    return {"metrics": metrics, "top_venues": top_venues}
 
-    context = {
-        "metrics": metrics,
-        "top_venues": top_venues,
-    }
 
-    template = (
-        "main/partials/landing_fragment.html"
-        if _is_ajax(request)
-        else "main/landing.html"
+async def _render_fragment_page(
+    request: HttpRequest, page_template: str, fragment: str, **context
+) -> HttpResponse:
+    """Return ``fragment`` alone to AJAX navigation, else inside its page."""
+
+    if _is_ajax(request):
+        return HttpResponse(fragment)
+    return await sync_to_async(render)(
+        request, page_template, {"fragment": fragment, **context}
+    )
+
+
+@login_required
+@reads_from_replica
+async def dashboard(request: HttpRequest) -> HttpResponse:
+    if _user_is_staff(await resolve_user(request)):
+        return redirect("main:admin_panel")
+
+    await aensure_sample_data_seeded()
+
+    today = timezone.localdate()
+    key = fragment_key(
+        "landing",
+        *await adata_versions(BOOKING_DATA, VENUE_RATINGS, VENUE_CATALOGUE),
+        today.isoformat(),
+    )
+    fragment = await acached_fragment(
+        request,
+        key,
+        "main/partials/landing_fragment.html",
+        lambda: _build_dashboard_snapshot(today),
+    )
+    return await _render_fragment_page(
+        request, "main/landing.html", personalize_fragment(request, fragment["html"])
     )
-    return render(request, template, context)
 
 
 def _user_is_staff(user) -> bool:
@@ -112,20 +213,24 @@ def _forbid_if_not_staff(request: HttpRequest) -> HttpResponse | None:
     return None
 
 
+async def _aforbid_if_not_staff(request: HttpRequest) -> HttpResponse | None:
+    if not _user_is_staff(await resolve_user(request)):
+        return HttpResponseForbidden("You do not have permission to access this page.")
+    return None
+
+
 def _serialize_venue(venue: Venue) -> dict[str, object]:
-    average_rating_attr = getattr(venue, "average_rating", None)
+    if hasattr(venue, "rating_count"):
+        average_rating_attr = venue.average_rating
+        rating_count = venue.rating_count or 0
+    else:
+        stats = rating_stats_for_venue(venue.id)
+        average_rating_attr = stats["average_rating"]
+        rating_count = stats["count"]
     average_rating = (
         float(average_rating_attr) if average_rating_attr is not None else None
     )
-    rating_count_attr = getattr(venue, "rating_count", None)
-    rating_count = (
-        int(rating_count_attr)
-        if rating_count_attr is not None
-        else venue.comments.count()
-    )
-    if average_rating is None:
-        average = venue.comments.aggregate(avg=Avg("rating"))["avg"]
-        average_rating = float(average) if average is not None else None
+    image = image_sources(venue)
     return {
         "id": venue.id,
         "title": venue.title,
@@ -135,6 +240,10 @@ def _serialize_venue(venue: Venue) -> dict[str, object]:
         "price": venue.price,
         "location": venue.location,
         "image_url": venue.image.url if venue.image else "",
+        "image_src": image["src"],
+        "image_srcset": image["srcset"],
+        "image_webp_srcset": image["webp_srcset"],
+        "image_thumbnail_url": image["thumbnail"],
         "created_at": venue.created_at.isoformat(),
         "updated_at": venue.updated_at.isoformat(),
         "average_rating": average_rating,
@@ -144,62 +253,40 @@ def _serialize_venue(venue: Venue) -> dict[str, object]:
 
 def _base_venue_queryset():
     return Venue.objects.annotate(
-        average_rating=Avg("comments__rating"),
-        rating_count=Count("comments", distinct=True),
+        average_rating=ExpressionWrapper(
+            F("rating_summary__rating_sum")
+            * 1.0
+            / NullIf(F("rating_summary__rating_count"), 0),
+            output_field=FloatField(),
+        ),
+        rating_count=Coalesce(F("rating_summary__rating_count"), 0),
     )
 
 
-def _normalize_facilities(raw_facilities) -> list[str]:
-    facility_list: list[str] = []
-
-    if isinstance(raw_facilities, (list, tuple, set)):
-        for item in raw_facilities:
-            text = str(item).strip()
-            if text:
-                facility_list.append(text)
-    elif isinstance(raw_facilities, str):
-        segments = re.split(r"[,\n]+", raw_facilities.replace("\r", "\n"))
-        for segment in segments:
-            text = segment.strip()
-            if text:
-                facility_list.append(text)
-    elif raw_facilities:
-        segments = re.split(r"[,\n]+", str(raw_facilities).replace("\r", "\n"))
-        for segment in segments:
-            text = segment.strip()
-            if text:
-                facility_list.append(text)
-
-    return facility_list
-
-
 def _serialize_comment(
     comment: Comment, *, request_user=None
 ) -> dict[str, object]:
-    user_payload = _serialize_user(comment.user)
-    is_owner = bool(request_user and comment.user_id == request_user.id)
-    can_moderate = bool(request_user and _user_is_staff(request_user))
-    return {
+    payload = {
         "id": comment.id,
         "rating": int(comment.rating),
         "comment": comment.comment,
         "date": comment.date.isoformat(),
-        "user": user_payload,
-        "can_edit": is_owner,
-        "can_delete": is_owner or can_moderate,
+        "user": _serialize_user(comment.user),
     }
+    return _with_comment_permissions(payload, request_user)
+
+
+def _with_comment_permissions(
+    payload: dict[str, object], request_user
+) -> dict[str, object]:
+    author = payload["user"]
+    is_owner = bool(request_user and author and author["id"] == request_user.id)
+    can_moderate = bool(request_user and _user_is_staff(request_user))
+    return {**payload, "can_edit": is_owner, "can_delete": is_owner or can_moderate}
 
 
 def _comment_stats_for_venue(venue: Venue) -> dict[str, object]:
-    aggregate = venue.comments.aggregate(
-        average=Avg("rating"),
-        count=Count("id", distinct=True),
-    )
-    average_value = aggregate.get("average")
-    return {
-        "average_rating": float(average_value) if average_value is not None else None,
-        "count": int(aggregate.get("count") or 0),
-    }
+    return rating_stats_for_venue(venue.id)
 
 
 def _serialize_user(user) -> dict[str, object] | None:
@@ -238,25 +325,20 @@ def _serialize_booking(booking: Booking) -> dict[str, object]:
 
 
 def _build_booking_analytics() -> dict[str, dict[str, list]]:
-    paid_bookings = Booking.objects.filter(has_been_paid=True, date_paid__isnull=False)
-
     sales_queryset = (
-        paid_bookings.values("date_paid")
-        .annotate(total_sales=Sum("venue__price"))
-        .order_by("date_paid")
+        DailyVenueSales.objects.values("date")
+        .annotate(total_sales=Sum("revenue"))
+        .order_by("date")
     )
     sales_labels: list[str] = []
     sales_totals: list[int] = []
     for item in sales_queryset:
-        date_value = item.get("date_paid")
-        if date_value is None:
-            continue
-        sales_labels.append(date_value.isoformat())
+        sales_labels.append(item["date"].isoformat())
         sales_totals.append(int(item.get("total_sales") or 0))
 
     popularity_queryset = (
-        paid_bookings.values("venue__title")
-        .annotate(total_bookings=Count("id"))
+        DailyVenueSales.objects.values("venue__title")
+        .annotate(total_bookings=Sum("bookings"))
         .order_by("venue__title")
     )
     popularity_labels: list[str] = []
@@ -272,6 +354,113 @@ def _build_booking_analytics() -> dict[str, dict[str, list]]:
     }
 
 
+def _cached_booking_analytics() -> dict[str, dict[str, list]]:
+    # Aggregates over the whole history tolerate the replica's lag.
+    with replica_reads():
+        key, timeout = cache_placement(
+            f"booking-analytics:{data_version(BOOKING_DATA)}",
+            ANALYTICS_CACHE_TIMEOUT,
+        )
+        return cache.get_or_set(key, _build_booking_analytics, timeout)
+
+
+def _booking_analytics_etag(request: HttpRequest) -> str | None:
+    if not _user_is_staff(request.user):
+        return None
+    with replica_reads():
+        if current_read_alias() == REPLICA_DB_ALIAS:
+            # A lagging replica can build an old payload under the current
+            # version, and an ETag would keep it alive after the replica
+            # catches up. Replica-built payloads are not validated.
+            return None
+    return f"booking-analytics-{data_version(BOOKING_DATA)}"
+
+
+def _list_snapshot(request: HttpRequest, model) -> dict[str, object]:
+    """Return the row count and latest ``updated_at`` behind a list response.
+
+    ``condition`` asks for the ETag and the Last-Modified date separately;
+    memoising on the request lets both share the same two queries. They are
+    kept apart so each stays cheap: a bare ``COUNT(*)`` and a single seek
+    into the ``updated_at`` index, where a combined aggregate scans the table.
+    """
+
+    snapshots = getattr(request, "_list_snapshots", None)
+    if snapshots is None:
+        snapshots = request._list_snapshots = {}
+    if model not in snapshots:
+        snapshots[model] = {
+            "count": model.objects.count(),
+            "last_modified": model.objects.order_by("-updated_at")
+            .values_list("updated_at", flat=True)
+            .first(),
+        }
+    return snapshots[model]
+
+
+def _list_etag(request: HttpRequest, name: str, *parts: object) -> str:
+    params = urlencode(sorted(request.GET.lists()), doseq=True)
+    digest = hashlib.sha1(
+        "|".join([params, *(str(part) for part in parts)]).encode("utf-8")
+    ).hexdigest()
+    return f"{name}-{digest}"
+
+
+def _venues_list_etag(request: HttpRequest) -> str | None:
+    if not _user_is_staff(request.user):
+        return None
+    snapshot = _list_snapshot(request, Venue)
+    # Ratings and image variants reach the payload without touching updated_at.
+    return _list_etag(
+        request,
+        "venues",
+        snapshot["count"],
+        snapshot["last_modified"],
+        data_version(VENUE_RATINGS),
+        data_version(VENUE_CATALOGUE),
+    )
+
+
+def _venues_list_last_modified(request: HttpRequest):
+    if not _user_is_staff(request.user):
+        return None
+    return _list_snapshot(request, Venue)["last_modified"]
+
+
+def _bookings_list_etag(request: HttpRequest) -> str | None:
+    if not _user_is_staff(request.user):
+        return None
+    snapshot = _list_snapshot(request, Booking)
+    # Venue edits and user detail changes (names, email) reach the payload
+    # through its joins.
+    return _list_etag(
+        request,
+        "bookings",
+        snapshot["count"],
+        snapshot["last_modified"],
+        data_version(BOOKING_DATA),
+        data_version(VENUE_CATALOGUE),
+        data_version(USER_DIRECTORY),
+    )
+
+
+def _bookings_list_last_modified(request: HttpRequest):
+    if not _user_is_staff(request.user):
+        return None
+    return _list_snapshot(request, Booking)["last_modified"]
+
+
+def _users_search_etag(request: HttpRequest) -> str | None:
+    if not _user_is_staff(request.user):
+        return None
+    return _list_etag(
+        request,
+        "users",
+        get_user_model().objects.count(),
+        data_version(USER_DIRECTORY),
+    )
+
+
 @login_required
 def logout_view(request: HttpRequest) -> HttpResponse:
     logout(request)
@@ -290,22 +479,25 @@ def _parse_positive_int(value: str | None, default: int, *, max_value: int | Non
     return parsed
 
 
+def _parse_iso_date(value: str | None) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+
 def _apply_venue_search(queryset, query: str):
     if not query:
         return queryset
     trimmed = query.strip()
     if not trimmed:
         return queryset
-    queryset = queryset.annotate(price_text=Cast("price", output_field=CharField()))
-    filters = (
-        Q(title__icontains=trimmed)
-        | Q(type__icontains=trimmed)
-        | Q(location__icontains=trimmed)
-        | Q(description__icontains=trimmed)
-        | Q(facilities__icontains=trimmed)
-        | Q(price_text__icontains=trimmed)
-    )
-    return queryset.filter(filters)
+    if venue_fts_available():
+        return filter_venues(queryset, trimmed)
+    # ``search_blob`` holds the same fields, lower-cased (see ``build_search_blob``).
+    return queryset.filter(search_blob__icontains=trimmed.lower())
 
 
 def _apply_booking_search(queryset, query: str):
@@ -314,32 +506,7 @@ def _apply_booking_search(queryset, query: str):
     trimmed = query.strip()
     if not trimmed:
         return queryset
-
-    queryset = queryset.annotate(
-        start_date_text=Cast("date__start_date", output_field=CharField()),
-        end_date_text=Cast("date__end_date", output_field=CharField()),
-        user_full_name=Concat(
-            Coalesce("user__first_name", Value("")),
-            Value(" "),
-            Coalesce("user__last_name", Value("")),
-        ),
-        paid_text=Case(
-            When(has_been_paid=True, then=Value("paid")),
-            default=Value("pending"),
-            output_field=CharField(),
-        ),
-    )
-
-    filters = (
-        Q(user__username__icontains=trimmed)
-        | Q(user_full_name__icontains=trimmed)
-        | Q(venue__title__icontains=trimmed)
-        | Q(notes__icontains=trimmed)
-        | Q(start_date_text__icontains=trimmed)
-        | Q(end_date_text__icontains=trimmed)
-        | Q(paid_text__icontains=trimmed)
-    )
-    return queryset.filter(filters)
+    return filter_bookings(queryset, trimmed)
 
 
 def _build_paginated_payload(
@@ -369,6 +536,178 @@ def _build_paginated_payload(
     return data, meta
 
 
+def _parse_flag(value: str | None) -> bool:
+    return (value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _encode_cursor(item, ordering: tuple[str, ...], direction: str) -> str:
+    values = []
+    for field in ordering:
+        value = getattr(item, field.lstrip("-"))
+        values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+    payload = json.dumps({"v": values, "d": direction}, separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+class InvalidCursor(Exception):
+    """Raised for a ``cursor`` parameter that no list response handed out."""
+
+
+def _cursor_value(field, value):
+    # JSON only yields scalars we wrote, so reject nulls and containers
+    # before ``to_python`` turns them into something filterable.
+    if value is None or isinstance(value, (bool, dict, list)):
+        raise ValueError("Unexpected cursor value.")
+    value = field.to_python(value)
+    field.run_validators(value)
+    return value
+
+
+def _decode_cursor(raw: str | None, ordering: tuple[str, ...], model):
+    """Return ``(values, direction)`` for ``raw``, or ``None`` without a cursor.
+
+    Values are coerced to their ordering fields' types (dates, numbers), so
+    a tampered cursor raises ``InvalidCursor`` instead of reaching the query.
+    """
+
+    if not raw:
+        return None
+    try:
+        padded = raw + "=" * (-len(raw) % 4)
+        payload = json.loads(urlsafe_b64decode(padded.encode()).decode())
+        values, direction = payload["v"], payload["d"]
+        if direction not in {"next", "prev"} or not isinstance(values, list):
+            raise ValueError("Malformed cursor.")
+        if len(values) != len(ordering):
+            raise ValueError("Cursor does not match the ordering.")
+        values = [
+            _cursor_value(model._meta.get_field(field.lstrip("-")), value)
+            for field, value in zip(ordering, values)
+        ]
+    except (ValueError, KeyError, TypeError, ValidationError) as exc:
+        raise InvalidCursor from exc
+    return values, direction
+
+
+def _invalid_cursor_response() -> JsonResponse:
+    return JsonResponse(
+        {"success": False, "errors": ["The cursor is invalid or has expired."]},
+        status=400,
+    )
+
+
+def _keyset_filter(ordering: tuple[str, ...], values: list, *, forward: bool) -> Q:
+    """Rows strictly after ``values`` in ``ordering`` (or before, going back)."""
+
+    condition = Q()
+    prefix = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        descending = field.startswith("-")
+        lookup = "gt" if forward != descending else "lt"
+        condition |= prefix & Q(**{f"{name}__{lookup}": value})
+        prefix &= Q(**{name: value})
+    return condition
+
+
+def _build_keyset_payload(
+    queryset,
+    *,
+    ordering: tuple[str, ...],
+    cursor: str | None,
+    page_size: int,
+    serializer,
+    query: str,
+    include_total: bool = False,
+    extra_meta: dict[str, object] | None = None,
+):
+    """Paginate ``queryset`` with opaque keyset cursors.
+
+    Each page is a single indexed ``WHERE (key) > cursor ORDER BY key LIMIT n``
+    query, so deep pages cost the same as the first one. The exact total
+    requires a separate ``COUNT(*)`` and is only computed on request.
+    Raises ``InvalidCursor`` for a cursor this function did not issue.
+    """
+
+    decoded = _decode_cursor(cursor, ordering, queryset.model)
+    forward = decoded is None or decoded[1] == "next"
+    if forward:
+        ordered = queryset.order_by(*ordering)
+    else:
+        ordered = queryset.order_by(
+            *(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+        )
+    if decoded is not None:
+        ordered = ordered.filter(_keyset_filter(ordering, decoded[0], forward=forward))
+
+    items = list(ordered[: page_size + 1])
+    has_more = len(items) > page_size
+    items = items[:page_size]
+    if forward:
+        has_next, has_previous = has_more, decoded is not None
+    else:
+        items.reverse()
+        has_next, has_previous = True, has_more
+
+    total_items = queryset.count() if include_total else None
+    meta: dict[str, object] = {
+        "page_size": page_size,
+        "has_next": has_next and bool(items),
+        "has_previous": has_previous and bool(items),
+        "next_cursor": (
+            _encode_cursor(items[-1], ordering, "next") if has_next and items else None
+        ),
+        "previous_cursor": (
+            _encode_cursor(items[0], ordering, "prev")
+            if has_previous and items
+            else None
+        ),
+        "total_items": total_items,
+        "query": query.strip(),
+    }
+    if total_items is not None:
+        meta["total_pages"] = max(1, -(-total_items // page_size))
+    if extra_meta:
+        meta.update(extra_meta)
+    return [serializer(item) for item in items], meta
+
+
+def _paginate_list_request(
+    request: HttpRequest,
+    queryset,
+    *,
+    ordering: tuple[str, ...],
+    serializer,
+    query: str,
+    extra_meta: dict[str, object] | None = None,
+):
+    page_size = _parse_positive_int(
+        request.GET.get("page_size"),
+        DEFAULT_PAGE_SIZE,
+        max_value=MAX_PAGE_SIZE,
+    )
+    if "page" in request.GET and "cursor" not in request.GET:
+        # Offset pagination is kept for existing ``?page=`` clients.
+        return _build_paginated_payload(
+            queryset,
+            page=_parse_positive_int(request.GET.get("page"), 1),
+            page_size=page_size,
+            serializer=serializer,
+            query=query,
+            extra_meta=extra_meta,
+        )
+    return _build_keyset_payload(
+        queryset,
+        ordering=ordering,
+        cursor=request.GET.get("cursor"),
+        page_size=page_size,
+        serializer=serializer,
+        query=query,
+        include_total=_parse_flag(request.GET.get("include_total")),
+        extra_meta=extra_meta,
+    )
+
+
 @require_POST
 def login_api(request: HttpRequest) -> JsonResponse:
     identifier = request.POST.get("email", "").strip()
@@ -420,30 +759,34 @@ def admin_panel(request: HttpRequest) -> HttpResponse:
     if forbidden:
         return forbidden
 
-    ensure_sample_data()
+    ensure_sample_data_seeded()
 
     User = get_user_model()
     page_size = DEFAULT_PAGE_SIZE
     venues_queryset = _base_venue_queryset()
     venues_total = Venue.objects.count()
     bookings_queryset = Booking.objects.select_related("venue", "date", "user")
-    analytics = _build_booking_analytics()
+    analytics = _cached_booking_analytics()
 
-    venues_data, venues_meta = _build_paginated_payload(
+    venues_data, venues_meta = _build_keyset_payload(
         venues_queryset,
-        page=1,
+        ordering=VENUE_LIST_ORDERING,
+        cursor=None,
         page_size=page_size,
         serializer=_serialize_venue,
         query="",
+        include_total=True,
         extra_meta={"total_available": venues_total},
     )
-    bookings_data, bookings_meta = _build_paginated_payload(
+    bookings_data, bookings_meta = _build_keyset_payload(
         bookings_queryset,
-        page=1,
+        ordering=BOOKING_LIST_ORDERING,
+        cursor=None,
         page_size=page_size,
         serializer=_serialize_booking,
         query="",
-        extra_meta={"has_users": User.objects.exists(), "analytics": analytics},
+        include_total=True,
+        extra_meta={"has_users": User.objects.exists()},
     )
     context = {
         "venues": {"data": venues_data, "meta": venues_meta},
@@ -459,174 +802,261 @@ def _json_errors(form) -> list[str]:
 
 
 @login_required
+@reads_from_replica
 @require_GET
-def venues_list_api(request: HttpRequest) -> JsonResponse:
-    forbidden = _forbid_if_not_staff(request)
+@cache_control(private=True, no_cache=True)
+@async_condition(
+    etag_func=_venues_list_etag, last_modified_func=_venues_list_last_modified
+)
+async def venues_list_api(request: HttpRequest) -> JsonResponse:
+    forbidden = await _aforbid_if_not_staff(request)
     if forbidden:
         return forbidden
 
     query = request.GET.get("q", "")
-    page = _parse_positive_int(request.GET.get("page"), 1)
-    page_size = _parse_positive_int(
-        request.GET.get("page_size"),
-        DEFAULT_PAGE_SIZE,
-        max_value=MAX_PAGE_SIZE,
-    )
 
-    total_available = Venue.objects.count()
-    venues_queryset = _base_venue_queryset()
-    venues_queryset = _apply_venue_search(venues_queryset, query)
-    data, meta = _build_paginated_payload(
-        venues_queryset,
-        page=page,
-        page_size=page_size,
-        serializer=_serialize_venue,
-        query=query,
-        extra_meta={"total_available": total_available},
-    )
+    try:
+        (data, meta), total_available = await gather_reads(
+            lambda: _paginate_list_request(
+                request,
+                _apply_venue_search(_base_venue_queryset(), query),
+                ordering=VENUE_LIST_ORDERING,
+                serializer=_serialize_venue,
+                query=query,
+            ),
+            Venue.objects.count,
+        )
+    except InvalidCursor:
+        return _invalid_cursor_response()
+    meta["total_available"] = total_available
     return JsonResponse({"success": True, "data": data, "meta": meta})
 
 
-@login_required
-def venues_page(request: HttpRequest) -> HttpResponse:
-    ensure_sample_data()
-
-    venues_queryset = _base_venue_queryset().order_by("title")
-    venues = [_serialize_venue(venue) for venue in venues_queryset]
-    for venue in venues:
-        facility_list = _normalize_facilities(venue.get("facilities"))
-
-        facility_terms = " ".join(facility_list)
-
-        pieces = [
-            venue.get("title"),
-            venue.get("type"),
-            venue.get("location"),
-            venue.get("description"),
-            facility_terms,
-        ]
-        price = venue.get("price")
-        if price is not None:
-            pieces.append(str(price))
-        rating = venue.get("average_rating")
-        if rating is not None:
-            pieces.append(f"{rating:.1f}")
-        venue["search_blob"] = " ".join(
-            str(piece).strip() for piece in pieces if piece
-        ).lower()
+def _page_url(view_name: str, filter_params: dict[str, str], page: int) -> str:
+    params = {**filter_params}
+    if page > 1:
+        params["page"] = page
+    url = reverse(view_name)
+    return f"{url}?{urlencode(params)}" if params else url
 
-        venue["facility_list"] = facility_list
 
-    context = {"venues": venues}
-    template = (
-        "main/partials/venues_fragment.html"
-        if _is_ajax(request)
-        else "main/venues.html"
-    )
-    return render(request, template, context)
+def _venues_page_rows(query: str, venue_type: str, page_number: str | None):
+    venues_queryset = _base_venue_queryset()
+    if venue_type:
+        venues_queryset = venues_queryset.filter(type=venue_type)
+
+    if query and venue_fts_available():
+        # Paginate ranked ids, then load only the page being shown.
+        page_obj = Paginator(
+            RankedVenueIds(query, venue_type=venue_type), VENUES_PAGE_SIZE
+        ).get_page(page_number)
+        positions = {venue_id: index for index, venue_id in enumerate(page_obj)}
+        page_venues = sorted(
+            venues_queryset.filter(pk__in=list(positions)),
+            key=lambda venue: positions[venue.pk],
+        )
+    else:
+        if query:
+            venues_queryset = _apply_venue_search(venues_queryset, query)
+        page_obj = Paginator(
+            venues_queryset.order_by(*VENUE_LIST_ORDERING), VENUES_PAGE_SIZE
+        ).get_page(page_number)
+        page_venues = page_obj.object_list
+
+    venues = []
+    for venue in page_venues:
+        data = _serialize_venue(venue)
+        data["facility_list"] = venue.facility_list
+        venues.append(data)
+    return page_obj, venues
+
+
+async def _build_venues_context(
+    query: str, venue_type: str, page_number: str | None
+) -> dict[str, object]:
+    filter_params = {
+        key: value for key, value in (("q", query), ("type", venue_type)) if value
+    }
+    reads = [lambda: _venues_page_rows(query, venue_type, page_number)]
+    if filter_params:
+        reads.append(Venue.objects.count)
+    (page_obj, venues), *catalogue_size = await gather_reads(*reads)
+    total_matches = page_obj.paginator.count
+    total_available = catalogue_size[0] if catalogue_size else total_matches
+    return {
+        "venues": venues,
+        "query": query,
+        "venue_type": venue_type,
+        "venue_types": Venue.VenueType.choices,
+        "page_obj": page_obj,
+        "total_matches": total_matches,
+        "total_available": total_available,
+        "is_filtering": bool(filter_params),
+        "previous_page_url": (
+            _page_url(
+                "main:venues_page", filter_params, page_obj.previous_page_number()
+            )
+            if page_obj.has_previous()
+            else ""
+        ),
+        "next_page_url": (
+            _page_url("main:venues_page", filter_params, page_obj.next_page_number())
+            if page_obj.has_next()
+            else ""
+        ),
+    }
 
 
 @login_required
-def bookings_page(request: HttpRequest) -> HttpResponse:
-    if _user_is_staff(request.user):
-        return redirect("main:admin_panel")
+@reads_from_replica
+async def venues_page(request: HttpRequest) -> HttpResponse:
+    await resolve_user(request)
+    await aensure_sample_data_seeded()
 
-    ensure_sample_data()
+    query = request.GET.get("q", "").strip()
+    venue_type = request.GET.get("type", "").strip()
+    if venue_type not in Venue.VenueType.values:
+        venue_type = ""
+    page_number = request.GET.get("page")
+
+    key = fragment_key(
+        "venues",
+        *await adata_versions(VENUE_CATALOGUE, VENUE_RATINGS),
+        query,
+        venue_type,
+        page_number,
+    )
+    fragment = await acached_fragment(
+        request,
+        key,
+        "main/partials/venues_fragment.html",
+        lambda: _build_venues_context(query, venue_type, page_number),
+    )
+    return await _render_fragment_page(
+        request, "main/venues.html", personalize_fragment(request, fragment["html"])
+    )
 
-    bookings_queryset = (
-        Booking.objects.select_related("venue", "date")
-        .filter(user=request.user)
-        .order_by("-date__start_date", "-created_at")
+
+def _decorate_booking_row(booking: Booking, today: date) -> None:
+    duration_days = booking.duration_days
+    booking.duration_label = "1 day" if duration_days == 1 else f"{duration_days} days"
+    booking.is_upcoming = booking.date.start_date >= today
+    booking.status_label = (
+        "Paid in full" if booking.has_been_paid else "Awaiting payment"
     )
-    bookings = list(bookings_queryset)
+    booking.status_key = "paid" if booking.has_been_paid else "pending"
 
-    today = timezone.localdate()
-    total_spend = 0
-    upcoming_count = 0
-    paid_count = 0
 
-    for booking in bookings:
-        start_date = booking.date.start_date
-        end_date = booking.date.end_date
-        duration_days = max((end_date - start_date).days + 1, 1)
-        booking.duration_days = duration_days
-        booking.duration_label = (
-            "1 day" if duration_days == 1 else f"{duration_days} days"
-        )
-        booking.total_value = (booking.venue.price or 0) * duration_days
-        booking.is_upcoming = start_date >= today
-        booking.search_blob = " ".join(
-            str(piece).strip()
-            for piece in [
-                booking.venue.title,
-                booking.venue.location,
-                booking.notes,
-                start_date.isoformat(),
-                end_date.isoformat(),
-                "paid" if booking.has_been_paid else "pending",
+async def _build_bookings_context(
+    user, today: date, query: str, page: int
+) -> dict[str, object]:
+    user_bookings = Booking.objects.filter(user=user)
+    paid = Q(has_been_paid=True)
+    listed_bookings = user_bookings.select_related("venue", "date").annotate(
+        duration_days=booking_duration_days(),
+        total_value=F("venue__price") * booking_duration_days(),
+    )
+    offset = (page - 1) * BOOKINGS_PAGE_SIZE
+
+    def matching_bookings():
+        return _apply_booking_search(listed_bookings, query)
+
+    reads = [
+        lambda: user_bookings.aggregate(
+            total=Count("id"),
+            upcoming=Count("id", filter=Q(start_date__gte=today)),
+            paid=Count("id", filter=paid),
+            lifetime_spend=Coalesce(
+                Sum(F("venue__price") * booking_duration_days(), filter=paid), 0
+            ),
+        ),
+        # Ties on the start date go by id, which the user/start_date index
+        # already yields, so this stops at the first index entry.
+        lambda: listed_bookings.filter(start_date__gte=today)
+        .order_by("start_date", "id")
+        .first(),
+        # One row past the page tells us whether to offer "load more" without a COUNT.
+        lambda: list(
+            matching_bookings().order_by("-date__start_date", "-created_at", "-id")[
+                offset : offset + BOOKINGS_PAGE_SIZE + 1
             ]
-            if piece
-        ).lower()
-        booking.status_label = (
-            "Paid in full" if booking.has_been_paid else "Awaiting payment"
-        )
-        booking.status_key = "paid" if booking.has_been_paid else "pending"
-
-        if booking.has_been_paid:
-            paid_count += 1
-            total_spend += booking.total_value
-        if start_date >= today:
-            upcoming_count += 1
-
-    next_booking = None
-    if bookings:
-        upcoming_sorted = sorted(
-            (b for b in bookings if b.date.start_date >= today),
-            key=lambda item: (item.date.start_date, item.date.end_date),
-        )
-        next_booking = upcoming_sorted[0] if upcoming_sorted else None
-
-    total_count = len(bookings)
-    stats = {
-        "total": total_count,
-        "upcoming": upcoming_count,
-        "paid": paid_count,
-        "pending": total_count - paid_count,
-        "lifetime_spend": total_spend,
-    }
+        ),
+    ]
+    if query:
+        reads.append(lambda: matching_bookings().count())
+    stats, next_booking, bookings, *matched_count = await gather_reads(*reads)
+
+    stats["pending"] = stats["total"] - stats["paid"]
+    if next_booking is not None:
+        _decorate_booking_row(next_booking, today)
+    has_more = len(bookings) > BOOKINGS_PAGE_SIZE
+    bookings = bookings[:BOOKINGS_PAGE_SIZE]
+    for booking in bookings:
+        _decorate_booking_row(booking, today)
 
-    context = {
+    filter_params = {"q": query} if query else {}
+    return {
         "bookings": bookings,
         "stats": stats,
         "next_booking": next_booking,
+        "query": query,
+        "matched_count": matched_count[0] if query else stats["total"],
+        "next_page_url": (
+            _page_url("main:bookings_page", filter_params, page + 1) if has_more else ""
+        ),
     }
 
-    template = (
-        "main/partials/bookings_fragment.html"
-        if _is_ajax(request)
-        else "main/bookings.html"
-    )
-    return render(request, template, context)
-
 
 @login_required
-@ensure_csrf_cookie
-def venue_detail_page(request: HttpRequest, pk: int) -> HttpResponse:
-    ensure_sample_data()
+@reads_from_replica
+async def bookings_page(request: HttpRequest) -> HttpResponse:
+    user = await resolve_user(request)
+    if _user_is_staff(user):
+        return redirect("main:admin_panel")
 
-    venue_obj = get_object_or_404(_base_venue_queryset(), pk=pk)
-    venue_data = _serialize_venue(venue_obj)
-    venue_data["facility_list"] = _normalize_facilities(venue_data.get("facilities"))
+    await aensure_sample_data_seeded()
 
-    comments_queryset = (
-        Comment.objects.filter(venue_links__venue=venue_obj)
+    today = timezone.localdate()
+    query = request.GET.get("q", "").strip()
+    page = _parse_positive_int(request.GET.get("page"), default=1)
+
+    key = fragment_key(
+        "bookings",
+        user.pk,
+        *await adata_versions(user_scope(USER_BOOKINGS, user.pk), VENUE_CATALOGUE),
+        today.isoformat(),
+        query,
+        page,
+    )
+    fragment = await acached_fragment(
+        request,
+        key,
+        "main/partials/bookings_fragment.html",
+        lambda: _build_bookings_context(user, today, query, page),
+    )
+    return await _render_fragment_page(
+        request, "main/bookings.html", personalize_fragment(request, fragment["html"])
+    )
+
+
+def _venue_detail_comments(pk: int) -> list[Comment]:
+    return list(
+        Comment.objects.filter(venue_links__venue_id=pk)
         .select_related("user")
         .order_by("-date", "-id")
     )
-    comments_payload = [
-        _serialize_comment(comment, request_user=request.user)
-        for comment in comments_queryset
-    ]
+
+
+async def _build_venue_detail_context(pk: int) -> dict[str, object]:
+    venue_obj, comments = await gather_reads(
+        lambda: get_object_or_404(_base_venue_queryset(), pk=pk),
+        lambda: _venue_detail_comments(pk),
+    )
+    venue_data = _serialize_venue(venue_obj)
+    venue_data["facility_list"] = venue_obj.facility_list
+
+    # Viewer-specific permissions are added when the fragment is served.
+    comments_payload = [_serialize_comment(comment) for comment in comments]
 
     comment_update_template = reverse(
         "main:venue_comments_update_api",
@@ -636,25 +1066,50 @@ def venue_detail_page(request: HttpRequest, pk: int) -> HttpResponse:
         "main:venue_comments_delete_api",
         args=[venue_obj.id, 0],
     )
-    comments_script_id = f"venue-comments-{venue_obj.id}"
-    comments_json_script = json_script(comments_payload, comments_script_id)
 
-    context = {
+    return {
         "venue": venue_data,
+        "page_title": venue_obj.title,
         "comments_payload": comments_payload,
-        "comment_objects": comments_queryset,
+        "comment_objects": comments,
         "comment_update_template": comment_update_template,
         "comment_delete_template": comment_delete_template,
-        "comments_script_id": comments_script_id,
-        "comments_json_script": comments_json_script,
+        "comments_script_id": f"venue-comments-{venue_obj.id}",
+        "comments_json_script": fragment_slot("comments"),
     }
 
-    template = (
-        "main/partials/venue_detail_fragment.html"
-        if _is_ajax(request)
-        else "main/venue_detail.html"
+
+@login_required
+@reads_from_replica
+@ensure_csrf_cookie
+async def venue_detail_page(request: HttpRequest, pk: int) -> HttpResponse:
+    user = await resolve_user(request)
+    await aensure_sample_data_seeded()
+
+    key = fragment_key(
+        "venue-detail",
+        pk,
+        *await adata_versions(VENUE_CATALOGUE, VENUE_RATINGS),
+    )
+    fragment = await acached_fragment(
+        request,
+        key,
+        "main/partials/venue_detail_fragment.html",
+        lambda: _build_venue_detail_context(pk),
+        keep=("page_title", "comments_payload", "comments_script_id"),
+    )
+    comments_payload = [
+        _with_comment_permissions(comment, user)
+        for comment in fragment["comments_payload"]
+    ]
+    html = personalize_fragment(
+        request,
+        fragment["html"],
+        {"comments": json_script(comments_payload, fragment["comments_script_id"])},
+    )
+    return await _render_fragment_page(
+        request, "main/venue_detail.html", html, page_title=fragment["page_title"]
     )
-    return render(request, template, context)
 
 
 @login_required
@@ -665,10 +1120,11 @@ def venue_comments_create_api(request: HttpRequest, pk: int) -> JsonResponse:
     if not form.is_valid():
         return JsonResponse({"success": False, "errors": _json_errors(form)}, status=400)
 
-    comment = form.save(commit=False)
-    comment.user = request.user
-    comment.save()
-    CommentVenue.objects.create(comment=comment, venue=venue)
+    with transaction.atomic():
+        comment = form.save(commit=False)
+        comment.user = request.user
+        comment.save()
+        CommentVenue.objects.create(comment=comment, venue=venue)
 
     serialized = _serialize_comment(comment, request_user=request.user)
     stats = _comment_stats_for_venue(venue)
@@ -697,7 +1153,8 @@ def venue_comments_update_api(request: HttpRequest, pk: int, comment_pk: int) ->
     if not form.is_valid():
         return JsonResponse({"success": False, "errors": _json_errors(form)}, status=400)
 
-    updated_comment = form.save()
+    with transaction.atomic():
+        updated_comment = form.save()
     serialized = _serialize_comment(updated_comment, request_user=request.user)
     stats = _comment_stats_for_venue(venue)
     return JsonResponse({"success": True, "data": serialized, "meta": stats})
@@ -734,20 +1191,77 @@ def venue_booking_create_api(request: HttpRequest, pk: int) -> JsonResponse:
     if not form.is_valid():
         return JsonResponse({"success": False, "errors": _json_errors(form)}, status=400)
 
-    booking_date = BookingDate.objects.create(
-        start_date=form.cleaned_data["start_date"],
-        end_date=form.cleaned_data["end_date"],
-    )
-    booking = Booking.objects.create(
-        user=request.user,
-        venue=venue,
-        date=booking_date,
-        notes=form.cleaned_data.get("notes") or "",
-    )
+    start_date = form.cleaned_data["start_date"]
+    end_date = form.cleaned_data["end_date"]
+    try:
+        booking = create_booking(
+            user=request.user,
+            venue=venue,
+            start_date=start_date,
+            end_date=end_date,
+            notes=form.cleaned_data.get("notes") or "",
+        )
+    except BookingConflict as exc:
+        return JsonResponse({"success": False, "errors": [str(exc)]}, status=409)
 
     return JsonResponse({"success": True, "data": _serialize_booking(booking)})
 
 
+@login_required
+@require_GET
+def venue_availability_api(request: HttpRequest, pk: int) -> JsonResponse:
+    venue = get_object_or_404(Venue.objects.only("id"), pk=pk)
+
+    raw_from = request.GET.get("from")
+    raw_to = request.GET.get("to")
+    start_date = _parse_iso_date(raw_from) if raw_from else timezone.localdate()
+    if start_date is None:
+        return JsonResponse(
+            {"success": False, "errors": ["'from' must be formatted as YYYY-MM-DD."]},
+            status=400,
+        )
+    end_date = (
+        _parse_iso_date(raw_to)
+        if raw_to
+        else start_date + timedelta(days=DEFAULT_CALENDAR_DAYS - 1)
+    )
+    if end_date is None:
+        return JsonResponse(
+            {"success": False, "errors": ["'to' must be formatted as YYYY-MM-DD."]},
+            status=400,
+        )
+    if end_date < start_date:
+        return JsonResponse(
+            {"success": False, "errors": ["'to' cannot be before 'from'."]},
+            status=400,
+        )
+    if (end_date - start_date).days + 1 > MAX_CALENDAR_DAYS:
+        return JsonResponse(
+            {
+                "success": False,
+                "errors": [f"Request at most {MAX_CALENDAR_DAYS} days at a time."],
+            },
+            status=400,
+        )
+
+    bitmap = occupancy_bitmap(venue.id, start_date, end_date)
+    ranges = [
+        [range_start.isoformat(), range_end.isoformat()]
+        for range_start, range_end in occupied_ranges(start_date, bitmap)
+    ]
+    return JsonResponse(
+        {
+            "success": True,
+            "data": {
+                "from": start_date.isoformat(),
+                "to": end_date.isoformat(),
+                "bitmap": bitmap,
+                "ranges": ranges,
+            },
+        }
+    )
+
+
 @login_required
 @require_POST
 def booking_cancel_api(request: HttpRequest, pk: int) -> JsonResponse:
@@ -765,8 +1279,8 @@ def booking_cancel_api(request: HttpRequest, pk: int) -> JsonResponse:
             status=400,
         )
 
+    # Deleting the date cascades to the booking (and its slot) in one pass.
     booking.date.delete()
-    booking.delete()
 
     return JsonResponse({"success": True})
 
@@ -794,11 +1308,15 @@ def venues_update_api(request: HttpRequest, pk: int) -> JsonResponse:
         return forbidden
 
     venue = get_object_or_404(Venue, pk=pk)
+    previous_price = venue.price
     form = VenueForm(request.POST, request.FILES, instance=venue)
     if not form.is_valid():
         return JsonResponse({"success": False, "errors": _json_errors(form)}, status=400)
 
-    venue = form.save()
+    with transaction.atomic():
+        venue = form.save()
+        if venue.price != previous_price:
+            reprice_venue_sales(venue.id, venue.price)
     return JsonResponse({"success": True, "data": _serialize_venue(venue)})
 
 
@@ -816,34 +1334,80 @@ def venues_delete_api(request: HttpRequest, pk: int) -> JsonResponse:
 
 @login_required
 @require_GET
-def bookings_list_api(request: HttpRequest) -> JsonResponse:
-    forbidden = _forbid_if_not_staff(request)
+@cache_control(private=True, no_cache=True)
+@async_condition(
+    etag_func=_bookings_list_etag, last_modified_func=_bookings_list_last_modified
+)
+async def bookings_list_api(request: HttpRequest) -> JsonResponse:
+    forbidden = await _aforbid_if_not_staff(request)
     if forbidden:
         return forbidden
 
     query = request.GET.get("q", "")
-    page = _parse_positive_int(request.GET.get("page"), 1)
-    page_size = _parse_positive_int(
-        request.GET.get("page_size"),
-        DEFAULT_PAGE_SIZE,
-        max_value=MAX_PAGE_SIZE,
-    )
 
-    bookings_queryset = Booking.objects.select_related("venue", "date", "user")
-    bookings_queryset = _apply_booking_search(bookings_queryset, query)
-    User = get_user_model()
-    analytics = _build_booking_analytics()
-    data, meta = _build_paginated_payload(
-        bookings_queryset,
-        page=page,
-        page_size=page_size,
-        serializer=_serialize_booking,
-        query=query,
-        extra_meta={"has_users": User.objects.exists(), "analytics": analytics},
-    )
+    try:
+        (data, meta), has_users = await gather_reads(
+            lambda: _paginate_list_request(
+                request,
+                _apply_booking_search(
+                    Booking.objects.select_related("venue", "date", "user"), query
+                ),
+                ordering=BOOKING_LIST_ORDERING,
+                serializer=_serialize_booking,
+                query=query,
+            ),
+            get_user_model().objects.exists,
+        )
+    except InvalidCursor:
+        return _invalid_cursor_response()
+    meta["has_users"] = has_users
     return JsonResponse({"success": True, "data": data, "meta": meta})
 
 
+@login_required
+@require_GET
+def bookings_export_api(request: HttpRequest) -> HttpResponse:
+    forbidden = _forbid_if_not_staff(request)
+    if forbidden:
+        return forbidden
+
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse(
+            {
+                "success": False,
+                "errors": [f"Choose one of: {', '.join(EXPORT_FORMATS)}."],
+            },
+            status=400,
+        )
+
+    # Under ASGI a sync iterator would be read whole before streaming.
+    iter_export = (
+        aiter_booking_export
+        if isinstance(request, ASGIRequest)
+        else iter_booking_export
+    )
+    response = StreamingHttpResponse(
+        iter_export(export_format, request.GET.get("q", "")),
+        content_type=f"{EXPORT_FORMATS[export_format]}; charset=utf-8",
+    )
+    filename = f"bookings-{timezone.localdate():%Y%m%d}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+@login_required
+@require_GET
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_booking_analytics_etag)
+def bookings_analytics_api(request: HttpRequest) -> JsonResponse:
+    forbidden = _forbid_if_not_staff(request)
+    if forbidden:
+        return forbidden
+
+    return JsonResponse({"success": True, "data": _cached_booking_analytics()})
+
+
 @login_required
 @require_POST
 def bookings_create_api(request: HttpRequest) -> JsonResponse:
@@ -855,10 +1419,60 @@ def bookings_create_api(request: HttpRequest) -> JsonResponse:
     if not form.is_valid():
         return JsonResponse({"success": False, "errors": _json_errors(form)}, status=400)
 
-    booking = form.save()
+    try:
+        booking = form.save()
+    except BookingConflict as exc:
+        return JsonResponse({"success": False, "errors": [str(exc)]}, status=409)
     return JsonResponse({"success": True, "data": _serialize_booking(booking)})
 
 
+@login_required
+@require_POST
+def bookings_batch_create_api(request: HttpRequest) -> JsonResponse:
+    forbidden = _forbid_if_not_staff(request)
+    if forbidden:
+        return forbidden
+
+    try:
+        items = json.loads(request.body or b"null")
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        items = None
+    if not isinstance(items, list) or not items:
+        return JsonResponse(
+            {
+                "success": False,
+                "errors": ["Send the bookings as a non-empty JSON array."],
+            },
+            status=400,
+        )
+    if len(items) > MAX_BATCH_SIZE:
+        return JsonResponse(
+            {
+                "success": False,
+                "errors": [f"Send at most {MAX_BATCH_SIZE} bookings per batch."],
+            },
+            status=400,
+        )
+
+    try:
+        bookings = create_booking_batch(items)
+    except BookingBatchError as exc:
+        return JsonResponse(
+            {
+                "success": False,
+                "errors": [str(exc)],
+                "item_errors": [
+                    {"index": index, "errors": messages}
+                    for index, messages in exc.item_errors.items()
+                ],
+            },
+            status=409 if exc.conflicts_only else 400,
+        )
+    return JsonResponse(
+        {"success": True, "data": [_serialize_booking(booking) for booking in bookings]}
+    )
+
+
 @login_required
 @require_POST
 def bookings_update_api(request: HttpRequest, pk: int) -> JsonResponse:
@@ -871,7 +1485,10 @@ def bookings_update_api(request: HttpRequest, pk: int) -> JsonResponse:
     if not form.is_valid():
         return JsonResponse({"success": False, "errors": _json_errors(form)}, status=400)
 
-    booking = form.save()
+    try:
+        booking = form.save()
+    except BookingConflict as exc:
+        return JsonResponse({"success": False, "errors": [str(exc)]}, status=409)
     return JsonResponse({"success": True, "data": _serialize_booking(booking)})
 
 
@@ -883,39 +1500,50 @@ def bookings_delete_api(request: HttpRequest, pk: int) -> JsonResponse:
         return forbidden
 
     booking = get_object_or_404(Booking, pk=pk)
+    # Deleting the date cascades to the booking (and its slot) in one pass.
     booking.date.delete()
-    booking.delete()
     return JsonResponse({"success": True})
 
 
+def _search_users(query: str) -> list[dict[str, object] | None]:
+    if not query:
+        return []
+    users = user_index.search_users(query, limit=10)
+    if users is None:
+        User = get_user_model()
+        users = User.objects.filter(
+            Q(username__icontains=query)
+            | Q(email__icontains=query)
+            | Q(first_name__icontains=query)
+            | Q(last_name__icontains=query)
+        ).order_by("username")[:10]
+    return [_serialize_user(user) for user in users]
+
+
 @login_required
 @require_GET
-def users_search_api(request: HttpRequest) -> JsonResponse:
-    forbidden = _forbid_if_not_staff(request)
+@cache_control(private=True, no_cache=True)
+@async_condition(etag_func=_users_search_etag)
+async def users_search_api(request: HttpRequest) -> JsonResponse:
+    forbidden = await _aforbid_if_not_staff(request)
     if forbidden:
         return forbidden
 
     query = request.GET.get("q", "").strip()
-    User = get_user_model()
 
-    if not query:
-        results = []
+    # Served from the in-memory index when it is warm; the database otherwise.
+    has_users = await sync_to_async(user_index.has_users)()
+    if has_users is None:
+        results, has_users = await gather_reads(
+            lambda: _search_users(query), get_user_model().objects.exists
+        )
     else:
-        results = [
-            _serialize_user(user)
-            for user in User.objects.filter(
-                Q(username__icontains=query)
-                | Q(email__icontains=query)
-                | Q(first_name__icontains=query)
-                | Q(last_name__icontains=query)
-            )
-            .order_by("username")[:10]
-        ]
+        results = await sync_to_async(_search_users)(query)
 
     return JsonResponse(
         {
             "success": True,
             "data": results,
-            "meta": {"has_users": User.objects.exists()},
+            "meta": {"has_users": has_users},
         }
     )
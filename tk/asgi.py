@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tk.settings')
+# Read by tk.settings to turn off persistent database connections.
+os.environ.setdefault('TK_SERVER_INTERFACE', 'asgi')
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -43,10 +44,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'main.db_routing.ReadYourWritesMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -78,9 +81,78 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # A file rather than SQLite's shared in-memory database, so the
+        # concurrency tests in main/tests.py see real locking.
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
+# Production database mode, enabled with TK_DATABASE_MODE=production. WAL lets
+# reads carry on while a write commits, IMMEDIATE transactions make writers
+# queue for the lock at BEGIN instead of failing to upgrade a read lock
+# half-way through, and main.sqlite_backend retries with backoff when that
+# wait runs past busy_timeout. WSGI workers keep connections for ten minutes.
+# Under ASGI (tk/asgi.py sets TK_SERVER_INTERFACE) sync code runs on
+# short-lived threads whose persistent connections would never be closed, so
+# connections are closed after each request there, as Django recommends.
+if os.environ.get('TK_DATABASE_MODE') == 'production':
+    DATABASES['default'].update({
+        'ENGINE': 'main.sqlite_backend',
+        'CONN_MAX_AGE': 0 if os.environ.get('TK_SERVER_INTERFACE') == 'asgi' else 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join([
+                'PRAGMA journal_mode=WAL',
+                # Durable across application crashes; an OS crash can lose
+                # the last transactions but never corrupts the database.
+                'PRAGMA synchronous=NORMAL',
+                'PRAGMA cache_size=-65536',  # 64 MiB page cache per connection
+                'PRAGMA mmap_size=268435456',  # 256 MiB
+                'PRAGMA busy_timeout=5000',
+            ]),
+        },
+    })
+
+# Cache. Version counters (main.cache_versions) and everything keyed by them
+# must be shared by all worker processes, or a write only invalidates the
+# cache of the process that handled it. TK_REDIS_URL selects Redis (needs the
+# redis package). Otherwise production mode uses a file-based cache under
+# TK_CACHE_DIR, shared by the processes on one host. The local-memory default
+# only suits a single process, such as runserver.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+if os.environ.get('TK_REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['TK_REDIS_URL'],
+    }
+elif os.environ.get('TK_DATABASE_MODE') == 'production':
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('TK_CACHE_DIR', str(BASE_DIR / '.django_cache')),
+        # Fragments, calendar months and analytics add up to far more than
+        # the default 300 entries; culling past that would drop live ones.
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    }
+
+# Read replica, enabled with TK_REPLICA_DATABASE=<path to the replica file>.
+# Views marked with main.db_routing.reads_from_replica read from it unless the
+# session wrote recently; all writes go to default. Locally, a copy made with
+# `manage.py sync_replica` stands in for a replicated server.
+DATABASE_ROUTERS = ['main.db_routing.PrimaryReplicaRouter']
+
+if os.environ.get('TK_REPLICA_DATABASE'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ['TK_REPLICA_DATABASE'],
+        'TEST': {'MIRROR': 'default'},
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -117,6 +189,19 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# `collectstatic` minifies the app's JS/CSS, writes content-hashed copies plus
+# gzip and brotli variants; WhiteNoise serves the hashed names with a
+# far-future immutable Cache-Control.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'main.static_storage.MinifiedStaticFilesStorage',
+    },
+}
 
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'